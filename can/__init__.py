@@ -5,10 +5,10 @@ different hardware devices, and a suite of utilities for sending and receiving
 messages on a can bus.
 """
 
-import contextlib
+import importlib
 import logging
 from importlib.metadata import PackageNotFoundError, version
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 __all__ = [
     "VALID_INTERFACES",
@@ -33,7 +33,10 @@ __all__ = [
     "CanTimeoutError",
     "CanutilsLogReader",
     "CanutilsLogWriter",
+    "CycleTimeMonitor",
+    "CyclicModifiers",
     "CyclicSendTaskABC",
+    "LastValueCache",
     "LimitedDurationCyclicSendTaskABC",
     "Listener",
     "LogReader",
@@ -41,12 +44,19 @@ __all__ = [
     "MF4Reader",
     "MF4Writer",
     "Message",
+    "MessageBatch",
+    "MessagePool",
+    "MessageRouter",
     "MessageSync",
     "ModifiableCyclicTaskABC",
     "Notifier",
+    "OverflowPolicy",
+    "OverrunPolicy",
     "Printer",
+    "QueuedListener",
     "RedirectReader",
     "RestartableCyclicTaskABC",
+    "RingBufferedReader",
     "SizedRotatingLogger",
     "SqliteReader",
     "SqliteWriter",
@@ -54,22 +64,28 @@ __all__ = [
     "TRCReader",
     "TRCWriter",
     "ThreadSafeBus",
+    "batch",
     "bit_timing",
     "broadcastmanager",
     "bus",
     "ctypesutil",
+    "cycle_time",
     "detect_available_configs",
     "exceptions",
+    "filters",
     "interface",
     "interfaces",
     "io",
+    "last_value_cache",
     "listener",
     "log",
     "logconvert",
     "logger",
     "message",
+    "modifiers",
     "notifier",
     "player",
+    "router",
     "set_logging_level",
     "thread_safe_bus",
     "typechecking",
@@ -85,6 +101,7 @@ from .broadcastmanager import (
     CyclicSendTaskABC,
     LimitedDurationCyclicSendTaskABC,
     ModifiableCyclicTaskABC,
+    OverrunPolicy,
     RestartableCyclicTaskABC,
 )
 from .bus import BusABC, BusState, CanProtocol
@@ -97,36 +114,120 @@ from .exceptions import (
 )
 from .interface import Bus, detect_available_configs
 from .interfaces import VALID_INTERFACES
-from .io import (
-    ASCReader,
-    ASCWriter,
-    BLFReader,
-    BLFWriter,
-    CanutilsLogReader,
-    CanutilsLogWriter,
-    CSVReader,
-    CSVWriter,
-    Logger,
-    LogReader,
-    MessageSync,
-    MF4Reader,
-    MF4Writer,
-    Printer,
-    SizedRotatingLogger,
-    SqliteReader,
-    SqliteWriter,
-    TRCFileVersion,
-    TRCReader,
-    TRCWriter,
-)
-from .listener import AsyncBufferedReader, BufferedReader, Listener, RedirectReader
-from .message import Message
-from .notifier import Notifier
-from .thread_safe_bus import ThreadSafeBus
+from .message import Message, MessagePool
 from .util import set_logging_level
 
-with contextlib.suppress(PackageNotFoundError):
-    __version__ = version("python-can")
+if TYPE_CHECKING:
+    from . import io, listener, notifier, thread_safe_bus
+    from .batch import MessageBatch
+    from .cycle_time import CycleTimeMonitor
+    from .io import (
+        ASCReader,
+        ASCWriter,
+        BLFReader,
+        BLFWriter,
+        CanutilsLogReader,
+        CanutilsLogWriter,
+        CSVReader,
+        CSVWriter,
+        Logger,
+        LogReader,
+        MessageSync,
+        MF4Reader,
+        MF4Writer,
+        Printer,
+        SizedRotatingLogger,
+        SqliteReader,
+        SqliteWriter,
+        TRCFileVersion,
+        TRCReader,
+        TRCWriter,
+    )
+    from .last_value_cache import LastValueCache
+    from .listener import (
+        AsyncBufferedReader,
+        BufferedReader,
+        Listener,
+        OverflowPolicy,
+        QueuedListener,
+        RedirectReader,
+        RingBufferedReader,
+    )
+    from .modifiers import CyclicModifiers
+    from .notifier import Notifier
+    from .router import MessageRouter
+    from .thread_safe_bus import ThreadSafeBus
+
+    __version__: str
+
+# Names that are only imported on first access, such that "import can" does not
+# load the file formats, the notifier and their dependencies: name => module
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "MessageBatch": "batch",
+    "CycleTimeMonitor": "cycle_time",
+    "LastValueCache": "last_value_cache",
+    "AsyncBufferedReader": "listener",
+    "BufferedReader": "listener",
+    "Listener": "listener",
+    "OverflowPolicy": "listener",
+    "QueuedListener": "listener",
+    "RedirectReader": "listener",
+    "RingBufferedReader": "listener",
+    "CyclicModifiers": "modifiers",
+    "Notifier": "notifier",
+    "MessageRouter": "router",
+    "ThreadSafeBus": "thread_safe_bus",
+    **dict.fromkeys(
+        [
+            "ASCReader",
+            "ASCWriter",
+            "BLFReader",
+            "BLFWriter",
+            "CanutilsLogReader",
+            "CanutilsLogWriter",
+            "CSVReader",
+            "CSVWriter",
+            "Logger",
+            "LogReader",
+            "MessageSync",
+            "MF4Reader",
+            "MF4Writer",
+            "Printer",
+            "SizedRotatingLogger",
+            "SqliteReader",
+            "SqliteWriter",
+            "TRCFileVersion",
+            "TRCReader",
+            "TRCWriter",
+        ],
+        "io",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    elif name == "__version__":
+        try:
+            value = version("python-can")
+        except PackageNotFoundError:
+            raise AttributeError(name) from None
+    elif name in __all__:
+        # a submodule
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # cache the value such that this function is not called again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 log = logging.getLogger("can")
 
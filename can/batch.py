@@ -0,0 +1,235 @@
+"""
+This module contains the implementation of :class:`can.MessageBatch`, a
+columnar container for large amounts of :class:`~can.Message` objects.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Final, Optional, Union, overload
+
+from . import typechecking
+from .message import (
+    FLAG_BITRATE_SWITCH,
+    FLAG_ERROR_FRAME,
+    FLAG_ERROR_STATE_INDICATOR,
+    FLAG_EXTENDED_ID,
+    FLAG_FD,
+    FLAG_REMOTE_FRAME,
+    FLAG_RX,
+    Message,
+)
+
+#: The number of bytes reserved for the payload of every frame in the data pool
+DATA_STRIDE: Final[int] = 64
+
+# the typecode of an unsigned 32 bit integer differs between platforms
+_UINT32: Final[str] = "I" if array("I").itemsize == 4 else "L"
+
+_PADDING: Final = tuple(
+    bytes(DATA_STRIDE - length) for length in range(DATA_STRIDE + 1)
+)
+
+
+class MessageBatch(Sequence[Message]):
+    """A compact, array backed container of CAN frames.
+
+    Every :class:`~can.Message` allocates a separate Python object plus a
+    :class:`bytearray` for its payload. A :class:`~can.MessageBatch` instead
+    stores each attribute in a typed :class:`array.array` column and keeps the
+    payloads in a single data pool with a fixed stride of 64 bytes, which is
+    large enough for CAN FD frames. This reduces the memory footprint of large
+    captures by an order of magnitude.
+
+    :class:`~can.Message` objects are only created when an element is
+    accessed, either by indexing or by iterating over the batch::
+
+        batch = can.MessageBatch(bus_messages)
+        for msg in batch:
+            print(msg)
+
+    Channels are stored as an index into :attr:`channels`, the table of
+    distinct channel values seen so far.
+
+    .. note::
+        Messages returned by the batch are new objects. Modifying them does not
+        alter the contents of the batch.
+    """
+
+    def __init__(self, messages: Optional[Iterable[Message]] = None) -> None:
+        """
+        :param messages:
+            An optional iterable of messages to initialize the batch with.
+        """
+        #: Column of :attr:`can.Message.timestamp` values
+        self.timestamps: array[float] = array("d")
+        #: Column of :attr:`can.Message.arbitration_id` values
+        self.arbitration_ids: array[int] = array(_UINT32)
+        #: Column of flag bitfields, see the ``FLAG_*`` constants of :mod:`can.batch`
+        self.flags: array[int] = array("B")
+        #: Column of :attr:`can.Message.dlc` values
+        self.dlcs: array[int] = array("B")
+        #: Column of payload lengths, which may differ from the DLC for remote frames
+        self.data_lengths: array[int] = array("B")
+        #: Column of indices into :attr:`channels`
+        self.channel_indices: array[int] = array("H")
+        #: The table of distinct channels referenced by :attr:`channel_indices`
+        self.channels: list[Optional[typechecking.Channel]] = []
+        #: The data pool, holding :data:`DATA_STRIDE` bytes per frame
+        self.data: bytearray = bytearray()
+
+        self._channel_lookup: dict[object, int] = {}
+
+        if messages is not None:
+            self.extend(messages)
+
+    @classmethod
+    def from_messages(cls, messages: Iterable[Message]) -> "MessageBatch":
+        """Create a new batch from the given messages.
+
+        :param messages: the messages to store
+        """
+        return cls(messages)
+
+    def _channel_index(self, channel: Optional[typechecking.Channel]) -> int:
+        try:
+            return self._channel_lookup[channel]
+        except KeyError:
+            pass
+        except TypeError:
+            # unhashable channels (e.g. lists) are looked up by equality
+            for index, known in enumerate(self.channels):
+                if known == channel:
+                    return index
+
+        index = len(self.channels)
+        if index > 0xFFFF:
+            raise ValueError("a MessageBatch supports at most 65536 channels")
+        self.channels.append(channel)
+        try:
+            self._channel_lookup[channel] = index
+        except TypeError:
+            pass
+        return index
+
+    def append(self, msg: Message) -> None:
+        """Append a single message to the batch.
+
+        :param msg: the message to store
+
+        :raises ValueError: if the payload is longer than 64 bytes
+        """
+        data_length = len(msg.data)
+        if data_length > DATA_STRIDE:
+            raise ValueError(
+                f"data of length {data_length} does not fit into {DATA_STRIDE} bytes"
+            )
+
+        flags = msg._record_flags()
+
+        self.timestamps.append(msg.timestamp)
+        self.arbitration_ids.append(msg.arbitration_id)
+        self.flags.append(flags)
+        self.dlcs.append(msg.dlc)
+        self.data_lengths.append(data_length)
+        self.channel_indices.append(self._channel_index(msg.channel))
+        self.data += msg.data
+        self.data += _PADDING[data_length]
+
+    def extend(self, messages: Iterable[Message]) -> None:
+        """Append all given messages to the batch.
+
+        :param messages: the messages to store
+        """
+        for msg in messages:
+            self.append(msg)
+
+    def clear(self) -> None:
+        """Remove all messages from the batch."""
+        for column in (
+            self.timestamps,
+            self.arbitration_ids,
+            self.flags,
+            self.dlcs,
+            self.data_lengths,
+            self.channel_indices,
+        ):
+            del column[:]
+        self.channels.clear()
+        self._channel_lookup.clear()
+        self.data.clear()
+
+    def get_data(self, index: int) -> memoryview:
+        """Return a view on the payload of the frame at the given index
+        without creating a :class:`~can.Message`.
+
+        .. note::
+            The batch cannot grow while such a view is alive. Release it or
+            convert it to :class:`bytes` before appending further messages.
+
+        :param index: the index of the frame
+        """
+        if index < 0:
+            index += len(self)
+        start = index * DATA_STRIDE
+        return memoryview(self.data)[start : start + self.data_lengths[index]]
+
+    def _message_at(self, index: int) -> Message:
+        flags = self.flags[index]
+        start = index * DATA_STRIDE
+        return Message(
+            timestamp=self.timestamps[index],
+            arbitration_id=self.arbitration_ids[index],
+            is_extended_id=bool(flags & FLAG_EXTENDED_ID),
+            is_remote_frame=bool(flags & FLAG_REMOTE_FRAME),
+            is_error_frame=bool(flags & FLAG_ERROR_FRAME),
+            channel=self.channels[self.channel_indices[index]],
+            dlc=self.dlcs[index],
+            data=self.data[start : start + self.data_lengths[index]],
+            is_fd=bool(flags & FLAG_FD),
+            is_rx=bool(flags & FLAG_RX),
+            bitrate_switch=bool(flags & FLAG_BITRATE_SWITCH),
+            error_state_indicator=bool(flags & FLAG_ERROR_STATE_INDICATOR),
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> Message: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "MessageBatch": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Message, "MessageBatch"]:
+        if isinstance(index, slice):
+            return MessageBatch(
+                self._message_at(i) for i in range(*index.indices(len(self)))
+            )
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("MessageBatch index out of range")
+        return self._message_at(index)
+
+    def __iter__(self) -> Iterator[Message]:
+        for index in range(len(self)):
+            yield self._message_at(index)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(<{len(self)} messages>)"
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes occupied by the columns and the data pool."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (
+                self.timestamps,
+                self.arbitration_ids,
+                self.flags,
+                self.dlcs,
+                self.data_lengths,
+                self.channel_indices,
+            )
+        ) + len(self.data)
@@ -6,15 +6,21 @@ The main entry point to these classes should be through
 """
 
 import abc
+import heapq
+import itertools
 import logging
+import os
 import platform
 import sys
 import threading
 import time
 import warnings
 from collections.abc import Sequence
+from copy import deepcopy
+from enum import Enum, auto
 from typing import (
     TYPE_CHECKING,
+    Any,
     Callable,
     Final,
     Optional,
@@ -23,6 +29,7 @@ from typing import (
 )
 
 from can import typechecking
+from can.bus_statistics import DEFAULT_BOUNDS, Histogram
 from can.message import Message
 
 if TYPE_CHECKING:
@@ -85,6 +92,164 @@ if sys.platform == "win32" and sys.version_info < (3, 11):
     except ImportError:
         pass
 
+#: The default time in seconds a :class:`PreciseSleeper` busy-waits at the
+#: end of each wait, which covers the usual oversleep of :func:`time.sleep`
+DEFAULT_SPIN_BUDGET: Final[float] = 200e-6
+
+
+class PreciseSleeper:
+    """Waits until a deadline with a precision of a few microseconds.
+
+    :func:`time.sleep` typically returns 50 to 1000 µs late, depending on the
+    operating system and its timer slack. This class sleeps until
+    *spin_budget* seconds before the deadline and then busy-waits on
+    :func:`time.perf_counter_ns` for the rest of the time, but for at most
+    *spin_budget* seconds. The busy wait
+    occupies a CPU core and holds the GIL, so the budget should not be much
+    larger than the usual oversleep.
+
+    It can be passed to the thread based cyclic send tasks and to
+    :class:`~can.MessageSync`, which otherwise only sleep.
+    """
+
+    def __init__(
+        self, spin_budget: float = DEFAULT_SPIN_BUDGET, use_timerfd: bool = False
+    ) -> None:
+        """
+        :param spin_budget:
+            The time in seconds to busy-wait at the end of each wait.
+            A budget of 0 only sleeps.
+        :param use_timerfd:
+            Sleep with a Linux timerfd instead of :func:`time.sleep`.
+            This requires Python 3.13 or newer and is ignored otherwise.
+            The instance must then not be used by several threads at the
+            same time and should be closed with :meth:`close`.
+        :raises ValueError: If *spin_budget* is negative
+        """
+        if spin_budget < 0:
+            raise ValueError("spin_budget must not be negative")
+
+        self.spin_budget = spin_budget
+        self._timerfd: Optional[int] = None
+        if use_timerfd and sys.platform == "linux" and sys.version_info >= (3, 13):
+            self._timerfd = os.timerfd_create(
+                time.CLOCK_MONOTONIC, flags=os.TFD_CLOEXEC
+            )
+
+    def sleep_until(self, deadline_ns: int) -> None:
+        """Return at the given time.
+
+        :param deadline_ns: The time to return at, see :func:`time.perf_counter_ns`.
+        """
+        spin_budget_ns = round(self.spin_budget * NANOSECONDS_IN_SECOND)
+        delay_ns = deadline_ns - spin_budget_ns - time.perf_counter_ns()
+        if delay_ns > 0:
+            if self._timerfd is not None and sys.version_info >= (3, 13):
+                os.timerfd_settime_ns(self._timerfd, initial=delay_ns)
+                os.read(self._timerfd, 8)
+            else:
+                time.sleep(delay_ns / NANOSECONDS_IN_SECOND)
+
+        # the busy wait is bounded, even if the sleep returned early
+        spin_end_ns = min(deadline_ns, time.perf_counter_ns() + spin_budget_ns)
+        while time.perf_counter_ns() < spin_end_ns:
+            pass
+
+    def sleep(self, duration: float) -> None:
+        """Return after the given time.
+
+        :param duration: The time to wait in seconds.
+        """
+        self.sleep_until(
+            time.perf_counter_ns() + round(duration * NANOSECONDS_IN_SECOND)
+        )
+
+    def close(self) -> None:
+        """Release the timerfd, if any."""
+        if self._timerfd is not None:
+            os.close(self._timerfd)
+            self._timerfd = None
+
+
+class OverrunPolicy(Enum):
+    """What a :class:`ThreadBasedCyclicSendTask` does once it could not send
+    a message before the next one was due, e.g. after a garbage collection
+    pause or while the transmit buffer of the bus was full."""
+
+    #: Send the missed messages back to back until the schedule is met again
+    CATCH_UP = auto()
+    #: Drop the missed slots and continue with the next slot of the schedule
+    SKIP = auto()
+    #: Drop the missed slots and continue one period after the late message,
+    #: which shifts the schedule
+    REPHASE = auto()
+
+
+class CyclicTaskStatistics:
+    """Timing statistics of a cyclic send task.
+
+    The statistics are updated by the thread sending the messages without
+    locking, so a :meth:`snapshot` taken meanwhile may not be consistent
+    across counters.
+    """
+
+    __slots__ = (
+        "errors",
+        "lateness",
+        "missed_deadlines",
+        "period",
+        "send_duration",
+        "sent",
+        "skipped",
+    )
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS) -> None:
+        """
+        :param bounds:
+            the upper bounds of the histogram buckets in seconds,
+            see :class:`~can.bus_statistics.Histogram`
+        """
+        #: The histogram of the actual times between two sent messages
+        self.period = Histogram(bounds)
+        #: The histogram of the delays between the time a message was due
+        #: and the time it was passed to :meth:`~can.BusABC.send`
+        self.lateness = Histogram(bounds)
+        #: The histogram of the durations of the send calls
+        self.send_duration = Histogram(bounds)
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters and histograms."""
+        #: The number of sent messages
+        self.sent = 0
+        #: The number of send calls which raised an exception
+        self.errors = 0
+        #: The number of messages which were sent a period or more after
+        #: they were due, i.e. after the next message was due already
+        self.missed_deadlines = 0
+        #: The number of slots which were dropped according to the
+        #: :class:`OverrunPolicy`
+        self.skipped = 0
+        self.period.reset()
+        self.lateness.reset()
+        self.send_duration.reset()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current statistics as a dictionary.
+
+        The histograms are in the format of
+        :meth:`~can.bus_statistics.Histogram.snapshot`.
+        """
+        return {
+            "sent": self.sent,
+            "errors": self.errors,
+            "missed_deadlines": self.missed_deadlines,
+            "skipped": self.skipped,
+            "period": self.period.snapshot(),
+            "lateness": self.lateness.snapshot(),
+            "send_duration": self.send_duration.snapshot(),
+        }
+
 
 class CyclicTask(abc.ABC):
     """
@@ -105,6 +270,10 @@ class CyclicSendTaskABC(CyclicTask, abc.ABC):
     Message send task with defined period
     """
 
+    #: The timing statistics of the task or None if the messages are sent
+    #: by the interface, e.g. by the broadcast manager of SocketCAN
+    statistics: Optional[CyclicTaskStatistics] = None
+
     def __init__(
         self, messages: Union[Sequence[Message], Message], period: float
     ) -> None:
@@ -263,6 +432,211 @@ class MultiRateCyclicSendTaskABC(CyclicSendTaskABC, abc.ABC):
         self._channel = channel
 
 
+def precompute_messages(
+    messages: Union[Sequence[Message], Message],
+    count: int,
+    modifier_callback: Callable[[Message], None],
+) -> list[Message]:
+    """Calculate the messages a cyclic task with a *modifier_callback* sends.
+
+    The callback is applied like by a thread based task: Before the n-th
+    transmission it modifies the message ``messages[n % len(messages)]``.
+    The returned copies can be passed to :meth:`~can.BusABC.send_periodic`
+    without the callback. Interfaces with a native broadcast manager then
+    send them without running any Python code per message, e.g. SocketCAN
+    uploads up to 256 messages as a single BCM task::
+
+        # the 16 variants of a message with a 4 bit alive counter and a checksum
+        msgs = can.broadcastmanager.precompute_messages(msg, 16, update_message)
+        task = bus.send_periodic(msgs, 0.01)
+
+    This only sends the same data as the callback if the data repeats after
+    *count* messages and the callback does not depend on anything else than
+    the message, like the current time.
+
+    :param messages: The message or the messages of the task.
+    :param count: The number of messages to calculate.
+    :param modifier_callback:
+        The function modifying the :attr:`~can.Message.data` of a message.
+        A :class:`~can.CyclicModifiers` is rendered with its
+        :meth:`~can.CyclicModifiers.render` method instead, starting at index 0.
+    :return: The modified copies of the messages.
+    :raises ValueError: If the given messages are invalid or *count* is not positive
+    """
+    messages = CyclicSendTaskABC._check_and_convert_messages(messages)
+    if count < 1:
+        raise ValueError("count must be positive")
+    # imported here, such that "import can" does not load the modifiers
+    from can.modifiers import (  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+        CyclicModifiers,
+    )
+
+    if isinstance(modifier_callback, CyclicModifiers):
+        return modifier_callback.render(messages, count)
+
+    # do not modify the messages of the caller
+    current = [deepcopy(msg) for msg in messages]
+    precomputed = []
+    for index in range(count):
+        msg = current[index % len(current)]
+        modifier_callback(msg)
+        precomputed.append(deepcopy(msg))
+    return precomputed
+
+
+class CyclicTaskScheduler:
+    """Sends the messages of several :class:`ThreadBasedCyclicSendTask` instances
+    from a single thread.
+
+    The tasks are kept in a heap ordered by the time their next message is due.
+    The thread sleeps until the earliest one is due, sends its message and
+    schedules it again, such that any number of tasks only needs one thread.
+    This avoids the context switches and the contention for the GIL of one
+    thread per task, which otherwise add jitter when many tasks are running.
+
+    The thread is started with the first task and ends once all tasks were
+    stopped. Each bus uses its own scheduler for the tasks created by
+    :meth:`~can.BusABC.send_periodic`, since these tasks share the lock of
+    the bus for sending anyway.
+
+    .. note::
+
+        A task which takes long to send its message, e.g. because the transmit
+        buffer of the bus is full, or a slow *modifier_callback* delays the
+        other tasks of the same scheduler.
+    """
+
+    def __init__(
+        self,
+        name: str = "Cyclic send task scheduler",
+        sleeper: Optional[PreciseSleeper] = None,
+    ) -> None:
+        """
+        :param name: The name of the scheduler thread.
+        :param sleeper:
+            Used to wait for the last fraction of the time until a message
+            is due. Defaults to a :class:`PreciseSleeper` which does not
+            busy-wait.
+        """
+        self.name = name
+        self.sleeper = sleeper if sleeper is not None else PreciseSleeper(spin_budget=0)
+        #: The thread sending the messages or None if no task is running
+        self.thread: Optional[threading.Thread] = None
+        # (due time in ns, sequence number, generation, task)
+        self._heap: list[tuple[int, int, int, ThreadBasedCyclicSendTask]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition(threading.Lock())
+
+    def add(
+        self, task: "ThreadBasedCyclicSendTask", due_ns: int, generation: int
+    ) -> threading.Thread:
+        """Schedule the next message of *task*.
+
+        :param task: The task to schedule.
+        :param due_ns: The time when the message is due, see :func:`time.perf_counter_ns`.
+        :param generation:
+            Only send the message while :attr:`ThreadBasedCyclicSendTask.generation`
+            is still equal to this value.
+        :return: The scheduler thread.
+        """
+        with self._condition:
+            entry = (due_ns, next(self._sequence), generation, task)
+            heapq.heappush(self._heap, entry)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name=self.name)
+                self.thread.daemon = True
+                self.thread.start()
+            elif self._heap[0] is entry:
+                # the new message is due before the one the thread waits for
+                self._condition.notify()
+            return self.thread
+
+    def wake_up(self) -> None:
+        """Make the thread reevaluate its tasks, e.g. after one was stopped."""
+        with self._condition:
+            self._condition.notify()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Discard all scheduled messages and wait for the thread to end.
+
+        The tasks themselves are not stopped. A task which is started or
+        modified afterwards starts a new thread.
+
+        :param timeout: The maximum time in seconds to wait for the thread.
+        """
+        with self._condition:
+            self._heap.clear()
+            thread, self.thread = self.thread, None
+            self._condition.notify()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        this_thread = threading.current_thread()
+        due: list[tuple[int, int, int, ThreadBasedCyclicSendTask]] = []
+        while True:
+            with self._condition:
+                if self.thread is not this_thread:
+                    # the scheduler was stopped
+                    return
+
+                # schedule the next messages of the tasks sent last time
+                for entry in due:
+                    heapq.heappush(self._heap, entry)
+                due.clear()
+
+                while True:
+                    # discard the messages of stopped or restarted tasks
+                    while self._heap and (
+                        self._heap[0][3].stopped
+                        or self._heap[0][3].generation != self._heap[0][2]
+                    ):
+                        heapq.heappop(self._heap)
+                    if not self._heap:
+                        self.thread = None
+                        return
+
+                    # the sleeper waits for the last fraction of the time,
+                    # while the lock is released
+                    spin_budget_ns = round(
+                        self.sleeper.spin_budget * NANOSECONDS_IN_SECOND
+                    )
+                    delay_ns = (
+                        self._heap[0][0] - spin_budget_ns - time.perf_counter_ns()
+                    )
+                    if delay_ns <= 0:
+                        break
+                    self._condition.wait(delay_ns / NANOSECONDS_IN_SECOND)
+                    if self.thread is not this_thread:
+                        return
+                first_due_ns = self._heap[0][0]
+
+            self.sleeper.sleep_until(first_due_ns)
+
+            with self._condition:
+                if self.thread is not this_thread:
+                    return
+                # take all messages which are due at once
+                now_ns = time.perf_counter_ns()
+                while self._heap and self._heap[0][0] <= now_ns:
+                    due.append(heapq.heappop(self._heap))
+
+            # send without holding the lock, such that tasks can be
+            # stopped or added meanwhile
+            sent, due = due, []
+            for due_ns, _, generation, task in sent:
+                if task.stopped or task.generation != generation:
+                    continue
+                try:
+                    if not task._send_next(due_ns):
+                        continue
+                except Exception:  # pylint: disable=broad-except
+                    # the error was logged and the task was stopped already
+                    continue
+                next_due_ns = task._next_due_ns(due_ns)
+                due.append((next_due_ns, next(self._sequence), generation, task))
+
+
 class ThreadBasedCyclicSendTask(
     LimitedDurationCyclicSendTaskABC, ModifiableCyclicTaskABC, RestartableCyclicTaskABC
 ):
@@ -278,6 +652,9 @@ class ThreadBasedCyclicSendTask(
         on_error: Optional[Callable[[Exception], bool]] = None,
         autostart: bool = True,
         modifier_callback: Optional[Callable[[Message], None]] = None,
+        scheduler: Optional[CyclicTaskScheduler] = None,
+        overrun_policy: OverrunPolicy = OverrunPolicy.CATCH_UP,
+        sleeper: Optional[PreciseSleeper] = None,
     ) -> None:
         """Transmits `messages` with a `period` seconds for `duration` seconds on a `bus`.
 
@@ -291,6 +668,18 @@ class ThreadBasedCyclicSendTask(
                          error happened on a `bus` while sending `messages`,
                          it shall return either ``True`` or ``False`` depending
                          on desired behaviour of `ThreadBasedCyclicSendTask`.
+        :param scheduler:
+            If given, the messages are sent by the thread of this
+            :class:`CyclicTaskScheduler`, which may be shared with other tasks,
+            instead of a dedicated thread. Not supported together with *pywin32*.
+        :param overrun_policy:
+            What to do once a message could not be sent before the next one was
+            due. Can also be changed later with the attribute of the same name.
+            Ignored if the *pywin32* timers are used.
+        :param sleeper:
+            Used by the dedicated thread to wait until a message is due.
+            Defaults to a :class:`PreciseSleeper` which does not busy-wait.
+            Ignored if a *scheduler* or the *pywin32* timers are used.
 
         :raises ValueError: If the given messages are invalid
         """
@@ -301,11 +690,20 @@ class ThreadBasedCyclicSendTask(
         self.thread: Optional[threading.Thread] = None
         self.on_error = on_error
         self.modifier_callback = modifier_callback
+        self.scheduler = scheduler
+        #: Incremented on every start, such that a restarted task is not
+        #: scheduled twice by a :class:`CyclicTaskScheduler`
+        self.generation = 0
+        self.overrun_policy = overrun_policy
+        self.sleeper = sleeper if sleeper is not None else PreciseSleeper(spin_budget=0)
+        self.statistics: CyclicTaskStatistics = CyclicTaskStatistics()
+        self._msg_index = 0
+        self._last_sent_ns: Optional[int] = None
 
         self.period_ms = int(round(period * 1000, 0))
 
         self.event: Optional[_Pywin32Event] = None
-        if PYWIN32:
+        if PYWIN32 and scheduler is None:
             if self.period_ms == 0:
                 # A period of 0 would mean that the timer is signaled only once
                 raise ValueError("The period cannot be smaller than 0.001 (1 ms)")
@@ -325,18 +723,46 @@ class ThreadBasedCyclicSendTask(
         if autostart:
             self.start()
 
+    @property
+    def jitter(self) -> Histogram:
+        """The histogram of the delays between the time a message was due and
+        the time it was passed to :meth:`~can.BusABC.send`, in seconds.
+
+        An alias of the :attr:`~CyclicTaskStatistics.lateness` of
+        :attr:`statistics`.
+        """
+        return self.statistics.lateness
+
     def stop(self) -> None:
         self.stopped = True
         if self.event and PYWIN32:
             # Reset and signal any pending wait by setting the timer to 0
             PYWIN32.stop_timer(self.event)
+        if self.scheduler is not None:
+            self.scheduler.wake_up()
 
     def start(self) -> None:
+        if self.scheduler is not None:
+            if not self.stopped:
+                return
+            self.stopped = False
+            self.generation += 1
+            self._msg_index = 0
+            self._last_sent_ns = None
+            self.end_time = (
+                time.perf_counter() + self.duration if self.duration else None
+            )
+            self.thread = self.scheduler.add(
+                self, time.perf_counter_ns(), self.generation
+            )
+            return
+
         self.stopped = False
         if self.thread is None or not self.thread.is_alive():
             name = f"Cyclic send task for 0x{self.messages[0].arbitration_id:X}"
             self.thread = threading.Thread(target=self._run, name=name)
             self.thread.daemon = True
+            self._last_sent_ns = None
 
             self.end_time: Optional[float] = (
                 time.perf_counter() + self.duration if self.duration else None
@@ -347,8 +773,80 @@ class ThreadBasedCyclicSendTask(
 
             self.thread.start()
 
+    def _send_next(self, due_ns: Optional[int]) -> bool:
+        """Send the next message of the task.
+
+        :param due_ns:
+            The time when the message was due, see :func:`time.perf_counter_ns`,
+            or None if unknown.
+        :return: ``False`` if the task was stopped
+        """
+        if self.end_time is not None and time.perf_counter() >= self.end_time:
+            self.stop()
+            return False
+
+        statistics = self.statistics
+        try:
+            if self.modifier_callback is not None:
+                self.modifier_callback(self.messages[self._msg_index])
+            start_ns = time.perf_counter_ns()
+            if due_ns is not None:
+                lateness_ns = max(start_ns - due_ns, 0)
+                statistics.lateness.add(lateness_ns / NANOSECONDS_IN_SECOND)
+                # with a period of 0 every message is due immediately
+                if 0 < self.period_ns <= lateness_ns:
+                    statistics.missed_deadlines += 1
+            if self._last_sent_ns is not None:
+                statistics.period.add(
+                    (start_ns - self._last_sent_ns) / NANOSECONDS_IN_SECOND
+                )
+            self._last_sent_ns = start_ns
+            with self.send_lock:
+                # Prevent calling bus.send from multiple threads
+                self.bus.send(self.messages[self._msg_index])
+            statistics.send_duration.add(
+                (time.perf_counter_ns() - start_ns) / NANOSECONDS_IN_SECOND
+            )
+            statistics.sent += 1
+        except Exception as exc:  # pylint: disable=broad-except
+            log.exception(exc)
+            statistics.errors += 1
+
+            # stop if `on_error` callback was not given
+            if self.on_error is None:
+                self.stop()
+                raise exc
+
+            # stop if `on_error` returns False
+            if not self.on_error(exc):
+                self.stop()
+                return False
+
+        self._msg_index = (self._msg_index + 1) % len(self.messages)
+        return True
+
+    def _next_due_ns(self, due_ns: int) -> int:
+        """Return the time when the message after the one due at *due_ns* is due,
+        according to the :attr:`overrun_policy`."""
+        next_due_ns = due_ns + self.period_ns
+        if self.overrun_policy is OverrunPolicy.CATCH_UP or self.period_ns <= 0:
+            # without a period, there are no slots which could be dropped
+            return next_due_ns
+
+        now_ns = time.perf_counter_ns()
+        if next_due_ns > now_ns:
+            return next_due_ns
+
+        # drop the slots which have passed already
+        missed = (now_ns - next_due_ns) // self.period_ns + 1
+        self.statistics.skipped += missed
+        if self.overrun_policy is OverrunPolicy.SKIP:
+            return next_due_ns + missed * self.period_ns
+        # OverrunPolicy.REPHASE
+        return max(now_ns, (self._last_sent_ns or now_ns) + self.period_ns)
+
     def _run(self) -> None:
-        msg_index = 0
+        self._msg_index = 0
         msg_due_time_ns = time.perf_counter_ns()
 
         if self.event and PYWIN32:
@@ -356,38 +854,14 @@ class ThreadBasedCyclicSendTask(
             PYWIN32.wait_0(self.event)
 
         while not self.stopped:
-            if self.end_time is not None and time.perf_counter() >= self.end_time:
-                self.stop()
+            if not self._send_next(None if self.event else msg_due_time_ns):
                 break
 
-            try:
-                if self.modifier_callback is not None:
-                    self.modifier_callback(self.messages[msg_index])
-                with self.send_lock:
-                    # Prevent calling bus.send from multiple threads
-                    self.bus.send(self.messages[msg_index])
-            except Exception as exc:  # pylint: disable=broad-except
-                log.exception(exc)
-
-                # stop if `on_error` callback was not given
-                if self.on_error is None:
-                    self.stop()
-                    raise exc
-
-                # stop if `on_error` returns False
-                if not self.on_error(exc):
-                    self.stop()
-                    break
-
             if not self.event:
-                msg_due_time_ns += self.period_ns
-
-            msg_index = (msg_index + 1) % len(self.messages)
+                msg_due_time_ns = self._next_due_ns(msg_due_time_ns)
 
             if self.event and PYWIN32:
                 PYWIN32.wait_inf(self.event)
             else:
                 # Compensate for the time it takes to send the message
-                delay_ns = msg_due_time_ns - time.perf_counter_ns()
-                if delay_ns > 0:
-                    time.sleep(delay_ns / NANOSECONDS_IN_SECOND)
+                self.sleeper.sleep_until(msg_due_time_ns)
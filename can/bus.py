@@ -3,14 +3,18 @@ Contains the ABC bus implementation and its documentation.
 """
 
 import contextlib
+import functools
+import inspect
 import logging
 import threading
 from abc import ABC, abstractmethod
-from collections.abc import Iterator, Sequence
+from collections.abc import AsyncIterator, Iterator, Sequence
 from enum import Enum, auto
-from time import time
+from time import perf_counter, time
 from types import TracebackType
 from typing import (
+    TYPE_CHECKING,
+    Any,
     Callable,
     Optional,
     Union,
@@ -20,9 +24,20 @@ from typing import (
 from typing_extensions import Self
 
 import can.typechecking
-from can.broadcastmanager import CyclicSendTaskABC, ThreadBasedCyclicSendTask
+from can.broadcastmanager import (
+    PYWIN32,
+    CyclicSendTaskABC,
+    CyclicTaskScheduler,
+    ThreadBasedCyclicSendTask,
+)
+from can.bus_statistics import DEFAULT_BOUNDS, BusStatistics
+from can.exceptions import CanError
+from can.filters import CompiledFilters
 from can.message import Message
 
+if TYPE_CHECKING:
+    import asyncio
+
 LOG = logging.getLogger(__name__)
 
 
@@ -63,6 +78,9 @@ class BusABC(ABC):
     #: Assume that no cleanup is needed until something was initialized
     _is_shutdown: bool = True
     _can_protocol: CanProtocol = CanProtocol.CAN_20
+    _statistics: Optional[BusStatistics] = None
+    _cyclic_scheduler: Optional[CyclicTaskScheduler] = None
+    _arecv_future: Optional["asyncio.Future[Optional[Message]]"] = None
 
     @abstractmethod
     def __init__(
@@ -92,12 +110,23 @@ class BusABC(ABC):
             If the bus cannot be initialized
         """
         self._periodic_tasks: list[_SelfRemovingCyclicTask] = []
+        self._cyclic_scheduler: Optional[CyclicTaskScheduler] = None
         self.set_filters(can_filters)
         # Flip the class default value when the constructor finishes.  That
         # usually means the derived class constructor was also successful,
         # since it calls this parent constructor last.
         self._is_shutdown: bool = False
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # count the sent messages of the interfaces, if statistics are enabled
+        if inspect.isfunction(cls.__dict__.get("send")):
+            cls.send = _measure_send(cls.__dict__["send"])  # type: ignore[method-assign, assignment]
+        if inspect.isfunction(cls.__dict__.get("send_batch")):
+            cls.send_batch = _measure_send_batch(  # type: ignore[method-assign, assignment]
+                cls.__dict__["send_batch"]
+            )
+
     def __str__(self) -> str:
         return self.channel_info
 
@@ -123,10 +152,15 @@ class BusABC(ABC):
             # return it, if it matches
             if msg and (already_filtered or self._matches_filters(msg)):
                 LOG.log(self.RECV_LOGGING_LEVEL, "Received: %s", msg)
+                if self._statistics is not None:
+                    self._statistics.on_received(msg, time())
                 return msg
 
+            if msg and self._statistics is not None:
+                self._statistics.rx_filtered += 1
+
             # if not, and timeout is None, try indefinitely
-            elif timeout is None:
+            if timeout is None:
                 continue
 
             # try next one only if there still is time, and with
@@ -139,6 +173,131 @@ class BusABC(ABC):
 
                 return None
 
+    def recv_batch(
+        self, max_count: int = 64, timeout: Optional[float] = None
+    ) -> list[Message]:
+        """Block waiting for messages from the Bus and return all messages
+        that are immediately available.
+
+        Contrary to :meth:`~can.BusABC.recv`, this method does not stop after
+        the first message but also returns every message that the interface
+        has already buffered, up to *max_count* messages. This reduces the
+        per-message overhead when reading busy buses.
+
+        :param max_count:
+            the maximum number of messages to return
+        :param timeout:
+            seconds to wait for the first message or None to wait indefinitely
+
+        :return:
+            A list of up to *max_count* :class:`~can.Message` objects.
+            The list is empty on timeout.
+
+        :raises ValueError:
+            If *max_count* is smaller than 1
+        :raises ~can.exceptions.CanOperationError:
+            If an error occurred while reading
+        """
+        if max_count < 1:
+            raise ValueError("max_count must be at least 1")
+
+        start = time()
+        time_left = timeout
+
+        while True:
+            # try to get some messages
+            msgs, already_filtered = self._recv_batch_internal(
+                max_count=max_count, timeout=time_left
+            )
+
+            statistics = self._statistics
+            if msgs and not already_filtered:
+                received = len(msgs)
+                msgs = self._compiled_filters.filter(msgs)
+                if statistics is not None:
+                    statistics.rx_filtered += received - len(msgs)
+
+            # return them, if any of them matched
+            if msgs:
+                if LOG.isEnabledFor(self.RECV_LOGGING_LEVEL):
+                    for msg in msgs:
+                        LOG.log(self.RECV_LOGGING_LEVEL, "Received: %s", msg)
+                if statistics is not None:
+                    now = time()
+                    for msg in msgs:
+                        statistics.on_received(msg, now)
+                return msgs
+
+            # if not, and timeout is None, try indefinitely
+            elif timeout is None:
+                continue
+
+            # try again only if there still is time, and with
+            # reduced timeout
+            else:
+                time_left = timeout - (time() - start)
+
+                if time_left > 0:
+                    continue
+
+                return []
+
+    def _recv_batch_internal(
+        self, max_count: int, timeout: Optional[float]
+    ) -> tuple[list[Message], bool]:
+        """
+        Read up to *max_count* messages from the bus and tell whether they
+        were filtered. This method is called by :meth:`~can.BusABC.recv_batch`.
+
+        The default implementation waits up to *timeout* seconds for the first
+        message using :meth:`~can.BusABC._recv_internal` and then keeps
+        reading without blocking until no more messages are available or
+        *max_count* messages were read.
+
+        Interfaces that can fetch several buffered messages at once should
+        override this method. Implementations must only block while waiting
+        for the first message.
+
+        :param max_count: the maximum number of messages to read
+        :param timeout: seconds to wait for the first message,
+                        see :meth:`~can.BusABC.recv`
+
+        :return:
+            1.  a list of messages that were read, which is empty on timeout
+            2.  a bool that is True if message filtering has already
+                been done and else False
+
+        :raises ~can.exceptions.CanOperationError:
+            If an error occurred while reading
+        """
+        msgs: list[Message] = []
+
+        if type(self).recv is not BusABC.recv:
+            # legacy implementation which overrides recv() instead of _recv_internal()
+            msg = self.recv(timeout)
+            while msg is not None:
+                msgs.append(msg)
+                if len(msgs) >= max_count:
+                    break
+                msg = self.recv(0.0)
+            return msgs, True
+
+        # read at most max_count messages, such that a flood of messages that
+        # do not match the filters cannot keep this loop busy forever
+        msg, already_filtered = self._recv_internal(timeout=timeout)
+        reads = 1
+        while msg is not None:
+            if already_filtered or self._matches_filters(msg):
+                msgs.append(msg)
+            elif self._statistics is not None:
+                self._statistics.rx_filtered += 1
+            if reads >= max_count:
+                break
+            msg, already_filtered = self._recv_internal(timeout=0.0)
+            reads += 1
+
+        return msgs, True
+
     def _recv_internal(
         self, timeout: Optional[float]
     ) -> tuple[Optional[Message], bool]:
@@ -203,6 +362,207 @@ class BusABC(ABC):
         """
         raise NotImplementedError("Trying to write to a readonly bus?")
 
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages to the CAN bus in the given order.
+
+        Similar to :manpage:`sendmmsg(2)`, the messages are sent until all of
+        them were transmitted or until an error occurs. The number of sent
+        messages is returned, such that the caller can retry the remaining
+        ones. An exception is only raised if not even the first message could
+        be sent.
+
+        The default implementation calls :meth:`~can.BusABC.send` for every
+        message. Interfaces may override this method to transmit the messages
+        more efficiently.
+
+        :param msgs: The messages to send.
+
+        :param timeout:
+            Passed to :meth:`~can.BusABC.send` and thus applies to each
+            message individually.
+
+        :return:
+            The number of messages that were sent, starting with the first
+            one. This is less than ``len(msgs)`` if an error occurred.
+
+        :raises ~can.exceptions.CanOperationError:
+            If not even the first message could be sent
+        """
+        sent = 0
+        for msg in msgs:
+            try:
+                self.send(msg, timeout)
+            except CanError as error:
+                if sent == 0:
+                    raise
+                LOG.debug("Sent %d of %d messages: %s", sent, len(msgs), error)
+                break
+            sent += 1
+        return sent
+
+    async def arecv(self, timeout: Optional[float] = None) -> Optional[Message]:
+        """Wait for a message from the bus without blocking the running
+        :mod:`asyncio` event loop::
+
+            msg = await bus.arecv(timeout=1.0)
+
+        If the interface provides a file descriptor (see :meth:`~can.BusABC.fileno`),
+        the event loop watches it directly and no thread is involved. Otherwise,
+        :meth:`~can.BusABC.recv` is called in the default executor of the loop.
+        If such a call is cancelled, e.g. by :func:`asyncio.wait_for`, the pending
+        read is carried over to the next call, such that no message is lost.
+
+        .. note::
+
+            Do not use this method on a bus which is also served by a
+            :class:`~can.Notifier` with an event loop.
+
+        :param timeout:
+            seconds to wait for a message or None to wait indefinitely
+
+        :return:
+            :obj:`None` on timeout or a :class:`~can.Message` object.
+
+        :raises ~can.exceptions.CanOperationError:
+            If an error occurred while reading
+        """
+        import asyncio  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        try:
+            file_descriptor = self.fileno()
+        except NotImplementedError:
+            file_descriptor = -1
+
+        while file_descriptor >= 0:
+            # the interface may have buffered messages already
+            msg = self.recv(0.0)
+            if msg is not None:
+                return msg
+
+            time_left = None if deadline is None else deadline - loop.time()
+            if time_left is not None and time_left <= 0:
+                return None
+
+            try:
+                await self._wait_for_fd(file_descriptor, time_left)
+            except NotImplementedError:
+                # the event loop cannot watch file descriptors, e.g. on Windows
+                break
+
+        return await self._arecv_in_executor(deadline)
+
+    async def _arecv_in_executor(self, deadline: Optional[float]) -> Optional[Message]:
+        import asyncio  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
+        loop = asyncio.get_running_loop()
+        while True:
+            time_left = None if deadline is None else max(deadline - loop.time(), 0.0)
+            if (
+                self._arecv_future is not None
+                and self._arecv_future.get_loop() is not loop
+            ):
+                # left over by a previous event loop
+                self._arecv_future = None
+            if self._arecv_future is None:
+                # read in slices, such that a pending read does not keep the
+                # executor busy for long after the event loop was closed
+                self._arecv_future = loop.run_in_executor(
+                    None,
+                    self.recv,
+                    min(time_left, 1.0) if time_left is not None else 1.0,
+                )
+
+            try:
+                msg = await asyncio.wait_for(
+                    asyncio.shield(self._arecv_future), time_left
+                )
+            except asyncio.TimeoutError:
+                # keep the pending read for the next call
+                return None
+            self._arecv_future = None
+
+            # a read carried over from a previous call might have timed out early
+            if msg is not None or (deadline is not None and loop.time() >= deadline):
+                return msg
+
+    async def _wait_for_fd(
+        self, file_descriptor: int, timeout: Optional[float], write: bool = False
+    ) -> bool:
+        """Wait until *file_descriptor* becomes readable or writable using the
+        running event loop.
+
+        :return: ``False`` on timeout
+        :raises NotImplementedError:
+            if the event loop cannot watch file descriptors
+        """
+        import asyncio  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+
+        def on_ready() -> None:
+            if not ready.done():
+                ready.set_result(None)
+
+        if write:
+            loop.add_writer(file_descriptor, on_ready)
+        else:
+            loop.add_reader(file_descriptor, on_ready)
+        try:
+            await asyncio.wait_for(ready, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            if write:
+                loop.remove_writer(file_descriptor)
+            else:
+                loop.remove_reader(file_descriptor)
+        return True
+
+    async def asend(self, msg: Message, timeout: Optional[float] = None) -> None:
+        """Transmit a message to the CAN bus without blocking the running
+        :mod:`asyncio` event loop::
+
+            await bus.asend(msg)
+
+        The default implementation calls :meth:`~can.BusABC.send` in the
+        default executor of the loop. Interfaces which can send without
+        blocking override this method.
+
+        :param msg: A message object.
+        :param timeout: See :meth:`~can.BusABC.send`.
+
+        :raises ~can.exceptions.CanOperationError:
+            If an error occurred while sending
+        """
+        import asyncio  # noqa: PLC0415 # pylint: disable=import-outside-toplevel
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.send, msg, timeout)
+
+    def __aiter__(self) -> AsyncIterator[Message]:
+        """Allow iteration on messages as they are received in an
+        :mod:`asyncio` event loop::
+
+            async for msg in bus:
+                print(msg)
+
+        :yields:
+            :class:`Message` msg objects.
+        """
+        return self._aiter_messages()
+
+    async def _aiter_messages(self) -> AsyncIterator[Message]:
+        while True:
+            msg = await self.arecv(timeout=1.0)
+            if msg is not None:
+                yield msg
+
     def send_periodic(
         self,
         msgs: Union[Message, Sequence[Message]],
@@ -328,6 +688,10 @@ class BusABC(ABC):
             self._lock_send_periodic = (  # pylint: disable=attribute-defined-outside-init
                 threading.Lock()
             )
+        if PYWIN32 is None and self._cyclic_scheduler is None:
+            # All tasks of this bus are sent by a single thread, unless the
+            # waitable timers of pywin32 are used for better timing accuracy
+            self._cyclic_scheduler = CyclicTaskScheduler(f"Cyclic send tasks of {self}")
         task = ThreadBasedCyclicSendTask(
             bus=self,
             lock=self._lock_send_periodic,
@@ -336,6 +700,7 @@ class BusABC(ABC):
             duration=duration,
             autostart=autostart,
             modifier_callback=modifier_callback,
+            scheduler=self._cyclic_scheduler,
         )
         return task
 
@@ -414,9 +779,17 @@ class BusABC(ABC):
             messages based only on the arbitration ID and mask.
         """
         self._filters = filters or None
+        self._compiled_filters = CompiledFilters(self._filters)
         with contextlib.suppress(NotImplementedError):
             self._apply_filters(self._filters)
 
+    @property
+    def compiled_filters(self) -> CompiledFilters:
+        """The current filters in their compiled form, which is used for
+        matching messages in software. See :class:`~can.filters.CompiledFilters`.
+        """
+        return self._compiled_filters
+
     def _apply_filters(self, filters: Optional[can.typechecking.CanFilters]) -> None:
         """
         Hook for applying the filters to the underlying kernel or
@@ -439,28 +812,44 @@ class BusABC(ABC):
         :return: whether the given message matches at least one filter
         """
 
-        # if no filters are set, all messages are matched
-        if self._filters is None:
-            return True
+        return self._compiled_filters.matches_id(msg.arbitration_id, msg.is_extended_id)
 
-        for _filter in self._filters:
-            # check if this filter even applies to the message
-            if "extended" in _filter:
-                if _filter["extended"] != msg.is_extended_id:
-                    continue
+    @property
+    def statistics(self) -> Optional[BusStatistics]:
+        """The traffic statistics of this bus or `None` if they are disabled.
+        See :meth:`~can.BusABC.enable_statistics`.
+        """
+        return self._statistics
+
+    def enable_statistics(
+        self, bounds: Sequence[float] = DEFAULT_BOUNDS
+    ) -> BusStatistics:
+        """Start collecting traffic statistics for this bus.
+
+        The statistics are disabled by default and cost a single attribute
+        lookup per received or sent message in that case. To measure the send
+        calls, the :meth:`~can.BusABC.send` and :meth:`~can.BusABC.send_batch`
+        methods of the interfaces are wrapped when their class is created.
+
+        Calling this method again resets the statistics.
+
+        .. note::
 
-            # then check for the mask and id
-            can_id = _filter["can_id"]
-            can_mask = _filter["can_mask"]
+            Only interfaces that implement :meth:`~can.BusABC._recv_internal`
+            are covered on the receiving side, legacy interfaces which override
+            :meth:`~can.BusABC.recv` do not update the receive statistics.
 
-            # basically, we compute
-            # `msg.arbitration_id & can_mask == can_id & can_mask`
-            # by using the shorter, but equivalent from below:
-            if (can_id ^ msg.arbitration_id) & can_mask == 0:
-                return True
+        :param bounds:
+            the upper bounds of the histogram buckets in seconds,
+            see :class:`~can.bus_statistics.Histogram`
+        :return: the statistics, which are also available as :attr:`statistics`
+        """
+        self._statistics = BusStatistics(bounds)
+        return self._statistics
 
-        # nothing matched
-        return False
+    def disable_statistics(self) -> None:
+        """Stop collecting traffic statistics."""
+        self._statistics = None
 
     def flush_tx_buffer(self) -> None:
         """Discard every message that may be queued in the output buffer(s)."""
@@ -478,6 +867,9 @@ class BusABC(ABC):
 
         self._is_shutdown = True
         self.stop_all_periodic_tasks()
+        if self._cyclic_scheduler is not None:
+            # also end the thread if tasks which are not stored are still running
+            self._cyclic_scheduler.stop()
 
     def __enter__(self) -> Self:
         return self
@@ -539,6 +931,64 @@ class BusABC(ABC):
         raise NotImplementedError("fileno is not implemented using current CAN bus")
 
 
+def _measure_send(
+    send: Callable[[BusABC, Message, Optional[float]], None],
+) -> Callable[[BusABC, Message, Optional[float]], None]:
+    """Wrap the :meth:`~BusABC.send` method of an interface, such that it
+    updates the statistics of the bus, if they are enabled."""
+
+    @functools.wraps(send)
+    def measured_send(
+        self: BusABC, msg: Message, timeout: Optional[float] = None
+    ) -> None:
+        statistics = self._statistics
+        if statistics is None or type(self).send is not measured_send:
+            # disabled, or called by an override which measures the call itself
+            send(self, msg, timeout)
+            return
+
+        start = perf_counter()
+        try:
+            send(self, msg, timeout)
+        except Exception:
+            statistics.tx_errors += 1
+            raise
+        statistics.send_duration.add(perf_counter() - start)
+        statistics.tx_count += 1
+        statistics.tx_bytes += len(msg.data)
+
+    return measured_send
+
+
+def _measure_send_batch(
+    send_batch: Callable[[BusABC, Sequence[Message], Optional[float]], int],
+) -> Callable[[BusABC, Sequence[Message], Optional[float]], int]:
+    """Wrap the :meth:`~BusABC.send_batch` method of an interface, such that
+    it updates the statistics of the bus, if they are enabled."""
+
+    @functools.wraps(send_batch)
+    def measured_send_batch(
+        self: BusABC, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        statistics = self._statistics
+        if statistics is None or type(self).send_batch is not measured_send_batch:
+            # disabled, or called by an override which measures the call itself
+            return send_batch(self, msgs, timeout)
+
+        start = perf_counter()
+        try:
+            sent = send_batch(self, msgs, timeout)
+        except Exception:
+            statistics.tx_errors += len(msgs)
+            raise
+        statistics.on_sent(msgs[:sent], perf_counter() - start)
+        # the messages after the sent ones failed
+        statistics.tx_errors += len(msgs) - sent
+        return sent
+
+    return measured_send_batch
+
+
 class _SelfRemovingCyclicTask(CyclicSendTaskABC, ABC):
     """Removes itself from a bus.
 
@@ -0,0 +1,206 @@
+"""
+This module contains :class:`~can.bus_statistics.BusStatistics`, the
+optional traffic statistics of a :class:`~can.BusABC`.
+"""
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from time import time
+from typing import Any, Optional
+
+from can.message import Message
+
+#: The default upper bounds of the histogram buckets in seconds, the last
+#: bucket additionally collects all larger values
+DEFAULT_BOUNDS: tuple[float, ...] = (
+    10e-6,
+    50e-6,
+    100e-6,
+    500e-6,
+    1e-3,
+    5e-3,
+    10e-3,
+    50e-3,
+    100e-3,
+    500e-3,
+    1.0,
+)
+
+
+class Histogram:
+    """A histogram of durations with fixed bucket bounds.
+
+    A value is counted in the first bucket whose upper bound is greater than
+    or equal to the value. Values above the last bound are counted in an
+    additional overflow bucket.
+    """
+
+    __slots__ = ("bounds", "buckets", "count", "maximum", "minimum", "total")
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS) -> None:
+        """
+        :param bounds: the ascending upper bounds of the buckets in seconds
+        """
+        if list(bounds) != sorted(bounds):
+            raise ValueError("the bounds must be in ascending order")
+
+        #: The upper bounds of the buckets in seconds
+        self.bounds: tuple[float, ...] = tuple(bounds)
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all recorded values."""
+        #: The number of values per bucket, the last one is the overflow bucket
+        self.buckets: list[int] = [0] * (len(self.bounds) + 1)
+        #: The number of recorded values
+        self.count = 0
+        #: The sum of all recorded values in seconds
+        self.total = 0.0
+        #: The smallest recorded value or None if nothing was recorded
+        self.minimum: Optional[float] = None
+        #: The largest recorded value or None if nothing was recorded
+        self.maximum: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        """Record a single value.
+
+        :param value: the value in seconds
+        """
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    @property
+    def mean(self) -> Optional[float]:
+        """The mean of all recorded values or None if nothing was recorded."""
+        return self.total / self.count if self.count else None
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current state of the histogram as a dictionary.
+
+        The ``buckets`` entry is a list of ``(upper_bound, count)`` tuples,
+        where the upper bound of the overflow bucket is ``float("inf")``.
+        """
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "min": self.minimum,
+            "max": self.maximum,
+            "buckets": list(zip((*self.bounds, float("inf")), self.buckets)),
+        }
+
+
+class BusStatistics:
+    """Traffic statistics of a single bus.
+
+    An instance is created by :meth:`can.BusABC.enable_statistics` and then
+    updated by the receive and transmit methods of the bus:
+
+    * received messages and bytes, counted by :meth:`~can.BusABC.recv`
+      and :meth:`~can.BusABC.recv_batch`
+    * messages which were dropped by the software filters of the bus
+    * the receive latency, i.e. the time between the timestamp of a message and
+      its delivery to the caller. This is only meaningful if the interface
+      provides timestamps based on the system clock (see :func:`time.time`),
+      negative latencies are not recorded.
+    * sent messages and bytes, the duration of each call to
+      :meth:`~can.BusABC.send` or :meth:`~can.BusABC.send_batch` and
+      the number of calls which failed with an exception
+
+    The counters are updated without locking. Each of them is normally only
+    modified by a single thread, but a :meth:`snapshot` taken while another
+    thread receives or sends may not be consistent across counters.
+    """
+
+    __slots__ = (
+        "rx_bytes",
+        "rx_count",
+        "rx_filtered",
+        "rx_latency",
+        "send_duration",
+        "start_time",
+        "tx_bytes",
+        "tx_count",
+        "tx_errors",
+    )
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS) -> None:
+        """
+        :param bounds:
+            the upper bounds of the histogram buckets in seconds,
+            see :class:`~can.bus_statistics.Histogram`
+        """
+        #: The histogram of the receive latencies
+        self.rx_latency = Histogram(bounds)
+        #: The histogram of the durations of the send calls
+        self.send_duration = Histogram(bounds)
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset all counters and histograms."""
+        #: The time at which the statistics were started or last reset
+        self.start_time = time()
+        #: The number of received messages
+        self.rx_count = 0
+        #: The number of data bytes of the received messages
+        self.rx_bytes = 0
+        #: The number of received messages that were dropped by the software filters
+        self.rx_filtered = 0
+        #: The number of sent messages
+        self.tx_count = 0
+        #: The number of data bytes of the sent messages
+        self.tx_bytes = 0
+        #: The number of messages which could not be sent, because the send
+        #: call raised an exception or a batch was only partially sent
+        self.tx_errors = 0
+        self.rx_latency.reset()
+        self.send_duration.reset()
+
+    def on_received(self, msg: Message, now: float) -> None:
+        """Count a message that is delivered to the caller.
+
+        :param msg: the received message
+        :param now: the current time as returned by :func:`time.time`
+        """
+        self.rx_count += 1
+        self.rx_bytes += len(msg.data)
+        latency = now - msg.timestamp
+        if latency >= 0.0:
+            self.rx_latency.add(latency)
+
+    def on_sent(self, msgs: Sequence[Message], duration: float) -> None:
+        """Count messages that were sent by a single call.
+
+        :param msgs: the sent messages
+        :param duration: the duration of the send call in seconds
+        """
+        self.tx_count += len(msgs)
+        self.tx_bytes += sum(len(msg.data) for msg in msgs)
+        self.send_duration.add(duration)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current statistics as a dictionary.
+
+        The dictionary contains all counters, the rates of received and sent
+        messages per second since the start time as well as the histograms
+        in the format of :meth:`Histogram.snapshot`.
+        """
+        elapsed = time() - self.start_time
+        return {
+            "elapsed": elapsed,
+            "rx_count": self.rx_count,
+            "rx_bytes": self.rx_bytes,
+            "rx_filtered": self.rx_filtered,
+            "rx_rate": self.rx_count / elapsed if elapsed > 0 else 0.0,
+            "rx_latency": self.rx_latency.snapshot(),
+            "tx_count": self.tx_count,
+            "tx_bytes": self.tx_bytes,
+            "tx_errors": self.tx_errors,
+            "tx_rate": self.tx_count / elapsed if elapsed > 0 else 0.0,
+            "send_duration": self.send_duration.snapshot(),
+        }
@@ -0,0 +1,304 @@
+"""
+This module contains :class:`~can.CycleTimeMonitor`, a listener which checks
+that cyclic messages are received in time.
+"""
+
+import logging
+import math
+import threading
+from collections.abc import Sequence
+from time import time
+from typing import Any, Callable, Optional
+
+from can.bus_statistics import Histogram
+from can.listener import Listener
+from can.message import Message
+from can.typechecking import Channel
+
+logger = logging.getLogger(__name__)
+
+#: The key of a monitored ID: (channel, arbitration ID, is_extended_id)
+MonitorKey = tuple[Optional[Channel], int, bool]
+
+#: The default upper bounds of the interval histogram buckets in seconds
+CYCLE_TIME_BOUNDS: tuple[float, ...] = (
+    1e-3,
+    2e-3,
+    5e-3,
+    10e-3,
+    20e-3,
+    50e-3,
+    100e-3,
+    200e-3,
+    500e-3,
+    1.0,
+    2.0,
+    5.0,
+)
+
+
+class CycleTimeStatistics:
+    """The streaming statistics of the intervals between the messages of
+    a single ID.
+
+    The mean and variance are updated with Welford's algorithm and the
+    intervals are counted in a fixed-bucket
+    :class:`~can.bus_statistics.Histogram`, so the memory needed does not
+    depend on the number of messages.
+    """
+
+    __slots__ = (
+        "_m2",
+        "histogram",
+        "last_received",
+        "last_timestamp",
+        "maximum",
+        "mean",
+        "minimum",
+        "msg_count",
+        "timed_out",
+        "timeouts",
+    )
+
+    def __init__(self, msg: Message, now: float, bounds: Sequence[float]) -> None:
+        #: The number of received messages
+        self.msg_count = 1
+        #: The mean interval in seconds, based on the message timestamps
+        self.mean = 0.0
+        self._m2 = 0.0
+        #: The shortest interval in seconds or None before the second message
+        self.minimum: Optional[float] = None
+        #: The longest interval, i.e. the largest gap, in seconds
+        #: or None before the second message
+        self.maximum: Optional[float] = None
+        #: The histogram of the intervals
+        self.histogram = Histogram(bounds)
+        #: The timestamp of the latest message
+        self.last_timestamp = msg.timestamp
+        #: The time at which the latest message was received, see :func:`time.time`
+        self.last_received = now
+        #: The number of times the ID has timed out
+        self.timeouts = 0
+        #: Whether the ID is currently timed out
+        self.timed_out = False
+
+    def add(self, msg: Message, now: float) -> None:
+        """Record the interval to the previous message."""
+        interval = msg.timestamp - self.last_timestamp
+        self.last_timestamp = msg.timestamp
+        self.last_received = now
+        self.timed_out = False
+        self.msg_count += 1
+
+        # Welford's online algorithm over msg_count - 1 intervals
+        delta = interval - self.mean
+        self.mean += delta / (self.msg_count - 1)
+        self._m2 += delta * (interval - self.mean)
+        if self.minimum is None or interval < self.minimum:
+            self.minimum = interval
+        if self.maximum is None or interval > self.maximum:
+            self.maximum = interval
+        self.histogram.add(interval)
+
+    @property
+    def variance(self) -> Optional[float]:
+        """The sample variance of the intervals or None before the third message."""
+        if self.msg_count < 3:
+            return None
+        return self._m2 / (self.msg_count - 2)
+
+    @property
+    def jitter(self) -> Optional[float]:
+        """The standard deviation of the intervals in seconds or None before
+        the third message."""
+        variance = self.variance
+        return None if variance is None else math.sqrt(variance)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the current statistics as a dictionary."""
+        return {
+            "msg_count": self.msg_count,
+            "mean": self.mean if self.msg_count > 1 else None,
+            "jitter": self.jitter,
+            "min": self.minimum,
+            "max": self.maximum,
+            "last_received": self.last_received,
+            "timeouts": self.timeouts,
+            "timed_out": self.timed_out,
+            "histogram": self.histogram.snapshot(),
+        }
+
+
+class CycleTimeMonitor(Listener):
+    """Keeps streaming statistics of the cycle time of every received ID and
+    reports IDs which stopped being received::
+
+        def on_timeout(key, statistics):
+            channel, arbitration_id, is_extended_id = key
+            silence = time.time() - statistics.last_received
+            print(f"0x{arbitration_id:X} missing for {silence:.3f} s")
+
+        monitor = can.CycleTimeMonitor(on_timeout=on_timeout, check_interval=0.01)
+        notifier = can.Notifier(bus, [monitor])
+        ...
+        print(monitor.snapshot())
+
+    The period of an ID is learned from the timestamps of its messages. Once
+    *min_intervals* intervals were seen, the ID times out if no message was
+    received for *timeout_factor* times its mean period. Each timeout is
+    reported once with the *on_timeout* callback, until a message of the ID
+    is received again.
+
+    Timeouts are checked whenever messages are received. Since nothing is
+    received if the whole bus goes silent, a *check_interval* can be given
+    to additionally check in a background thread.
+    """
+
+    def __init__(
+        self,
+        on_timeout: Optional[Callable[[MonitorKey, CycleTimeStatistics], Any]] = None,
+        timeout_factor: float = 3.0,
+        min_intervals: int = 5,
+        check_interval: Optional[float] = None,
+        bounds: Sequence[float] = CYCLE_TIME_BOUNDS,
+    ) -> None:
+        """
+        :param on_timeout:
+            Called with the key and the statistics of an ID when it times out.
+        :param timeout_factor:
+            An ID times out when no message was received for this multiple of
+            its mean period.
+        :param min_intervals:
+            The number of intervals that need to be seen before the period of
+            an ID is considered learned.
+        :param check_interval:
+            If given, a background thread checks for timeouts every this
+            many seconds.
+        :param bounds:
+            The upper bounds of the interval histogram buckets in seconds.
+        :raises ValueError:
+            If *timeout_factor* is not larger than 1 or *min_intervals*
+            is smaller than 1
+        """
+        if timeout_factor <= 1:
+            raise ValueError("timeout_factor must be larger than 1")
+        if min_intervals < 1:
+            raise ValueError("min_intervals must be at least 1")
+
+        self.on_timeout = on_timeout
+        self.timeout_factor = timeout_factor
+        self.min_intervals = min_intervals
+        self.bounds = tuple(bounds)
+
+        self._statistics: dict[MonitorKey, CycleTimeStatistics] = {}
+        self._lock = threading.Lock()
+        self._next_check = 0.0
+
+        self._stopped = threading.Event()
+        self._checker: Optional[threading.Thread] = None
+        if check_interval is not None:
+            self._checker = threading.Thread(
+                target=self._run_checker,
+                args=(check_interval,),
+                name=f"{type(self).__qualname__} checker",
+            )
+            self._checker.daemon = True
+            self._checker.start()
+
+    def on_message_received(self, msg: Message) -> None:
+        self.on_messages_received((msg,))
+
+    def on_messages_received(self, msgs: Sequence[Message]) -> None:
+        now = time()
+        with self._lock:
+            for msg in msgs:
+                key = (msg.channel, msg.arbitration_id, msg.is_extended_id)
+                statistics = self._statistics.get(key)
+                if statistics is None:
+                    self._statistics[key] = CycleTimeStatistics(msg, now, self.bounds)
+                else:
+                    statistics.add(msg, now)
+        if now >= self._next_check:
+            self.check_timeouts(now)
+
+    def check_timeouts(self, now: Optional[float] = None) -> list[MonitorKey]:
+        """Check all IDs for timeouts and call *on_timeout* for the new ones.
+
+        This is done automatically while messages are received.
+
+        :param now: The current time, see :func:`time.time`.
+        :return: The keys of the IDs which timed out with this call.
+        """
+        if now is None:
+            now = time()
+
+        timed_out: list[tuple[MonitorKey, CycleTimeStatistics]] = []
+        smallest_timeout = math.inf
+        with self._lock:
+            for key, statistics in self._statistics.items():
+                if statistics.msg_count <= self.min_intervals:
+                    continue
+                timeout = statistics.mean * self.timeout_factor
+                smallest_timeout = min(smallest_timeout, timeout)
+                if (
+                    not statistics.timed_out
+                    and now - statistics.last_received > timeout
+                ):
+                    statistics.timed_out = True
+                    statistics.timeouts += 1
+                    timed_out.append((key, statistics))
+            # there is no need to check again before the shortest timeout has passed
+            self._next_check = now + min(smallest_timeout, 1.0) / 2
+
+        if self.on_timeout is not None:
+            for key, statistics in timed_out:
+                self.on_timeout(key, statistics)
+        return [key for key, _ in timed_out]
+
+    def _run_checker(self, check_interval: float) -> None:
+        while not self._stopped.wait(check_interval):
+            try:
+                self.check_timeouts()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("failed to check for timeouts")
+
+    def get(
+        self,
+        arbitration_id: int,
+        is_extended_id: bool = True,
+        channel: Optional[Channel] = None,
+    ) -> Optional[CycleTimeStatistics]:
+        """Return the statistics of an ID or None if it was not received.
+
+        :param arbitration_id: The arbitration ID.
+        :param is_extended_id: Whether it is an extended (29 bit) identifier.
+        :param channel: The :attr:`~can.Message.channel` of the messages.
+        """
+        return self._statistics.get((channel, arbitration_id, is_extended_id))
+
+    def snapshot(self) -> dict[MonitorKey, dict[str, Any]]:
+        """Return the statistics of all IDs in the format of
+        :meth:`CycleTimeStatistics.snapshot`.
+
+        The keys are tuples of the channel, the arbitration ID and whether the
+        ID is an extended identifier.
+        """
+        with self._lock:
+            return {
+                key: statistics.snapshot()
+                for key, statistics in self._statistics.items()
+            }
+
+    def reset(self) -> None:
+        """Forget all IDs and their statistics."""
+        with self._lock:
+            self._statistics.clear()
+
+    def stop(self) -> None:
+        """Stop the background thread checking for timeouts."""
+        self._stopped.set()
+        if (
+            self._checker is not None
+            and self._checker is not threading.current_thread()
+        ):
+            self._checker.join()
@@ -0,0 +1,132 @@
+"""
+This module contains :class:`~can.filters.CompiledFilters`, a precomputed
+representation of CAN filters for fast matching in software.
+"""
+
+from collections.abc import Iterable
+from typing import Optional
+
+from can.message import Message
+from can.typechecking import CanFilters
+
+_Buckets = tuple[tuple[int, frozenset[int]], ...]
+
+
+class CompiledFilters:
+    """CAN filters that were compiled into a structure which allows matching
+    a message in time proportional to the number of *distinct masks* instead
+    of the number of filters.
+
+    A filter matches, when ``<received_can_id> & can_mask == can_id & can_mask``
+    (see :meth:`can.BusABC.set_filters`). All filters sharing the same mask are
+    therefore merged into a single bucket holding the set of accepted
+    ``can_id & can_mask`` values. Filters with a full mask thus end up in a
+    single hash set of exact identifiers. The buckets are computed separately
+    for standard and extended identifiers, such that the ``extended`` key of
+    a filter does not have to be evaluated for every message.
+
+    The compiled filters of a bus are available as
+    :attr:`can.BusABC.compiled_filters` and may be reused by interfaces
+    and listeners::
+
+        compiled = CompiledFilters([{"can_id": 0x123, "can_mask": 0x7FF}])
+        compiled.matches(can.Message(arbitration_id=0x123))  # True
+    """
+
+    __slots__ = (
+        "_extended",
+        "_match_all_extended",
+        "_match_all_standard",
+        "_standard",
+        "filters",
+    )
+
+    def __init__(self, filters: Optional[CanFilters] = None) -> None:
+        """
+        :param filters:
+            The filters to compile, see :meth:`can.BusABC.set_filters` for the format.
+            If `filters` is `None` or a zero length sequence, all messages are matched.
+        """
+        #: The filters this instance was compiled from or `None` if all messages match
+        self.filters: Optional[CanFilters] = filters or None
+
+        standard: dict[int, set[int]] = {}
+        extended: dict[int, set[int]] = {}
+        for can_filter in self.filters or ():
+            can_mask = can_filter["can_mask"]
+            can_id = can_filter["can_id"] & can_mask
+            is_extended = can_filter.get("extended")
+            if is_extended is None or is_extended:
+                extended.setdefault(can_mask, set()).add(can_id)
+            if is_extended is None or not is_extended:
+                standard.setdefault(can_mask, set()).add(can_id)
+
+        # a mask of zero accepts every identifier
+        self._match_all_standard = self.filters is None or 0 in standard
+        self._match_all_extended = self.filters is None or 0 in extended
+        self._standard = self._compile(standard)
+        self._extended = self._compile(extended)
+
+    @staticmethod
+    def _compile(buckets: dict[int, set[int]]) -> _Buckets:
+        # check the largest buckets first since they are the most likely to match
+        return tuple(
+            sorted(
+                (
+                    (can_mask, frozenset(can_ids))
+                    for can_mask, can_ids in buckets.items()
+                ),
+                key=lambda bucket: len(bucket[1]),
+                reverse=True,
+            )
+        )
+
+    @property
+    def match_all(self) -> bool:
+        """Whether every message is matched, e.g. because no filters are set."""
+        return self._match_all_standard and self._match_all_extended
+
+    def matches_id(self, arbitration_id: int, is_extended_id: bool) -> bool:
+        """Check whether the given identifier passes at least one of the filters.
+
+        :param arbitration_id: the arbitration ID to check
+        :param is_extended_id: whether the ID is an extended (29 bit) identifier
+        :return: whether the identifier matches at least one filter
+        """
+        if is_extended_id:
+            if self._match_all_extended:
+                return True
+            buckets = self._extended
+        else:
+            if self._match_all_standard:
+                return True
+            buckets = self._standard
+
+        for can_mask, can_ids in buckets:
+            if (arbitration_id & can_mask) in can_ids:
+                return True
+        return False
+
+    def matches(self, msg: Message) -> bool:
+        """Check whether the given message passes at least one of the filters.
+
+        :param msg: the message to check
+        :return: whether the message matches at least one filter
+        """
+        return self.matches_id(msg.arbitration_id, msg.is_extended_id)
+
+    def filter(self, msgs: Iterable[Message]) -> list[Message]:
+        """Return all given messages that pass at least one of the filters.
+
+        :param msgs: the messages to check
+        :return: a list of the matching messages in their original order
+        """
+        if self.match_all:
+            return list(msgs)
+        matches_id = self.matches_id
+        return [
+            msg for msg in msgs if matches_id(msg.arbitration_id, msg.is_extended_id)
+        ]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.filters!r})"
@@ -441,6 +441,10 @@ class KvaserBus(BusABC):
             Defaults to arbitration bitrate.
         :param bool no_init_access:
             Don't open the handle with init access.
+        :param bool zero_copy:
+            If the payload of received messages should refer to the receive
+            buffer instead of being copied, see :meth:`can.Message.from_buffer`.
+            The data of such messages is read-only.
         """
 
         log.info(f"CAN Filters: {can_filters}")
@@ -460,6 +464,7 @@ class KvaserBus(BusABC):
         fd = isinstance(timing, BitTimingFd) if timing else kwargs.get("fd", False)
         data_bitrate = kwargs.get("data_bitrate", None)
         fd_non_iso = kwargs.get("fd_non_iso", False)
+        self._zero_copy = kwargs.get("zero_copy", False)
 
         try:
             channel = int(channel)
@@ -678,7 +683,13 @@ class KvaserBus(BusABC):
         )
 
         if status == canstat.canOK:
-            data_array = data.raw
+            # a new buffer is allocated for every call, so it may be referenced
+            if self._zero_copy:
+                data_array = memoryview(data)
+                new_message = Message.from_buffer
+            else:
+                data_array = data.raw
+                new_message = Message
             flags = flags.value
             is_extended = bool(flags & canstat.canMSG_EXT)
             is_remote_frame = bool(flags & canstat.canMSG_RTR)
@@ -688,7 +699,7 @@ class KvaserBus(BusABC):
             bitrate_switch = bool(flags & canstat.canFDMSG_BRS)
             error_state_indicator = bool(flags & canstat.canFDMSG_ESI)
             msg_timestamp = timestamp.value * TIMESTAMP_FACTOR
-            rx_msg = Message(
+            rx_msg = new_message(
                 arbitration_id=arb_id.value,
                 data=data_array[: dlc.value],
                 dlc=dlc.value,
@@ -14,6 +14,9 @@ CAN_BCM_TX_SETUP = 1
 CAN_BCM_TX_DELETE = 2
 CAN_BCM_TX_READ = 3
 
+# The maximum number of frames of a single BCM transmission task
+CAN_BCM_MAX_NFRAMES = 256
+
 # BCM flags
 SETTIMER = 0x0001
 STARTTIMER = 0x0002
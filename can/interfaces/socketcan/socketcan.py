@@ -422,12 +422,19 @@ class CyclicSendTask(
             The rate in seconds at which to send the messages.
         :param duration:
             Approximate duration in seconds to send the messages for.
+
+        :raises ValueError:
+            If the messages are invalid or more than 256 messages are given
         """
         # The following are assigned by LimitedDurationCyclicSendTaskABC:
         #   - self.messages
         #   - self.period
         #   - self.duration
         super().__init__(messages, period, duration)
+        if len(self.messages) > constants.CAN_BCM_MAX_NFRAMES:
+            raise ValueError(
+                f"a BCM task can send at most {constants.CAN_BCM_MAX_NFRAMES} messages"
+            )
 
         self.bcm_socket = bcm_socket
         self.task_id = task_id
@@ -606,7 +613,7 @@ def bind_socket(sock: socket.socket, channel: str = "can0") -> None:
 
 
 def capture_message(
-    sock: socket.socket, get_channel: bool = False
+    sock: socket.socket, get_channel: bool = False, recv_flags: int = 0
 ) -> Optional[Message]:
     """
     Captures a message from given socket.
@@ -615,18 +622,25 @@ def capture_message(
         The socket to read a message from.
     :param get_channel:
         Find out which channel the message comes from.
+    :param recv_flags:
+        Flags passed to :meth:`socket.socket.recvmsg`. Pass
+        :data:`socket.MSG_DONTWAIT` to return immediately if no
+        message is pending.
 
-    :return: The received message, or None on failure.
+    :return: The received message, or None on failure or if no message
+             was pending in non-blocking mode.
     """
     # Fetching the Arb ID, DLC and Data
     try:
         cf, ancillary_data, msg_flags, addr = sock.recvmsg(
-            constants.CANFD_MTU, RECEIVED_ANCILLARY_BUFFER_SIZE
+            constants.CANFD_MTU, RECEIVED_ANCILLARY_BUFFER_SIZE, recv_flags
         )
         if get_channel:
             channel = addr[0] if isinstance(addr, tuple) else addr
         else:
             channel = None
+    except BlockingIOError:
+        return None
     except OSError as error:
         raise can.CanOperationError(
             f"Error receiving: {error.strerror}", error.errno
@@ -818,9 +832,7 @@ class SocketcanBus(BusABC):  # pylint: disable=abstract-method
         log.debug("Closing raw can socket")
         self.socket.close()
 
-    def _recv_internal(
-        self, timeout: Optional[float]
-    ) -> tuple[Optional[Message], bool]:
+    def _wait_for_message(self, timeout: Optional[float]) -> bool:
         try:
             # get all sockets that are ready (can be a list with a single value
             # being self.socket or an empty list if self.socket is not ready)
@@ -830,8 +842,12 @@ class SocketcanBus(BusABC):  # pylint: disable=abstract-method
             raise can.CanOperationError(
                 f"Failed to receive: {error.strerror}", error.errno
             ) from error
+        return bool(ready_receive_sockets)
 
-        if ready_receive_sockets:  # not empty
+    def _recv_internal(
+        self, timeout: Optional[float]
+    ) -> tuple[Optional[Message], bool]:
+        if self._wait_for_message(timeout):
             get_channel = self.channel == ""
             msg = capture_message(self.socket, get_channel)
             if msg and not msg.channel and self.channel:
@@ -842,6 +858,28 @@ class SocketcanBus(BusABC):  # pylint: disable=abstract-method
         # socket wasn't readable or timeout occurred
         return None, self._is_filtered
 
+    def _recv_batch_internal(
+        self, max_count: int, timeout: Optional[float]
+    ) -> tuple[list[Message], bool]:
+        msgs: list[Message] = []
+        if not self._wait_for_message(timeout):
+            # socket wasn't readable or timeout occurred
+            return msgs, self._is_filtered
+
+        # after the socket became readable, drain it without further select() calls
+        get_channel = self.channel == ""
+        msg = capture_message(self.socket, get_channel)
+        while msg is not None:
+            if not msg.channel and self.channel:
+                # Default to our own channel
+                msg.channel = self.channel
+            msgs.append(msg)
+            if len(msgs) >= max_count:
+                break
+            msg = capture_message(self.socket, get_channel, socket.MSG_DONTWAIT)
+
+        return msgs, self._is_filtered
+
     def send(self, msg: Message, timeout: Optional[float] = None) -> None:
         """Transmit a message to the CAN bus.
 
@@ -880,13 +918,110 @@ class SocketcanBus(BusABC):  # pylint: disable=abstract-method
 
         raise can.CanOperationError("Transmit buffer full")
 
-    def _send_once(self, data: bytes, channel: Optional[str] = None) -> int:
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages to the CAN bus.
+
+        All frames are packed upfront and written to the socket without
+        blocking. The transmit queue is only polled again once the kernel
+        reports that it is full.
+
+        :param msgs: The messages to send.
+        :param timeout:
+            Wait up to this many seconds for the transmit queue to be ready
+            whenever it is full. If not given, the call may return early.
+
+        :return:
+            The number of messages that were sent, starting with the first one.
+
+        :raises ~can.exceptions.CanError:
+            if not even the first message could be written.
+        """
+        if not msgs:
+            return 0
+
+        frames = [build_can_frame(msg) for msg in msgs]
+        channels = [str(msg.channel) if msg.channel else None for msg in msgs]
+        log_tx.debug("sending batch of %d messages", len(msgs))
+
+        started = time.time()
+        if timeout is None:
+            timeout = 0
+        sent = 0
+
+        while sent < len(frames):
+            try:
+                self._send_once(frames[sent], channels[sent], socket.MSG_DONTWAIT)
+            except can.CanOperationError as error:
+                if error.error_code not in (errno.EAGAIN, errno.ENOBUFS):
+                    if sent == 0:
+                        raise
+                    log_tx.debug("sent %d of %d messages: %s", sent, len(msgs), error)
+                    return sent
+
+                # the transmit queue is full, wait until it has some room again
+                time_left = timeout - (time.time() - started)
+                if (
+                    time_left < 0
+                    or not select.select([], [self.socket], [], time_left)[1]
+                ):
+                    if sent == 0:
+                        raise can.CanOperationError("Transmit buffer full") from error
+                    return sent
+            else:
+                sent += 1
+
+        return sent
+
+    async def asend(self, msg: Message, timeout: Optional[float] = None) -> None:
+        """Transmit a message to the CAN bus without blocking the running
+        :mod:`asyncio` event loop.
+
+        The frame is written to the socket without blocking. If the transmit
+        queue is full, the event loop waits for the socket to become writable.
+
+        :param msg: A message object.
+        :param timeout:
+            Wait up to this many seconds for the transmit queue to be ready.
+            If not given, the call may fail immediately.
+
+        :raises ~can.exceptions.CanError:
+            if the message could not be written.
+        """
+        log_tx.debug("sending: %s", msg)
+
+        started = time.time()
+        if timeout is None:
+            timeout = 0
+        data = build_can_frame(msg)
+        channel = str(msg.channel) if msg.channel else None
+
+        while True:
+            try:
+                self._send_once(data, channel, socket.MSG_DONTWAIT)
+            except can.CanOperationError as error:
+                if error.error_code not in (errno.EAGAIN, errno.ENOBUFS):
+                    raise
+
+                # the transmit queue is full, wait until it has some room again
+                time_left = timeout - (time.time() - started)
+                if time_left < 0 or not await self._wait_for_fd(
+                    self.socket.fileno(), time_left, write=True
+                ):
+                    raise can.CanOperationError("Transmit buffer full") from error
+            else:
+                return
+
+    def _send_once(
+        self, data: bytes, channel: Optional[str] = None, flags: int = 0
+    ) -> int:
         try:
             if self.channel == "" and channel:
                 # Message must be addressed to a specific channel
-                sent = self.socket.sendto(data, (channel,))
+                sent = self.socket.sendto(data, flags, (channel,))
             else:
-                sent = self.socket.send(data)
+                sent = self.socket.send(data, flags)
         except OSError as error:
             raise can.CanOperationError(
                 f"Failed to transmit: {error.strerror}", error.errno
@@ -920,6 +1055,11 @@ class SocketcanBus(BusABC):  # pylint: disable=abstract-method
             If True (the default) the sending task will immediately start after creation.
             Otherwise, the task has to be started by calling the
             tasks :meth:`~can.RestartableCyclicTaskABC.start` method on it.
+        :param modifier_callback:
+            Function which should be used to modify each message's data before
+            sending. A thread based task is used in this case. Messages which
+            can be calculated in advance, e.g. with
+            :meth:`~can.CyclicModifiers.render`, are sent by the kernel instead.
 
         :raises ValueError:
             If task identifier passed to :class:`CyclicSendTask` can't be used
@@ -359,6 +359,30 @@ class SocketCanDaemonBus(can.BusABC):
         ascii_msg = convert_can_message_to_ascii_message(msg)
         self._tcp_send(ascii_msg)
 
+    async def asend(self, msg, timeout=None):
+        """Transmit a message to the CAN bus without blocking the running
+        :mod:`asyncio` event loop.
+
+        :param msg: A message object.
+        :param timeout: Ignored
+        """
+        if not hasattr(socket, "MSG_DONTWAIT"):
+            # non-blocking sends are not available on this platform
+            await super().asend(msg, timeout)
+            return
+
+        data = convert_can_message_to_ascii_message(msg).encode("ascii")
+        log.debug(f"Sending TCP Message: '{data!r}'")
+        while data:
+            try:
+                sent = self.__socket.send(data, socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                await self._wait_for_fd(self.__socket.fileno(), None, write=True)
+            else:
+                data = data[sent:]
+        if self.__tcp_tune:
+            self.__socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
     def shutdown(self):
         """Stops all active periodic tasks and closes the socket."""
         super().shutdown()
@@ -6,13 +6,15 @@ import socket
 import struct
 import time
 import warnings
+from collections import deque
+from collections.abc import Sequence
 from typing import Any, Optional, Union
 
 import can
 from can import BusABC, CanProtocol, Message
 from can.typechecking import AutoDetectedConfig
 
-from .utils import is_msgpack_installed, pack_message, unpack_message
+from .utils import is_msgpack_installed, pack_message, pack_messages, unpack_messages
 
 is_linux = platform.system() == "Linux"
 if is_linux:
@@ -113,6 +115,8 @@ class UdpMulticastBus(BusABC):
         )
 
         self._multicast = GeneralPurposeUdpMulticastBus(channel, port, hop_limit)
+        # messages of a received datagram which were not yet returned
+        self._pending: deque[Message] = deque()
         self._can_protocol = CanProtocol.CAN_FD if fd else CanProtocol.CAN_20
 
     @property
@@ -129,13 +133,44 @@ class UdpMulticastBus(BusABC):
     def _recv_internal(
         self, timeout: Optional[float]
     ) -> tuple[Optional[Message], bool]:
+        if self._pending:
+            return self._pending.popleft(), False
+
         result = self._multicast.recv(timeout)
         if not result:
             return None, False
 
+        self._pending.extend(self._decode(result))
+        if self._pending:
+            return self._pending.popleft(), False
+        return None, False
+
+    def _recv_batch_internal(
+        self, max_count: int, timeout: Optional[float]
+    ) -> tuple[list[Message], bool]:
+        msgs: list[Message] = []
+        while self._pending and len(msgs) < max_count:
+            msgs.append(self._pending.popleft())
+        if msgs:
+            return msgs, False
+
+        # wait for the first datagram only and then read all pending ones
+        result = self._multicast.recv(timeout)
+        while result:
+            msgs += self._decode(result)
+            if len(msgs) >= max_count:
+                # keep the surplus of the last datagram for the next call
+                self._pending.extend(msgs[max_count:])
+                del msgs[max_count:]
+                break
+            result = self._multicast.recv(0.0)
+
+        return msgs, False
+
+    def _decode(self, result: tuple[bytes, IP_ADDRESS_INFO, float]) -> list[Message]:
         data, _, timestamp = result
         try:
-            can_message = unpack_message(
+            can_messages = unpack_messages(
                 data, replace={"timestamp": timestamp}, check=True
             )
         except Exception as exception:
@@ -143,10 +178,10 @@ class UdpMulticastBus(BusABC):
                 "could not unpack received message"
             ) from exception
 
-        if self._can_protocol is not CanProtocol.CAN_FD and can_message.is_fd:
-            return None, False
+        if self._can_protocol is not CanProtocol.CAN_FD:
+            return [msg for msg in can_messages if not msg.is_fd]
 
-        return can_message, False
+        return can_messages
 
     def send(self, msg: can.Message, timeout: Optional[float] = None) -> None:
         if self._can_protocol is not CanProtocol.CAN_FD and msg.is_fd:
@@ -157,6 +192,69 @@ class UdpMulticastBus(BusABC):
         data = pack_message(msg)
         self._multicast.send(data, timeout)
 
+    async def asend(self, msg: can.Message, timeout: Optional[float] = None) -> None:
+        """Send a message without blocking the running :mod:`asyncio` event loop.
+
+        The datagram is written to the socket without blocking. If the socket
+        buffer is full, the event loop waits for the socket to become writable.
+        """
+        if self._can_protocol is not CanProtocol.CAN_FD and msg.is_fd:
+            raise can.CanOperationError(
+                "cannot send FD message over bus with CAN FD disabled"
+            )
+
+        data = pack_message(msg)
+        started = time.time()
+        while True:
+            try:
+                self._multicast.send(data, 0.0)
+            except can.CanOperationError as error:
+                if not isinstance(error.__cause__, BlockingIOError):
+                    raise
+
+                time_left = (
+                    None if timeout is None else timeout - (time.time() - started)
+                )
+                if (
+                    time_left is not None and time_left < 0
+                ) or not await self._wait_for_fd(self.fileno(), time_left, write=True):
+                    raise can.CanTimeoutError() from error
+            else:
+                return
+
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages, packing as many of them as possible
+        into each datagram.
+
+        .. note::
+            Datagrams holding more than one message can only be decoded by
+            receivers running a python-can version that also provides this
+            method. Use :meth:`send` to communicate with older versions.
+
+        :return:
+            The number of messages that were sent, starting with the first one.
+        """
+        if self._can_protocol is not CanProtocol.CAN_FD and any(
+            msg.is_fd for msg in msgs
+        ):
+            raise can.CanOperationError(
+                "cannot send FD message over bus with CAN FD disabled"
+            )
+
+        sent = 0
+        for data, count in pack_messages(msgs, self._multicast.max_buffer):
+            try:
+                self._multicast.send(data, timeout)
+            except can.CanError as error:
+                if sent == 0:
+                    raise
+                log.debug("Sent %d of %d messages: %s", sent, len(msgs), error)
+                break
+            sent += count
+        return sent
+
     def fileno(self) -> int:
         """Provides the internally used file descriptor of the socket or `-1` if not available."""
         return self._multicast.fileno()
@@ -2,6 +2,7 @@
 Defines common functions.
 """
 
+from collections.abc import Sequence
 from typing import Any, Optional, cast
 
 from can import CanInterfaceNotImplementedError, Message
@@ -31,14 +32,8 @@ def is_msgpack_installed(raise_exception: bool = True) -> bool:
     return True
 
 
-def pack_message(message: Message) -> bytes:
-    """
-    Pack a can.Message into a msgpack byte blob.
-
-    :param message: the message to be packed
-    """
-    is_msgpack_installed()
-    as_dict = {
+def _message_to_dict(message: Message) -> dict[str, Any]:
+    return {
         "timestamp": message.timestamp,
         "arbitration_id": message.arbitration_id,
         "is_extended_id": message.is_extended_id,
@@ -51,7 +46,57 @@ def pack_message(message: Message) -> bytes:
         "bitrate_switch": message.bitrate_switch,
         "error_state_indicator": message.error_state_indicator,
     }
-    return cast("bytes", msgpack.packb(as_dict, use_bin_type=True))
+
+
+def pack_message(message: Message) -> bytes:
+    """
+    Pack a can.Message into a msgpack byte blob.
+
+    :param message: the message to be packed
+    """
+    is_msgpack_installed()
+    return cast("bytes", msgpack.packb(_message_to_dict(message), use_bin_type=True))
+
+
+def pack_messages(
+    messages: Sequence[Message], max_size: int
+) -> list[tuple[bytes, int]]:
+    """
+    Pack several can.Message objects into as few msgpack byte blobs as possible.
+
+    Each blob holds a msgpack array of messages and is at most *max_size* bytes
+    long, unless a single message does not fit into *max_size* bytes. A blob
+    holding only a single message is encoded exactly like by :func:`pack_message`.
+
+    :param messages: the messages to be packed
+    :param max_size: the maximum size of each blob in bytes
+    :return: a list of tuples of a blob and the number of messages it contains
+    """
+    is_msgpack_installed()
+    packer = msgpack.Packer(use_bin_type=True)
+    packed_messages = [packer.pack(_message_to_dict(msg)) for msg in messages]
+
+    # reserve space for the largest header of an array with up to 2**16-1 elements
+    max_payload = max_size - 3
+    blobs: list[tuple[bytes, int]] = []
+    chunk: list[bytes] = []
+    chunk_size = 0
+    for packed in packed_messages:
+        if chunk and (chunk_size + len(packed) > max_payload or len(chunk) == 0xFFFF):
+            blobs.append((_join_chunk(packer, chunk), len(chunk)))
+            chunk = []
+            chunk_size = 0
+        chunk.append(packed)
+        chunk_size += len(packed)
+    if chunk:
+        blobs.append((_join_chunk(packer, chunk), len(chunk)))
+    return blobs
+
+
+def _join_chunk(packer: "msgpack.Packer", chunk: list[bytes]) -> bytes:
+    if len(chunk) == 1:
+        return chunk[0]
+    return cast("bytes", packer.pack_array_header(len(chunk))) + b"".join(chunk)
 
 
 def unpack_message(
@@ -75,3 +120,33 @@ def unpack_message(
     if replace is not None:
         as_dict.update(replace)
     return Message(check=check, **as_dict)
+
+
+def unpack_messages(
+    data: ReadableBytesLike,
+    replace: Optional[dict[str, Any]] = None,
+    check: bool = False,
+) -> list[Message]:
+    """Unpack all can.Message objects from a msgpack byte blob.
+
+    The blob may either hold a single message as created by :func:`pack_message`
+    or an array of messages as created by :func:`pack_messages`.
+
+    :param data: the raw data
+    :param replace: a mapping from field names to values to be replaced after decoding the new messages,
+                    or `None` to disable this feature
+    :param check: this is passed to :meth:`can.Message.__init__` to specify whether to validate the messages
+
+    :raise TypeError: if the data contains key that are not valid arguments for :meth:`can.Message.__init__`
+    :raise ValueError: if `check` is true and the message metadata is invalid in some way
+    :raise Exception: if there was another problem while unpacking
+    """
+    is_msgpack_installed()
+    unpacked = msgpack.unpackb(data, raw=False)
+    as_dicts = unpacked if isinstance(unpacked, list) else [unpacked]
+    messages = []
+    for as_dict in as_dicts:
+        if replace is not None:
+            as_dict.update(replace)
+        messages.append(Message(check=check, **as_dict))
+    return messages
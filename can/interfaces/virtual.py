@@ -9,7 +9,7 @@ and reside in the same process will receive the same messages.
 import logging
 import queue
 import time
-from copy import deepcopy
+from collections.abc import Sequence
 from random import randint
 from threading import RLock
 from typing import Any, Final, Optional
@@ -129,6 +129,25 @@ class VirtualBus(BusABC):
         else:
             return msg, False
 
+    def _recv_batch_internal(
+        self, max_count: int, timeout: Optional[float]
+    ) -> tuple[list[Message], bool]:
+        self._check_if_open()
+        try:
+            msgs = [self.queue.get(block=True, timeout=timeout)]
+        except queue.Empty:
+            return [], False
+
+        # take all further messages at once instead of locking the queue for each one
+        bus_queue = self.queue
+        with bus_queue.mutex:
+            count = min(max_count - 1, len(bus_queue.queue))
+            for _ in range(count):
+                msgs.append(bus_queue.queue.popleft())
+            if count:
+                bus_queue.not_full.notify(count)
+        return msgs, False
+
     def send(self, msg: Message, timeout: Optional[float] = None) -> None:
         self._check_if_open()
 
@@ -138,7 +157,8 @@ class VirtualBus(BusABC):
         for bus_queue in self.channel:
             if bus_queue is self.queue and not self.receive_own_messages:
                 continue
-            msg_copy = deepcopy(msg)
+            # the channel is replaced, so only the data has to be copied
+            msg_copy = msg._clone(bytearray(msg.data))
             msg_copy.timestamp = timestamp
             msg_copy.channel = self.channel_id
             msg_copy.is_rx = bus_queue is not self.queue
@@ -150,6 +170,49 @@ class VirtualBus(BusABC):
         if not all_sent:
             raise CanOperationError("Could not send message to one or more recipients")
 
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        """Transmit several messages to all receivers on this channel.
+
+        The messages share a single timestamp. Like with :meth:`send`, each
+        message is put into the queues of all receivers before the next one,
+        such that the returned prefix of *msgs* was delivered to every receiver.
+        A message which did not fit into the queue of some receiver may still
+        have been delivered to the others.
+
+        :return:
+            The number of messages that were delivered to every receiver.
+        """
+        self._check_if_open()
+
+        now = time.time()
+        receivers = [
+            (bus_queue, bus_queue is not self.queue)
+            for bus_queue in self.channel
+            if bus_queue is not self.queue or self.receive_own_messages
+        ]
+        for index, msg in enumerate(msgs):
+            timestamp = msg.timestamp if self.preserve_timestamps else now
+            all_sent = True
+            for bus_queue, is_rx in receivers:
+                msg_copy = msg._clone(bytearray(msg.data))
+                msg_copy.timestamp = timestamp
+                msg_copy.channel = self.channel_id
+                msg_copy.is_rx = is_rx
+                try:
+                    bus_queue.put(msg_copy, block=True, timeout=timeout)
+                except queue.Full:
+                    all_sent = False
+
+            if not all_sent:
+                if index == 0:
+                    raise CanOperationError(
+                        "Could not send message to one or more recipients"
+                    )
+                return index
+        return len(msgs)
+
     def shutdown(self) -> None:
         super().shutdown()
         if self._open:
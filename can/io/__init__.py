@@ -40,18 +40,84 @@ __all__ = [
     "trc",
 ]
 
-# Generic
-from .logger import MESSAGE_WRITERS, BaseRotatingLogger, Logger, SizedRotatingLogger
-from .player import MESSAGE_READERS, LogReader, MessageSync
-
-# isort: split
-
-# Format specific
-from .asc import ASCReader, ASCWriter
-from .blf import BLFReader, BLFWriter
-from .canutils import CanutilsLogReader, CanutilsLogWriter
-from .csv import CSVReader, CSVWriter
-from .mf4 import MF4Reader, MF4Writer
-from .printer import Printer
-from .sqlite import SqliteReader, SqliteWriter
-from .trc import TRCFileVersion, TRCReader, TRCWriter
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import (
+        asc,
+        blf,
+        canutils,
+        csv,
+        generic,
+        logger,
+        mf4,
+        player,
+        printer,
+        sqlite,
+        trc,
+    )
+    from .asc import ASCReader, ASCWriter
+    from .blf import BLFReader, BLFWriter
+    from .canutils import CanutilsLogReader, CanutilsLogWriter
+    from .csv import CSVReader, CSVWriter
+    from .logger import (
+        MESSAGE_WRITERS,
+        BaseRotatingLogger,
+        Logger,
+        SizedRotatingLogger,
+    )
+    from .mf4 import MF4Reader, MF4Writer
+    from .player import MESSAGE_READERS, LogReader, MessageSync
+    from .printer import Printer
+    from .sqlite import SqliteReader, SqliteWriter
+    from .trc import TRCFileVersion, TRCReader, TRCWriter
+
+# The readers and writers are only imported on first access, since some formats
+# pull in heavy dependencies (e.g. asammdf for MF4): name => module
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    # Generic
+    "MESSAGE_WRITERS": "logger",
+    "BaseRotatingLogger": "logger",
+    "Logger": "logger",
+    "SizedRotatingLogger": "logger",
+    "MESSAGE_READERS": "player",
+    "LogReader": "player",
+    "MessageSync": "player",
+    # Format specific
+    "ASCReader": "asc",
+    "ASCWriter": "asc",
+    "BLFReader": "blf",
+    "BLFWriter": "blf",
+    "CanutilsLogReader": "canutils",
+    "CanutilsLogWriter": "canutils",
+    "CSVReader": "csv",
+    "CSVWriter": "csv",
+    "MF4Reader": "mf4",
+    "MF4Writer": "mf4",
+    "Printer": "printer",
+    "SqliteReader": "sqlite",
+    "SqliteWriter": "sqlite",
+    "TRCFileVersion": "trc",
+    "TRCReader": "trc",
+    "TRCWriter": "trc",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__)
+        value = getattr(module, name)
+    elif name in __all__:
+        # a submodule
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # cache the value such that this function is not called again
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,498 @@
+"""
+Conversion of message streams from and to `NumPy <https://numpy.org/>`__ arrays
+for offline analysis.
+
+A stream is represented either as a dictionary of column arrays or as a single
+structured array with the dtype :data:`MESSAGE_DTYPE`. Both have the fields
+
+* ``timestamp`` (``float64``),
+* ``arbitration_id`` (``uint32``),
+* ``dlc`` (``uint8``),
+* ``flags`` (``uint8``, see the ``FLAG_*`` constants of :mod:`can.message`),
+* ``length`` (``uint8``, the number of valid bytes in ``data``),
+* ``channel`` (``int32``, ``-1`` if the channel is unknown) and
+* ``data`` (``uint8`` with 64 bytes per message, zero padded).
+"""
+
+import logging
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from ..batch import MessageBatch
+from ..message import (
+    FLAG_BITRATE_SWITCH,
+    FLAG_ERROR_FRAME,
+    FLAG_ERROR_STATE_INDICATOR,
+    FLAG_EXTENDED_ID,
+    FLAG_FD,
+    FLAG_REMOTE_FRAME,
+    FLAG_RX,
+    Message,
+)
+from ..typechecking import StringPathLike
+from ..util import CAN_FD_DLC, channel2int
+from . import blf
+from .blf import BLFParseError, BLFReader
+from .logger import Logger
+from .mf4 import MF4Reader
+from .player import LogReader
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+logger = logging.getLogger("can.io.arrays")
+
+try:
+    import numpy as np
+
+    MESSAGE_DTYPE = np.dtype(
+        [
+            ("timestamp", "<f8"),
+            ("arbitration_id", "<u4"),
+            ("dlc", "u1"),
+            ("flags", "u1"),
+            ("length", "u1"),
+            ("channel", "<i4"),
+            ("data", "u1", (64,)),
+        ]
+    )
+
+    # lookup table of the payload length of all possible CAN FD DLC values
+    _DLC_TO_LENGTH = np.array(
+        [CAN_FD_DLC[dlc] if dlc < len(CAN_FD_DLC) else 64 for dlc in range(256)],
+        dtype=np.uint8,
+    )
+except ImportError:
+    np = None  # type: ignore[assignment]
+    MESSAGE_DTYPE = None  # type: ignore[assignment]
+
+_FIELD_NAMES = (
+    "timestamp",
+    "arbitration_id",
+    "dlc",
+    "flags",
+    "length",
+    "channel",
+    "data",
+)
+
+#: A dictionary of column arrays, see :mod:`can.io.arrays`
+Columns = dict[str, "npt.NDArray[Any]"]
+
+
+def _check_numpy() -> None:
+    if np is None:
+        raise NotImplementedError(
+            "The numpy package was not found. Install python-can with "
+            "the optional dependency [numpy] to use can.io.arrays."
+        )
+
+
+def _empty_columns(count: int) -> Columns:
+    return {
+        name: np.zeros((count, *MESSAGE_DTYPE[name].shape), MESSAGE_DTYPE[name].base)
+        for name in _FIELD_NAMES
+    }
+
+
+def _concatenate(parts: list[Columns]) -> Columns:
+    if not parts:
+        return _empty_columns(0)
+    if len(parts) == 1:
+        return parts[0]
+    return {
+        name: np.concatenate([part[name] for part in parts]) for name in _FIELD_NAMES
+    }
+
+
+def _select(columns: Columns, index: "npt.NDArray[Any]") -> Columns:
+    return {name: column[index] for name, column in columns.items()}
+
+
+def _as_columns(data: Union[Columns, "npt.NDArray[Any]"]) -> Columns:
+    if isinstance(data, dict):
+        return data
+    return {name: data[name] for name in _FIELD_NAMES}
+
+
+def messages_to_columns(messages: Iterable[Message]) -> Columns:
+    """Convert messages to a dictionary of column arrays.
+
+    :param messages: the messages to convert, e.g. a :class:`~can.MessageBatch`
+    """
+    _check_numpy()
+    batch = messages if isinstance(messages, MessageBatch) else MessageBatch(messages)
+    count = len(batch)
+
+    channel_table = np.array(
+        [
+            -1 if (number := channel2int(channel)) is None else number
+            for channel in batch.channels
+        ],
+        dtype=np.int32,
+    )
+    channel_indices = np.frombuffer(batch.channel_indices, dtype=np.uint16)
+
+    return {
+        "timestamp": np.frombuffer(batch.timestamps, dtype=np.float64).copy(),
+        "arbitration_id": np.frombuffer(batch.arbitration_ids, np.uint32).copy(),
+        "dlc": np.frombuffer(batch.dlcs, dtype=np.uint8).copy(),
+        "flags": np.frombuffer(batch.flags, dtype=np.uint8).copy(),
+        "length": np.frombuffer(batch.data_lengths, dtype=np.uint8).copy(),
+        "channel": (channel_table[channel_indices] if count else np.zeros(0, np.int32)),
+        "data": np.frombuffer(batch.data, dtype=np.uint8).reshape(count, 64).copy(),
+    }
+
+
+def columns_to_array(columns: Columns) -> "npt.NDArray[Any]":
+    """Combine a dictionary of column arrays into a structured array
+    with the dtype :data:`MESSAGE_DTYPE`."""
+    _check_numpy()
+    array = np.empty(len(columns["timestamp"]), dtype=MESSAGE_DTYPE)
+    for name in _FIELD_NAMES:
+        array[name] = columns[name]
+    return array
+
+
+def columns_to_messages(
+    data: Union[Columns, "npt.NDArray[Any]"],
+) -> Iterator[Message]:
+    """Convert column arrays or a structured array back to messages.
+
+    :param data:
+        a dictionary of column arrays or a structured array with the
+        fields of :data:`MESSAGE_DTYPE`
+    """
+    _check_numpy()
+    columns = _as_columns(data)
+    payloads = columns["data"]
+    for index, (timestamp, arbitration_id, dlc, flags, length, channel) in enumerate(
+        zip(
+            columns["timestamp"].tolist(),
+            columns["arbitration_id"].tolist(),
+            columns["dlc"].tolist(),
+            columns["flags"].tolist(),
+            columns["length"].tolist(),
+            columns["channel"].tolist(),
+        )
+    ):
+        yield Message(
+            timestamp=timestamp,
+            arbitration_id=arbitration_id,
+            is_extended_id=bool(flags & FLAG_EXTENDED_ID),
+            is_remote_frame=bool(flags & FLAG_REMOTE_FRAME),
+            is_error_frame=bool(flags & FLAG_ERROR_FRAME),
+            channel=None if channel < 0 else channel,
+            dlc=dlc,
+            data=payloads[index, :length].tobytes(),
+            is_fd=bool(flags & FLAG_FD),
+            is_rx=bool(flags & FLAG_RX),
+            bitrate_switch=bool(flags & FLAG_BITRATE_SWITCH),
+            error_state_indicator=bool(flags & FLAG_ERROR_STATE_INDICATOR),
+        )
+
+
+def read_columns(filename: StringPathLike, **kwargs: Any) -> Columns:
+    """Read a log file of any supported format into a dictionary of column arrays.
+
+    BLF and MF4 files are decoded in bulk without creating a
+    :class:`~can.Message` for every frame. All other formats are read with
+    :func:`~can.LogReader`.
+
+    :param filename: the file to read, see :func:`~can.LogReader`
+    :param kwargs: passed on to the reader
+    """
+    _check_numpy()
+    with LogReader(filename, **kwargs) as reader:
+        if isinstance(reader, BLFReader):
+            return _read_blf_columns(reader)
+        if isinstance(reader, MF4Reader):
+            return _read_mf4_columns(reader)
+        return messages_to_columns(reader)
+
+
+def read_array(filename: StringPathLike, **kwargs: Any) -> "npt.NDArray[Any]":
+    """Read a log file of any supported format into a structured array
+    with the dtype :data:`MESSAGE_DTYPE`.
+
+    See :func:`read_columns` for the parameters.
+    """
+    return columns_to_array(read_columns(filename, **kwargs))
+
+
+def write_array(
+    filename: StringPathLike,
+    data: Union[Columns, "npt.NDArray[Any]"],
+    **kwargs: Any,
+) -> None:
+    """Write column arrays or a structured array to a log file using
+    :class:`~can.Logger`.
+
+    :param filename: the file to write, see :class:`~can.Logger`
+    :param data:
+        a dictionary of column arrays or a structured array with the
+        fields of :data:`MESSAGE_DTYPE`
+    :param kwargs: passed on to the writer
+    """
+    _check_numpy()
+    with Logger(filename, **kwargs) as writer:
+        for msg in columns_to_messages(data):
+            writer.on_message_received(msg)
+
+
+def _read_blf_columns(reader: BLFReader) -> Columns:
+    parts: list[Columns] = []
+    tail = b""
+    for container in reader._iter_containers():
+        data = b"".join((tail, container)) if tail else container
+        position, columns = _parse_blf_data(reader, data)
+        parts.append(columns)
+        tail = data[position:]
+    return _concatenate(parts)
+
+
+def _parse_blf_data(reader: BLFReader, data: bytes) -> tuple[int, Columns]:
+    """Decode all complete objects of a log container.
+
+    Only the positions of the objects are determined in Python. The fields
+    of classic and CAN FD messages are then gathered with vectorized NumPy
+    operations. All other objects are decoded by the reader itself.
+
+    :return: the position of the first incomplete object and the columns
+    """
+    unpack_obj_header_base = blf.OBJ_HEADER_BASE_STRUCT.unpack_from
+    obj_header_base_size = blf.OBJ_HEADER_BASE_STRUCT.size
+
+    can_positions: list[int] = []
+    can_order: list[int] = []
+    fd_positions: list[int] = []
+    fd_order: list[int] = []
+    other_messages: list[Message] = []
+    other_order: list[int] = []
+
+    max_pos = len(data)
+    pos = 0
+    index = 0
+    while True:
+        # Find next object after padding (depends on object type)
+        try:
+            pos = data.index(b"LOBJ", pos, pos + 8)
+        except ValueError:
+            if pos + 8 > max_pos:
+                # Not enough data in container
+                break
+            raise BLFParseError("Could not find next object") from None
+        if pos + obj_header_base_size > max_pos:
+            break
+        _, _, header_version, obj_size, obj_type = unpack_obj_header_base(data, pos)
+        next_pos = pos + obj_size
+        if next_pos > max_pos:
+            # This object continues in the next container
+            break
+
+        if header_version not in (1, 2):
+            logger.warning("Unknown object header version (%d)", header_version)
+        elif obj_type in (blf.CAN_MESSAGE, blf.CAN_MESSAGE2):
+            can_order.append(index)
+            can_positions.append(pos)
+            index += 1
+        elif obj_type == blf.CAN_FD_MESSAGE:
+            fd_order.append(index)
+            fd_positions.append(pos)
+            index += 1
+        elif obj_type in (blf.CAN_ERROR_EXT, blf.CAN_FD_MESSAGE_64):
+            for msg in reader._parse_data(data[pos:next_pos]):
+                other_order.append(index)
+                other_messages.append(msg)
+                index += 1
+        pos = next_pos
+
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    parts = [
+        _blf_can_columns(reader, buffer, np.array(can_positions, dtype=np.intp)),
+        _blf_fd_columns(reader, buffer, np.array(fd_positions, dtype=np.intp)),
+        messages_to_columns(other_messages),
+    ]
+    columns = _concatenate(parts)
+    order = np.argsort(np.array(can_order + fd_order + other_order), kind="stable")
+    return pos, _select(columns, order)
+
+
+def _gather(
+    buffer: "npt.NDArray[np.uint8]", offsets: "npt.NDArray[np.intp]", dtype: str
+) -> "npt.NDArray[Any]":
+    """Read a value of the given little endian `dtype` at each of the offsets."""
+    size = np.dtype(dtype).itemsize
+    values: npt.NDArray[Any] = buffer[offsets[:, None] + np.arange(size)].view(dtype)
+    return values[:, 0]
+
+
+def _blf_columns(
+    reader: BLFReader,
+    buffer: "npt.NDArray[np.uint8]",
+    positions: "npt.NDArray[np.intp]",
+    header_version: "npt.NDArray[np.uint16]",
+) -> tuple[Columns, "npt.NDArray[np.intp]"]:
+    """Decode the object headers and return the partially filled columns as
+    well as the offsets of the object specific data."""
+    columns = _empty_columns(len(positions))
+    # flags and timestamp are at the same offsets in both header versions
+    obj_header_base_size = blf.OBJ_HEADER_BASE_STRUCT.size
+    timestamp_flags = _gather(buffer, positions + obj_header_base_size, "<u4")
+    timestamp = _gather(buffer, positions + obj_header_base_size + 8, "<u8")
+    factor = np.where(timestamp_flags == blf.TIME_TEN_MICS, 1e-5, 1e-9)
+    columns["timestamp"][:] = timestamp * factor + reader.start_timestamp
+
+    header_size = np.where(
+        header_version == 1,
+        obj_header_base_size + blf.OBJ_HEADER_V1_STRUCT.size,
+        obj_header_base_size + blf.OBJ_HEADER_V2_STRUCT.size,
+    )
+    return columns, positions + header_size
+
+
+def _blf_can_columns(
+    reader: BLFReader,
+    buffer: "npt.NDArray[np.uint8]",
+    positions: "npt.NDArray[np.intp]",
+) -> Columns:
+    header_version = _gather(buffer, positions + 6, "<u2")
+    columns, offsets = _blf_columns(reader, buffer, positions, header_version)
+
+    # channel, flags, dlc, arbitration id, data
+    channel = _gather(buffer, offsets, "<u2")
+    flags = buffer[offsets + 2]
+    dlc = buffer[offsets + 3]
+    can_id = _gather(buffer, offsets + 4, "<u4")
+    is_remote = (flags & blf.REMOTE_FLAG) != 0
+
+    columns["arbitration_id"][:] = can_id & 0x1FFFFFFF
+    columns["dlc"][:] = dlc
+    columns["flags"][:] = (
+        np.where(can_id & blf.CAN_MSG_EXT, FLAG_EXTENDED_ID, 0)
+        | np.where(is_remote, FLAG_REMOTE_FRAME, 0)
+        | np.where(flags & blf.DIR, 0, FLAG_RX)
+    )
+    columns["length"][:] = np.where(is_remote, 0, np.minimum(dlc, 8))
+    columns["channel"][:] = channel.astype(np.int32) - 1
+    columns["data"][:, :8] = buffer[
+        (offsets + blf.CAN_MSG_DATA_OFFSET)[:, None] + np.arange(8)
+    ]
+    _clear_padding(columns)
+    return columns
+
+
+def _blf_fd_columns(
+    reader: BLFReader,
+    buffer: "npt.NDArray[np.uint8]",
+    positions: "npt.NDArray[np.intp]",
+) -> Columns:
+    header_version = _gather(buffer, positions + 6, "<u2")
+    columns, offsets = _blf_columns(reader, buffer, positions, header_version)
+
+    # channel, flags, dlc, arbitration id, frame length, bit count, FD flags,
+    # valid data bytes, data
+    channel = _gather(buffer, offsets, "<u2")
+    flags = buffer[offsets + 2]
+    dlc = buffer[offsets + 3]
+    can_id = _gather(buffer, offsets + 4, "<u4")
+    fd_flags = buffer[offsets + 13]
+    valid_bytes = buffer[offsets + 14]
+    is_remote = (flags & blf.REMOTE_FLAG) != 0
+
+    columns["arbitration_id"][:] = can_id & 0x1FFFFFFF
+    columns["dlc"][:] = _DLC_TO_LENGTH[dlc]
+    columns["flags"][:] = (
+        np.where(can_id & blf.CAN_MSG_EXT, FLAG_EXTENDED_ID, 0)
+        | np.where(is_remote, FLAG_REMOTE_FRAME, 0)
+        | np.where(fd_flags & blf.EDL, FLAG_FD, 0)
+        | np.where(fd_flags & blf.BRS, FLAG_BITRATE_SWITCH, 0)
+        | np.where(fd_flags & blf.ESI, FLAG_ERROR_STATE_INDICATOR, 0)
+        | np.where(flags & blf.DIR, 0, FLAG_RX)
+    )
+    columns["length"][:] = np.where(is_remote, 0, np.minimum(valid_bytes, 64))
+    columns["channel"][:] = channel.astype(np.int32) - 1
+    columns["data"][:] = buffer[
+        (offsets + blf.CAN_FD_MSG_DATA_OFFSET)[:, None] + np.arange(64)
+    ]
+    _clear_padding(columns)
+    return columns
+
+
+def _clear_padding(columns: Columns) -> None:
+    """Set all bytes of the data matrix beyond the valid length to zero."""
+    columns["data"] *= np.arange(64) < columns["length"][:, None]
+
+
+def _read_mf4_columns(reader: MF4Reader) -> Columns:
+    parts = []
+    for frame_iterator in reader._frame_iterators():
+        # read the whole channel group at once instead of in chunks
+        signal = reader._mdf.get(
+            frame_iterator._name, frame_iterator._group_index, raw=False
+        )
+        parts.append(
+            _mf4_signal_columns(
+                frame_iterator._name, signal, frame_iterator._start_timestamp
+            )
+        )
+
+    columns = _concatenate(parts)
+    # the channel groups are sorted individually, merge them by timestamp
+    return _select(columns, np.argsort(columns["timestamp"], kind="stable"))
+
+
+def _mf4_signal_columns(name: str, signal: Any, start_timestamp: float) -> Columns:
+    count = len(signal)
+    columns = _empty_columns(count)
+    names = signal.samples.dtype.names if count else ()
+
+    def field(field_name: str) -> Optional["npt.NDArray[Any]"]:
+        key = f"{name}.{field_name}"
+        return signal[key] if key in names else None
+
+    columns["timestamp"][:] = signal.timestamps + start_timestamp
+
+    flags = np.full(count, FLAG_EXTENDED_ID | FLAG_RX, dtype=np.uint8)
+    if name == "CAN_ErrorFrame":
+        flags |= FLAG_ERROR_FRAME
+    elif name == "CAN_RemoteFrame":
+        flags |= FLAG_REMOTE_FRAME
+
+    flag_fields = [("IDE", FLAG_EXTENDED_ID)]
+    if name != "CAN_RemoteFrame":
+        flag_fields += [
+            ("EDL", FLAG_FD),
+            ("BRS", FLAG_BITRATE_SWITCH),
+            ("ESI", FLAG_ERROR_STATE_INDICATOR),
+        ]
+    if name == "CAN_ErrorFrame":
+        flag_fields.append(("RTR", FLAG_REMOTE_FRAME))
+    for field_name, flag in flag_fields:
+        values = field(field_name)
+        if values is not None:
+            flags = np.where(values != 0, flags | flag, flags & ~np.uint8(flag))
+    direction = field("Dir")
+    if direction is not None:
+        flags = np.where(direction == 0, flags | FLAG_RX, flags & ~np.uint8(FLAG_RX))
+    columns["flags"][:] = flags
+
+    arbitration_id = field("ID")
+    if arbitration_id is not None:
+        columns["arbitration_id"][:] = arbitration_id & 0x1FFFFFFF
+    channel = field("BusChannel")
+    columns["channel"][:] = -1 if channel is None else channel
+
+    data_length = field("DataLength")
+    data_bytes = field("DataBytes")
+    if name != "CAN_RemoteFrame" and data_length is not None and data_bytes is not None:
+        columns["length"][:] = np.minimum(data_length, 64)
+        columns["data"][:, : data_bytes.shape[1]] = data_bytes[:, :64]
+        _clear_padding(columns)
+
+    if name == "CAN_RemoteFrame":
+        columns["dlc"][:] = field("DLC")
+    else:
+        # like can.Message, the DLC defaults to the length of the data
+        columns["dlc"][:] = columns["length"]
+    return columns
@@ -17,12 +17,12 @@ import logging
 import struct
 import time
 import zlib
-from collections.abc import Generator, Iterator
+from collections.abc import Generator, Iterator, Sequence
 from decimal import Decimal
 from typing import Any, BinaryIO, Optional, Union, cast
 
 from ..message import Message
-from ..typechecking import StringPathLike
+from ..typechecking import ReadableBytesLike, StringPathLike
 from ..util import channel2int, dlc2len, len2dlc
 from .generic import BinaryIOMessageReader, BinaryIOMessageWriter
 
@@ -59,10 +59,15 @@ LOG_CONTAINER_STRUCT = struct.Struct("<H6xL4x")
 
 # channel, flags, dlc, arbitration id, data
 CAN_MSG_STRUCT = struct.Struct("<HBBL8s")
+# the header of the same record, for reading the data without copying it
+CAN_MSG_HEADER_STRUCT = struct.Struct("<HBBL")
+CAN_MSG_DATA_OFFSET = CAN_MSG_HEADER_STRUCT.size
 
 # channel, flags, dlc, arbitration id, frame length, bit count, FD flags,
 # valid data bytes, data
 CAN_FD_MSG_STRUCT = struct.Struct("<HBBLLBBB5x64s")
+CAN_FD_MSG_HEADER_STRUCT = struct.Struct("<HBBLLBBB5x")
+CAN_FD_MSG_DATA_OFFSET = CAN_FD_MSG_HEADER_STRUCT.size
 
 # channel, dlc, valid payload length of data, tx count, arbitration id,
 # frame length, flags, bit rate used in arbitration phase,
@@ -73,6 +78,8 @@ CAN_FD_MSG_64_STRUCT = struct.Struct("<BBBBLLLLLLLHBBL")
 
 # channel, length, flags, ecc, position, dlc, frame length, id, flags ext, data
 CAN_ERROR_EXT_STRUCT = struct.Struct("<HHLBBBxLLH2x8s")
+CAN_ERROR_EXT_HEADER_STRUCT = struct.Struct("<HHLBBBxLLH2x")
+CAN_ERROR_EXT_DATA_OFFSET = CAN_ERROR_EXT_HEADER_STRUCT.size
 
 # commented event type, foreground color, background color, relocatable,
 # group name length, marker name length, description length
@@ -149,14 +156,22 @@ class BLFReader(BinaryIOMessageReader):
     def __init__(
         self,
         file: Union[StringPathLike, BinaryIO],
+        zero_copy: bool = False,
         **kwargs: Any,
     ) -> None:
         """
         :param file: a path-like object or as file-like object to read from
                      If this is a file-like object, is has to opened in binary
                      read mode, not text read mode.
+        :param zero_copy:
+            If the payload of the messages should refer to the decompressed
+            log container instead of being copied, see
+            :meth:`can.Message.from_buffer`. This reads slightly faster, but
+            each container is kept in memory as long as any of its messages
+            is referenced, so it does not suit keeping many messages.
         """
         super().__init__(file, mode="rb")
+        self.zero_copy = zero_copy
         data = self.file.read(FILE_HEADER_STRUCT.size)
         header = FILE_HEADER_STRUCT.unpack(data)
         if header[0] != b"LOGG":
@@ -176,6 +191,12 @@ class BLFReader(BinaryIOMessageReader):
         self._pos = 0
 
     def __iter__(self) -> Generator[Message, None, None]:
+        for data in self._iter_containers():
+            yield from self._parse_container(data)
+        self.stop()
+
+    def _iter_containers(self) -> Iterator[bytes]:
+        """Yield the uncompressed contents of all log containers in the file."""
         while True:
             data = self.file.read(OBJ_HEADER_BASE_STRUCT.size)
             if not data:
@@ -201,8 +222,7 @@ class BLFReader(BinaryIOMessageReader):
                     # Unknown compression method
                     LOG.warning("Unknown compression method (%d)", method)
                     continue
-                yield from self._parse_container(data)
-        self.stop()
+                yield data
 
     def _parse_container(self, data: bytes) -> Iterator[Message]:
         if self._tail:
@@ -229,11 +249,21 @@ class BLFReader(BinaryIOMessageReader):
         unpack_can_fd_64_msg = CAN_FD_MSG_64_STRUCT.unpack_from
         can_fd_64_msg_size = CAN_FD_MSG_64_STRUCT.size
         unpack_can_error_ext = CAN_ERROR_EXT_STRUCT.unpack_from
+        # with zero_copy, only the headers are unpacked and the data is
+        # sliced out of the container
+        unpack_can_msg_header = CAN_MSG_HEADER_STRUCT.unpack_from
+        unpack_can_fd_msg_header = CAN_FD_MSG_HEADER_STRUCT.unpack_from
+        unpack_can_error_ext_header = CAN_ERROR_EXT_HEADER_STRUCT.unpack_from
+
+        zero_copy = self.zero_copy
 
         start_timestamp = self.start_timestamp
         max_pos = len(data)
         pos = 0
 
+        new_message = Message.from_buffer if zero_copy else Message
+        view = memoryview(data)
+
         # Loop until a struct unpack raises an exception
         while True:
             self._pos = pos
@@ -275,46 +305,72 @@ class BLFReader(BinaryIOMessageReader):
             timestamp = float(Decimal(timestamp) * factor) + start_timestamp
 
             if obj_type in (CAN_MESSAGE, CAN_MESSAGE2):
-                channel, flags, dlc, can_id, can_data = unpack_can_msg(data, pos)
-                yield Message(
+                can_data: ReadableBytesLike
+                if zero_copy:
+                    channel, flags, dlc, can_id = unpack_can_msg_header(data, pos)
+                    start = pos + CAN_MSG_DATA_OFFSET
+                    can_data = view[start : start + min(dlc, 8)]
+                else:
+                    channel, flags, dlc, can_id, can_data = unpack_can_msg(data, pos)
+                    can_data = can_data[:dlc]
+                yield new_message(
                     timestamp=timestamp,
                     arbitration_id=can_id & 0x1FFFFFFF,
                     is_extended_id=bool(can_id & CAN_MSG_EXT),
                     is_remote_frame=bool(flags & REMOTE_FLAG),
                     is_rx=not bool(flags & DIR),
                     dlc=dlc,
-                    data=can_data[:dlc],
+                    data=can_data,
                     channel=channel - 1,
                 )
             elif obj_type == CAN_ERROR_EXT:
-                members = unpack_can_error_ext(data, pos)
+                if zero_copy:
+                    members = unpack_can_error_ext_header(data, pos)
+                    start = pos + CAN_ERROR_EXT_DATA_OFFSET
+                    can_data = view[start : start + min(members[5], 8)]
+                else:
+                    members = unpack_can_error_ext(data, pos)
+                    can_data = members[9][: members[5]]
                 channel = members[0]
                 dlc = members[5]
                 can_id = members[7]
-                can_data = members[9]
-                yield Message(
+                yield new_message(
                     timestamp=timestamp,
                     is_error_frame=True,
                     is_extended_id=bool(can_id & CAN_MSG_EXT),
                     arbitration_id=can_id & 0x1FFFFFFF,
                     dlc=dlc,
-                    data=can_data[:dlc],
+                    data=can_data,
                     channel=channel - 1,
                 )
             elif obj_type == CAN_FD_MESSAGE:
-                members = unpack_can_fd_msg(data, pos)
-                (
-                    channel,
-                    flags,
-                    dlc,
-                    can_id,
-                    _,
-                    _,
-                    fd_flags,
-                    valid_bytes,
-                    can_data,
-                ) = members
-                yield Message(
+                if zero_copy:
+                    (
+                        channel,
+                        flags,
+                        dlc,
+                        can_id,
+                        _,
+                        _,
+                        fd_flags,
+                        valid_bytes,
+                    ) = unpack_can_fd_msg_header(data, pos)
+                    start = pos + CAN_FD_MSG_DATA_OFFSET
+                    can_data = view[start : start + min(valid_bytes, 64)]
+                else:
+                    (
+                        channel,
+                        flags,
+                        dlc,
+                        can_id,
+                        _,
+                        _,
+                        fd_flags,
+                        valid_bytes,
+                        can_data,
+                    ) = unpack_can_fd_msg(data, pos)
+                    can_data = can_data[:valid_bytes]
+                yield new_message(
                     timestamp=timestamp,
                     arbitration_id=can_id & 0x1FFFFFFF,
                     is_extended_id=bool(can_id & CAN_MSG_EXT),
@@ -324,7 +380,7 @@ class BLFReader(BinaryIOMessageReader):
                     bitrate_switch=bool(fd_flags & 0x2),
                     error_state_indicator=bool(fd_flags & 0x4),
                     dlc=dlc2len(dlc),
-                    data=can_data[:valid_bytes],
+                    data=can_data,
                     channel=channel - 1,
                 )
             elif obj_type == CAN_FD_MESSAGE_64:
@@ -353,10 +409,15 @@ class BLFReader(BinaryIOMessageReader):
                     (ext_data_offset or obj_size) - header_size - can_fd_64_msg_size,
                 )
                 msg_data_offset = pos + can_fd_64_msg_size
-                msg_data = data[msg_data_offset : msg_data_offset + data_field_length]
-                msg_data = msg_data.ljust(valid_bytes, b"\x00")
+                msg_data: ReadableBytesLike
+                if zero_copy and data_field_length == valid_bytes:
+                    msg_data = view[msg_data_offset : msg_data_offset + valid_bytes]
+                else:
+                    msg_data = data[
+                        msg_data_offset : msg_data_offset + data_field_length
+                    ].ljust(valid_bytes, b"\x00")
 
-                yield Message(
+                yield new_message(
                     timestamp=timestamp,
                     arbitration_id=can_id & 0x1FFFFFFF,
                     is_extended_id=bool(can_id & CAN_MSG_EXT),
@@ -457,6 +518,18 @@ class BLFWriter(BinaryIOMessageWriter):
         self.file.write(b"\x00" * (FILE_HEADER_SIZE - FILE_HEADER_STRUCT.size))
 
     def on_message_received(self, msg: Message) -> None:
+        self._add_object(*self._encode_message(msg), msg.timestamp)
+
+    def on_messages_received(self, msgs: Sequence[Message]) -> None:
+        for msg in msgs:
+            self._append_object(*self._encode_message(msg), msg.timestamp)
+        # check the container size once per batch, which may have filled
+        # more than a single container
+        while self._buffer_size >= self.max_container_size and not self.file.closed:
+            self._flush()
+
+    def _encode_message(self, msg: Message) -> tuple[int, bytes]:
+        """Return the object type and the payload of a message object."""
         channel = channel2int(msg.channel)
         if channel is None:
             channel = self.channel
@@ -485,8 +558,8 @@ class BLFWriter(BinaryIOMessageWriter):
                 0,  # ext flags
                 can_data,
             )
-            self._add_object(CAN_ERROR_EXT, data, msg.timestamp)
-        elif msg.is_fd:
+            return CAN_ERROR_EXT, data
+        if msg.is_fd:
             fd_flags = EDL
             if msg.bitrate_switch:
                 fd_flags |= BRS
@@ -503,10 +576,10 @@ class BLFWriter(BinaryIOMessageWriter):
                 len(can_data),
                 can_data,
             )
-            self._add_object(CAN_FD_MESSAGE, data, msg.timestamp)
-        else:
-            data = CAN_MSG_STRUCT.pack(channel, flags, msg.dlc, arb_id, can_data)
-            self._add_object(CAN_MESSAGE, data, msg.timestamp)
+            return CAN_FD_MESSAGE, data
+        return CAN_MESSAGE, CAN_MSG_STRUCT.pack(
+            channel, flags, msg.dlc, arb_id, can_data
+        )
 
     def log_event(self, text: str, timestamp: Optional[float] = None) -> None:
         """Add an arbitrary message to the log file as a global marker.
@@ -531,6 +604,13 @@ class BLFWriter(BinaryIOMessageWriter):
 
     def _add_object(
         self, obj_type: int, data: bytes, timestamp: Optional[float] = None
+    ) -> None:
+        self._append_object(obj_type, data, timestamp)
+        if self._buffer_size >= self.max_container_size:
+            self._flush()
+
+    def _append_object(
+        self, obj_type: int, data: bytes, timestamp: Optional[float] = None
     ) -> None:
         if timestamp is None:
             timestamp = self.stop_timestamp or time.time()
@@ -557,8 +637,6 @@ class BLFWriter(BinaryIOMessageWriter):
 
         self._buffer_size += obj_size + padding_size
         self.object_count += 1
-        if self._buffer_size >= self.max_container_size:
-            self._flush()
 
     def _flush(self) -> None:
         """Compresses and writes data in the buffer to file."""
@@ -5,7 +5,7 @@ It is is compatible with "candump -L" from the canutils program
 """
 
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from typing import Any, Optional, TextIO, Union
 
 from can.message import Message
@@ -152,6 +152,12 @@ class CanutilsLogWriter(TextIOMessageWriter):
         self.last_timestamp: Optional[float] = None
 
     def on_message_received(self, msg: Message) -> None:
+        self.file.write(self._format_message(msg))
+
+    def on_messages_received(self, msgs: Sequence[Message]) -> None:
+        self.file.write("".join([self._format_message(msg) for msg in msgs]))
+
+    def _format_message(self, msg: Message) -> str:
         # this is the case for the very first message:
         if self.last_timestamp is None:
             self.last_timestamp = msg.timestamp or 0.0
@@ -192,4 +198,4 @@ class CanutilsLogWriter(TextIOMessageWriter):
                 framestr += f"#{fd_flags:X}"
             framestr += f"{msg.data.hex().upper()}{eol}"
 
-        self.file.write(framestr)
+        return framestr
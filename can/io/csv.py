@@ -10,7 +10,7 @@ TODO: This module could use https://docs.python.org/2/library/csv.html#module-cs
 """
 
 from base64 import b64decode, b64encode
-from collections.abc import Generator
+from collections.abc import Generator, Sequence
 from typing import Any, TextIO, Union
 
 from can.message import Message
@@ -109,6 +109,13 @@ class CSVWriter(TextIOMessageWriter):
             self.file.write("timestamp,arbitration_id,extended,remote,error,dlc,data\n")
 
     def on_message_received(self, msg: Message) -> None:
+        self.file.write(self._format_row(msg))
+
+    def on_messages_received(self, msgs: Sequence[Message]) -> None:
+        self.file.write("".join([self._format_row(msg) for msg in msgs]))
+
+    @staticmethod
+    def _format_row(msg: Message) -> str:
         row = ",".join(
             [
                 repr(msg.timestamp),  # cannot use str() here because that is rounding
@@ -120,5 +127,4 @@ class CSVWriter(TextIOMessageWriter):
                 b64encode(msg.data).decode("utf8"),
             ]
         )
-        self.file.write(row)
-        self.file.write("\n")
+        return row + "\n"
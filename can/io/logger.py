@@ -6,6 +6,7 @@ import gzip
 import os
 import pathlib
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import datetime
 from types import TracebackType
 from typing import (
@@ -246,6 +247,21 @@ class BaseRotatingLogger(MessageWriter, ABC):
 
         self.writer.on_message_received(msg)
 
+    def on_messages_received(self, msgs: Sequence[Message]) -> None:
+        """This method is called to handle several messages at once.
+
+        The rollover conditions are only checked for the first message,
+        thus a file may exceed its limits by a single batch.
+
+        :param msgs:
+            the delivered messages
+        """
+        if msgs and self.should_rollover(msgs[0]):
+            self.do_rollover()
+            self.rollover_count += 1
+
+        self.writer.on_messages_received(msgs)
+
     def _get_new_writer(self, filename: StringPathLike) -> MessageWriter:
         """Instantiate a new writer.
 
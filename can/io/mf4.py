@@ -476,6 +476,13 @@ class MF4Reader(BinaryIOMessageReader):
     def __iter__(self) -> Iterator[Message]:
         # To handle messages split over multiple channel groups, create a single iterator per
         # channel group and merge these iterators into a single iterator using heapq.
+        iterators = self._frame_iterators()
+
+        # Create merged iterator over all the groups, using the timestamps as comparison key
+        return iter(heapq.merge(*iterators, key=lambda x: x.timestamp))
+
+    def _frame_iterators(self) -> list[FrameIterator]:
+        """Create an iterator for each channel group holding CAN frames."""
         iterators: list[FrameIterator] = []
         for group_index, group in enumerate(self._mdf.groups):
             channel_group: ChannelGroup = group.channel_group
@@ -522,8 +529,7 @@ class MF4Reader(BinaryIOMessageReader):
                 # Unknown bus type, skip
                 continue
 
-        # Create merged iterator over all the groups, using the timestamps as comparison key
-        return iter(heapq.merge(*iterators, key=lambda x: x.timestamp))
+        return iterators
 
     def stop(self) -> None:
         self._mdf.close()
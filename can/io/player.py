@@ -11,9 +11,11 @@ from collections.abc import Generator, Iterable
 from typing import (
     Any,
     Final,
+    Optional,
 )
 
 from .._entry_points import read_entry_points
+from ..broadcastmanager import PreciseSleeper
 from ..message import Message
 from ..typechecking import StringPathLike
 from .asc import ASCReader
@@ -136,6 +138,7 @@ class MessageSync:
         timestamps: bool = True,
         gap: float = 0.0001,
         skip: float = 60.0,
+        sleeper: Optional[PreciseSleeper] = None,
     ) -> None:
         """Creates an new **MessageSync** instance.
 
@@ -144,6 +147,10 @@ class MessageSync:
                            as the time between messages.
         :param gap: Minimum time between sent messages in seconds
         :param skip: Skip periods of inactivity greater than this (in seconds).
+        :param sleeper:
+            Used to wait until a message is due. Defaults to a
+            :class:`~can.broadcastmanager.PreciseSleeper` which does not
+            busy-wait.
 
         Example::
 
@@ -159,6 +166,7 @@ class MessageSync:
         self.timestamps = timestamps
         self.gap = gap
         self.skip = skip
+        self.sleeper = sleeper if sleeper is not None else PreciseSleeper(spin_budget=0)
 
     def __iter__(self) -> Generator[Message, None, None]:
         t_wakeup = playback_start_time = time.perf_counter()
@@ -183,7 +191,7 @@ class MessageSync:
                 t_skipped += sleep_period - self.skip
                 sleep_period = self.skip
 
-            if sleep_period > 1e-4:
-                time.sleep(sleep_period)
+            if sleep_period > 0:
+                self.sleeper.sleep(sleep_period)
 
             yield message
@@ -8,8 +8,9 @@ import logging
 import sqlite3
 import threading
 import time
-from collections.abc import Generator, Iterator
-from typing import Any
+from collections.abc import Generator, Iterator, Sequence
+from queue import Empty, SimpleQueue
+from typing import Any, Optional, Union
 
 from typing_extensions import TypeAlias
 
@@ -137,6 +138,9 @@ class SqliteWriter(MessageWriter, BufferedReader):
     MAX_BUFFER_SIZE_BEFORE_WRITES = 500
     """Maximum number of messages to buffer before writing to the database"""
 
+    # single messages and batches from on_messages_received()
+    buffer: "SimpleQueue[Union[Message, Sequence[Message]]]"  # type: ignore[assignment]
+
     def __init__(
         self,
         file: StringPathLike,
@@ -196,6 +200,37 @@ class SqliteWriter(MessageWriter, BufferedReader):
 
         return conn
 
+    def on_messages_received(self, msgs: Sequence[Message]) -> None:
+        """Append several messages to the buffer at once.
+
+        :raises RuntimeError:
+            if the writer has already been stopped
+        """
+        if self.is_stopped:
+            raise RuntimeError("reader has already been stopped")
+        # the caller may reuse its sequence after returning
+        self.buffer.put(list(msgs))
+
+    def _get_item(self) -> Optional[Union[Message, Sequence[Message]]]:
+        try:
+            if self.is_stopped:
+                return self.buffer.get(block=False)
+            return self.buffer.get(block=True, timeout=self.GET_MESSAGE_TIMEOUT)
+        except Empty:
+            return None
+
+    @staticmethod
+    def _to_row(msg: Message) -> _MessageTuple:
+        return (
+            msg.timestamp,
+            msg.arbitration_id,
+            msg.is_extended_id,
+            msg.is_remote_frame,
+            msg.is_error_frame,
+            msg.dlc,
+            memoryview(msg.data),
+        )
+
     def _db_writer_thread(self) -> None:
         conn = SqliteWriter._create_db(self._db_filename, self.table_name)
 
@@ -203,21 +238,14 @@ class SqliteWriter(MessageWriter, BufferedReader):
             while True:
                 messages: list[_MessageTuple] = []  # reset buffer
 
-                msg = self.get_message(self.GET_MESSAGE_TIMEOUT)
-                while msg is not None:
+                item = self._get_item()
+                while item is not None:
                     # log.debug("SqliteWriter: buffering message")
 
-                    messages.append(
-                        (
-                            msg.timestamp,
-                            msg.arbitration_id,
-                            msg.is_extended_id,
-                            msg.is_remote_frame,
-                            msg.is_error_frame,
-                            msg.dlc,
-                            memoryview(msg.data),
-                        )
-                    )
+                    if isinstance(item, Message):
+                        messages.append(self._to_row(item))
+                    else:
+                        messages.extend([self._to_row(msg) for msg in item])
 
                     if (
                         time.time() - self.last_write > self.MAX_TIME_BETWEEN_WRITES
@@ -226,7 +254,7 @@ class SqliteWriter(MessageWriter, BufferedReader):
                         break
 
                     # just go on
-                    msg = self.get_message(self.GET_MESSAGE_TIMEOUT)
+                    item = self._get_item()
 
                 count = len(messages)
                 if count > 0:
@@ -0,0 +1,167 @@
+"""
+This module contains :class:`~can.LastValueCache`, a listener which keeps the
+latest message and the receive statistics of every arbitration ID.
+"""
+
+from collections.abc import Sequence
+from time import time
+from typing import NamedTuple, Optional
+
+from can.listener import Listener
+from can.message import Message
+from can.typechecking import Channel
+
+#: The key of an entry: (channel, arbitration ID, is_extended_id)
+CacheKey = tuple[Optional[Channel], int, bool]
+
+
+class LastValue(NamedTuple):
+    """The latest message of an arbitration ID and its receive statistics."""
+
+    #: The latest received message
+    msg: Message
+    #: The number of received messages
+    msg_count: int
+    #: The time at which the first message was received, see :func:`time.time`
+    first_seen: float
+    #: The time at which the latest message was received, see :func:`time.time`
+    last_seen: float
+    #: The exponentially weighted moving average of the time between two
+    #: messages in seconds, based on their timestamps, or None after the
+    #: first message
+    period: Optional[float]
+
+    @property
+    def rate(self) -> Optional[float]:
+        """The number of messages per second derived from :attr:`period`."""
+        return 1.0 / self.period if self.period else None
+
+
+class LastValueCache(Listener):
+    """Keeps the latest :class:`~can.Message` and some receive statistics per
+    channel and arbitration ID, e.g. for dashboards or health checks::
+
+        cache = can.LastValueCache(ttl=5.0)
+        notifier = can.Notifier(bus, [cache])
+        ...
+        entry = cache.get(0x123, is_extended_id=False)
+        if entry is not None:
+            print(entry.msg.data, entry.msg_count, entry.rate)
+
+    Every entry is an immutable :class:`~can.last_value_cache.LastValue`, which
+    is replaced on each message. Reading with :meth:`get` or :meth:`snapshot`
+    thus needs no lock and always returns consistent entries, while updating
+    costs a single dictionary assignment per message.
+
+    Entries are updated without locking, which is safe as long as the messages
+    of each channel are delivered by a single thread, as a :class:`~can.Notifier`
+    does.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, smoothing: float = 0.1) -> None:
+        """
+        :param ttl:
+            If given, the entries of IDs which were not received for this
+            many seconds are evicted.
+        :param smoothing:
+            The weight of the latest time between two messages in the moving
+            average :attr:`~can.last_value_cache.LastValue.period`,
+            between 0 (exclusive) and 1 (inclusive).
+        :raises ValueError:
+            If *ttl* is not positive or *smoothing* is out of range
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in the range (0, 1]")
+
+        self.ttl = ttl
+        self.smoothing = smoothing
+        self._entries: dict[CacheKey, LastValue] = {}
+        self._next_eviction = 0.0
+
+    def on_message_received(self, msg: Message) -> None:
+        now = time()
+        self._update(msg, now)
+        if self.ttl is not None and now >= self._next_eviction:
+            self.evict(now)
+
+    def on_messages_received(self, msgs: Sequence[Message]) -> None:
+        now = time()
+        for msg in msgs:
+            self._update(msg, now)
+        if self.ttl is not None and now >= self._next_eviction:
+            self.evict(now)
+
+    def _update(self, msg: Message, now: float) -> None:
+        key = (msg.channel, msg.arbitration_id, msg.is_extended_id)
+        previous = self._entries.get(key)
+        if previous is None:
+            self._entries[key] = LastValue(msg, 1, now, now, None)
+            return
+
+        period = msg.timestamp - previous.msg.timestamp
+        if previous.period is not None:
+            period = previous.period + self.smoothing * (period - previous.period)
+        self._entries[key] = LastValue(
+            msg, previous.msg_count + 1, previous.first_seen, now, period
+        )
+
+    def get(
+        self,
+        arbitration_id: int,
+        is_extended_id: bool = True,
+        channel: Optional[Channel] = None,
+    ) -> Optional[LastValue]:
+        """Return the entry of an ID or None if it was not received.
+
+        :param arbitration_id: The arbitration ID.
+        :param is_extended_id: Whether it is an extended (29 bit) identifier.
+        :param channel: The :attr:`~can.Message.channel` of the messages.
+        """
+        return self._entries.get((channel, arbitration_id, is_extended_id))
+
+    def snapshot(self) -> dict[CacheKey, LastValue]:
+        """Return a copy of all entries, which were not yet expired.
+
+        The keys are tuples of the channel, the arbitration ID and whether the
+        ID is an extended identifier.
+        """
+        entries = self._entries.copy()
+        if self.ttl is None:
+            return entries
+        oldest = time() - self.ttl
+        return {
+            key: entry for key, entry in entries.items() if entry.last_seen >= oldest
+        }
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """Remove the entries which were not received within the last *ttl*
+        seconds. This is done automatically while messages are received.
+
+        :param now: The current time, see :func:`time.time`.
+        :return: The number of removed entries.
+        """
+        if self.ttl is None:
+            return 0
+        if now is None:
+            now = time()
+        # check again after a fraction of the ttl has passed
+        self._next_eviction = now + self.ttl / 4
+
+        oldest = now - self.ttl
+        expired = [
+            key
+            for key, entry in self._entries.copy().items()
+            if entry.last_seen < oldest
+        ]
+        for key in expired:
+            self._entries.pop(key, None)
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,16 +3,22 @@ This module contains the implementation of `can.Listener` and some readers.
 """
 
 import asyncio
+import logging
 import sys
+import threading
 import warnings
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections import deque
+from collections.abc import AsyncIterator, Sequence
+from enum import Enum, auto
 from queue import Empty, SimpleQueue
-from typing import Any, Optional
+from typing import Any, Callable, Optional, cast
 
 from can.bus import BusABC
 from can.message import Message
 
+logger = logging.getLogger(__name__)
+
 
 class Listener(ABC):
     """The basic listener that can be called directly to handle some
@@ -37,6 +43,22 @@ class Listener(ABC):
         :param msg: the delivered message
         """
 
+    def on_messages_received(self, msgs: Sequence[Message]) -> None:
+        """This method is called to handle several messages at once, e.g. if a
+        bus returned more than one message from :meth:`~can.BusABC.recv_batch`.
+
+        The default implementation calls :meth:`on_message_received` for each
+        message. Listeners which can process the messages more efficiently in
+        bulk may override it. The :class:`~can.Notifier` and the
+        :class:`~can.QueuedListener` only call this method if it is overridden,
+        such that an exception raised for one message does not cost the
+        others of the batch.
+
+        :param msgs: the delivered messages in the order of their reception
+        """
+        for msg in msgs:
+            self.on_message_received(msg)
+
     def __call__(self, msg: Message) -> None:
         self.on_message_received(msg)
 
@@ -56,6 +78,20 @@ class Listener(ABC):
         """
 
 
+def _batch_handler(
+    listener: Any,
+) -> Optional[Callable[[Sequence[Message]], None]]:
+    """Return the ``on_messages_received()`` method of *listener*, if it
+    processes batches itself instead of just calling
+    :meth:`~Listener.on_message_received` for every message."""
+    if (
+        getattr(type(listener), "on_messages_received", None)
+        is Listener.on_messages_received
+    ):
+        return None
+    return getattr(listener, "on_messages_received", None)
+
+
 class RedirectReader(Listener):  # pylint: disable=abstract-method
     """
     A RedirectReader sends all received messages to another Bus.
@@ -122,6 +158,337 @@ class BufferedReader(Listener):  # pylint: disable=abstract-method
         self.is_stopped = True
 
 
+class OverflowPolicy(Enum):
+    """What a :class:`~can.QueuedListener` or a :class:`~can.RingBufferedReader`
+    does with a new message while its queue is full."""
+
+    #: Wait until the worker has made room, which slows down the caller
+    BLOCK = auto()
+    #: Discard the oldest queued message to make room for the new one
+    DROP_OLDEST = auto()
+    #: Discard the new message
+    DROP_NEWEST = auto()
+
+
+class QueuedListener(Listener):
+    """Decouples a listener from the thread delivering the messages.
+
+    Received messages are put into a bounded queue and passed to the wrapped
+    listener by a dedicated worker thread. A slow listener thus does not delay
+    the caller, e.g. the receive thread of a :class:`~can.Notifier`, until its
+    queue is full. What happens then is determined by the *overflow_policy*.
+
+    The :class:`~can.Notifier` wraps its listeners automatically if a
+    ``listener_queue_size`` is given::
+
+        notifier = can.Notifier(bus, [can.Logger("log.asc")], listener_queue_size=1000)
+
+    The counters :attr:`lag`, :attr:`max_lag`, :attr:`dropped` and
+    :attr:`delivered` may be used to monitor how well the listener keeps up.
+    """
+
+    def __init__(
+        self,
+        listener: Callable[[Message], Any],
+        max_size: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        """
+        :param listener:
+            The :class:`~can.Listener` or callable to pass the messages to.
+        :param max_size:
+            The maximum number of queued messages.
+        :param overflow_policy:
+            What to do with a new message while the queue is full.
+        :raises ValueError:
+            If *max_size* is smaller than 1
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        #: The wrapped listener
+        self.listener = listener
+        self.max_size = max_size
+        self.overflow_policy = overflow_policy
+
+        #: The highest number of queued messages so far
+        self.max_lag = 0
+        #: The number of messages which were discarded due to the overflow policy
+        self.dropped = 0
+        #: The number of messages which were passed to the wrapped listener
+        self.delivered = 0
+
+        self._queue: deque[Message] = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._is_stopped = False
+
+        self._worker = threading.Thread(
+            target=self._run, name=f"{type(self).__qualname__} for {listener!r}"
+        )
+        self._worker.daemon = True
+        self._worker.start()
+
+    @property
+    def lag(self) -> int:
+        """The number of messages which are queued and were not yet taken by the
+        worker thread."""
+        return len(self._queue)
+
+    def on_message_received(self, msg: Message) -> None:
+        """Queue a message for the wrapped listener.
+
+        Messages are silently discarded after :meth:`stop` was called.
+        """
+        with self._lock:
+            self._put(msg)
+
+    def on_messages_received(self, msgs: Sequence[Message]) -> None:
+        """Queue several messages for the wrapped listener at once."""
+        with self._lock:
+            for msg in msgs:
+                self._put(msg)
+
+    def _put(self, msg: Message) -> None:
+        # must be called with self._lock held
+        if len(self._queue) >= self.max_size:
+            if self.overflow_policy is OverflowPolicy.DROP_NEWEST:
+                self.dropped += 1
+                return
+            if self.overflow_policy is OverflowPolicy.DROP_OLDEST:
+                self._queue.popleft()
+                self.dropped += 1
+            else:
+                while len(self._queue) >= self.max_size and not self._is_stopped:
+                    self._not_full.wait()
+
+        if self._is_stopped:
+            return
+
+        self._queue.append(msg)
+        self.max_lag = max(self.max_lag, len(self._queue))
+        self._not_empty.notify()
+
+    def on_error(self, exc: Exception) -> None:
+        """Pass the exception to the wrapped listener, if it handles errors."""
+        if not hasattr(self.listener, "on_error"):
+            raise NotImplementedError()
+        self.listener.on_error(exc)
+
+    def _run(self) -> None:
+        on_messages_received = _batch_handler(self.listener)
+
+        while True:
+            with self._lock:
+                while not self._queue and not self._is_stopped:
+                    self._not_empty.wait()
+                if not self._queue:
+                    # stopped and all messages were delivered
+                    return
+                # take all queued messages, such that listeners which
+                # support it can process them in bulk
+                msgs = list(self._queue)
+                self._queue.clear()
+                self._not_full.notify_all()
+
+            if on_messages_received is not None:
+                self._deliver(on_messages_received, msgs)
+            else:
+                for msg in msgs:
+                    self._deliver(self.listener, msg)
+            self.delivered += len(msgs)
+
+    def _deliver(self, callback: Callable[[Any], Any], argument: Any) -> None:
+        try:
+            callback(argument)
+        except Exception as exc:  # pylint: disable=broad-except
+            try:
+                self.on_error(exc)
+            except NotImplementedError:
+                logger.exception("%r failed to handle a message", self.listener)
+
+    def _stop_worker(self) -> None:
+        with self._lock:
+            self._is_stopped = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        # when stopped from within the wrapped listener, the worker thread
+        # delivers the remaining messages after the callback returned
+        if threading.current_thread() is not self._worker:
+            self._worker.join()
+
+    def stop(self) -> None:
+        """Deliver the queued messages, then stop the worker thread
+        and the wrapped listener."""
+        self._stop_worker()
+        if hasattr(self.listener, "stop"):
+            self.listener.stop()
+
+
+class RingBufferedReader(Listener):  # pylint: disable=abstract-method
+    """A **message buffer** like :class:`~can.BufferedReader`, but with a fixed
+    capacity.
+
+    The messages are stored in a ring of preallocated slots, so the memory
+    used does not grow if the consumer stalls. What happens to a new message
+    while all slots are in use is determined by the *overflow_policy*.
+
+    The counters :attr:`occupancy`, :attr:`high_water_mark` and :attr:`dropped`
+    may be used to monitor how well the consumer keeps up.
+
+    Putting in messages after :meth:`~can.RingBufferedReader.stop` has been called
+    will raise an exception, see :meth:`~can.RingBufferedReader.on_message_received`.
+
+    :attr is_stopped: ``True`` if the reader has been stopped
+    """
+
+    def __init__(
+        self,
+        size: int = 1000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        """
+        :param size:
+            The maximum number of buffered messages.
+        :param overflow_policy:
+            Either :attr:`~can.OverflowPolicy.DROP_OLDEST` to overwrite the oldest
+            buffered message or :attr:`~can.OverflowPolicy.DROP_NEWEST` to discard
+            the new message while the buffer is full.
+        :raises ValueError:
+            If *size* is smaller than 1 or *overflow_policy* is
+            :attr:`~can.OverflowPolicy.BLOCK`
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        if overflow_policy is OverflowPolicy.BLOCK:
+            raise ValueError("a RingBufferedReader cannot block while full")
+
+        self.size = size
+        self.overflow_policy = overflow_policy
+        self.is_stopped: bool = False
+
+        #: The highest number of buffered messages so far
+        self.high_water_mark = 0
+        #: The number of messages which were discarded due to the overflow policy
+        self.dropped = 0
+
+        self._slots: list[Optional[Message]] = [None] * size
+        # index of the oldest message and number of buffered messages
+        self._head = 0
+        self._count = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        # number of threads waiting for a message, notifying is skipped without
+        self._waiting = 0
+
+    @property
+    def occupancy(self) -> int:
+        """The number of messages which are currently buffered."""
+        return self._count
+
+    def on_message_received(self, msg: Message) -> None:
+        """Append a message to the buffer.
+
+        :raises: RuntimeError
+            if the reader has already been stopped
+        """
+        if self.is_stopped:
+            raise RuntimeError("reader has already been stopped")
+        with self._lock:
+            self._put(msg)
+            if self._waiting:
+                self._not_empty.notify()
+
+    def on_messages_received(self, msgs: Sequence[Message]) -> None:
+        """Append several messages to the buffer at once.
+
+        :raises: RuntimeError
+            if the reader has already been stopped
+        """
+        if self.is_stopped:
+            raise RuntimeError("reader has already been stopped")
+        with self._lock:
+            for msg in msgs:
+                self._put(msg)
+            if self._waiting:
+                self._not_empty.notify()
+
+    def _put(self, msg: Message) -> None:
+        # must be called with the lock held
+        if self._count == self.size:
+            self.dropped += 1
+            if self.overflow_policy is OverflowPolicy.DROP_OLDEST:
+                # overwrite the oldest message
+                self._slots[self._head] = msg
+                self._head = (self._head + 1) % self.size
+            return
+
+        self._slots[(self._head + self._count) % self.size] = msg
+        self._count += 1
+        if self._count > self.high_water_mark:
+            self.high_water_mark = self._count
+
+    def _pop(self) -> Message:
+        # must be called with the lock held and at least one buffered message
+        msg = cast("Message", self._slots[self._head])
+        self._slots[self._head] = None
+        self._head = (self._head + 1) % self.size
+        self._count -= 1
+        return msg
+
+    def _wait(self, timeout: float) -> bool:
+        # must be called with the lock held, returns False if still empty
+        if not self._count and not self.is_stopped and timeout > 0:
+            self._waiting += 1
+            try:
+                self._not_empty.wait_for(
+                    lambda: self._count > 0 or self.is_stopped, timeout
+                )
+            finally:
+                self._waiting -= 1
+        return self._count > 0
+
+    def get_message(self, timeout: float = 0.5) -> Optional[Message]:
+        """
+        Attempts to retrieve the oldest buffered message (FIFO). If no message is
+        available, it blocks for given timeout or until a message is received
+        (whichever is shorter), or else returns None. This method does not block
+        after :meth:`can.RingBufferedReader.stop` has been called.
+
+        :param timeout: The number of seconds to wait for a new message.
+        :return: the received :class:`can.Message` or `None`, if the buffer is empty.
+        """
+        with self._lock:
+            if not self._wait(timeout):
+                return None
+            return self._pop()
+
+    def get_messages(
+        self, max_count: Optional[int] = None, timeout: float = 0.0
+    ) -> list[Message]:
+        """
+        Retrieve up to *max_count* of the oldest buffered messages at once.
+        If no message is available, it blocks for given timeout or until a
+        message is received (whichever is shorter).
+
+        :param max_count: The maximum number of messages or None for all buffered ones.
+        :param timeout: The number of seconds to wait for the first message.
+        :return: A list of :class:`can.Message` objects, which is empty on timeout.
+        """
+        with self._lock:
+            if not self._wait(timeout):
+                return []
+            count = self._count if max_count is None else min(max_count, self._count)
+            return [self._pop() for _ in range(count)]
+
+    def stop(self) -> None:
+        """Prohibits any more additions to this reader."""
+        with self._lock:
+            self.is_stopped = True
+            self._not_empty.notify_all()
+
+
 class AsyncBufferedReader(
     Listener, AsyncIterator[Message]
 ):  # pylint: disable=abstract-method
@@ -6,12 +6,35 @@ This module contains the implementation of :class:`can.Message`.
     starting with Python 3.7.
 """
 
+import struct
+from collections import deque
+from collections.abc import Iterable
 from copy import deepcopy
 from math import isinf, isnan
-from typing import Any, Optional
+from typing import Any, Final, Optional
 
 from . import typechecking
 
+# flags describing a frame in the binary record format of Message.to_bytes()
+# and in the flag column of can.MessageBatch
+FLAG_EXTENDED_ID: Final[int] = 0x01
+FLAG_REMOTE_FRAME: Final[int] = 0x02
+FLAG_ERROR_FRAME: Final[int] = 0x04
+FLAG_FD: Final[int] = 0x08
+FLAG_BITRATE_SWITCH: Final[int] = 0x10
+FLAG_ERROR_STATE_INDICATOR: Final[int] = 0x20
+FLAG_RX: Final[int] = 0x40
+# set if a record carries 64 instead of 8 data bytes
+_FLAG_LONG_RECORD: Final[int] = 0x80
+
+# timestamp, arbitration ID, flags, DLC, data length, padding, data
+RECORD_STRUCT: Final = struct.Struct("<dIBBBx8s")
+FD_RECORD_STRUCT: Final = struct.Struct("<dIBBBx64s")
+_RECORD_FLAGS_OFFSET: Final[int] = 12
+
+# channels of these types do not have to be copied by :meth:`Message.__deepcopy__`
+_IMMUTABLE_CHANNEL_TYPES: Final = frozenset((type(None), str, int))
+
 
 class Message:  # pylint: disable=too-many-instance-attributes; OK for a dataclass
     """
@@ -107,6 +130,96 @@ class Message:  # pylint: disable=too-many-instance-attributes; OK for a datacla
         if check:
             self._check()
 
+    @classmethod
+    def from_buffer(  # pylint: disable=too-many-locals, too-many-arguments
+        cls,
+        data: typechecking.ReadableBytesLike,
+        offset: int = 0,
+        length: Optional[int] = None,
+        *,
+        timestamp: float = 0.0,
+        arbitration_id: int = 0,
+        is_extended_id: bool = True,
+        is_remote_frame: bool = False,
+        is_error_frame: bool = False,
+        channel: Optional[typechecking.Channel] = None,
+        dlc: Optional[int] = None,
+        is_fd: bool = False,
+        is_rx: bool = True,
+        bitrate_switch: bool = False,
+        error_state_indicator: bool = False,
+        check: bool = False,
+    ) -> "Message":
+        """Create a message whose payload refers to a slice of a larger buffer
+        instead of a copy of it.
+
+        This is meant for receive and file-read loops, where many frames are
+        decoded from a single receive or decompression buffer. The payload is
+        stored as a read-only :class:`memoryview`, so the buffer is not copied
+        and the message keeps it alive for as long as the message exists::
+
+            msg = can.Message.from_buffer(frame, 8, 8, arbitration_id=0x123)
+
+        The keyword arguments are the same as the ones of the constructor, so
+        both can be used interchangeably::
+
+            new_message = Message.from_buffer if zero_copy else Message
+            msg = new_message(data=payload, arbitration_id=0x123)
+
+        .. note::
+            The data of such a message cannot be modified in place. To change
+            it, assign a new value, e.g. ``msg.data = bytearray(msg.data)``.
+            Copies of the message created with :func:`~copy.copy`,
+            :func:`~copy.deepcopy` or :mod:`pickle` hold a :class:`bytearray`
+            again.
+
+        .. warning::
+            The buffer must not be modified while messages refer to it.
+
+        :param data: the buffer holding the payload
+        :param offset: the index of the first byte of the payload in `data`
+        :param length:
+            the length of the payload or `None` to use the rest of the buffer
+
+        :raises ValueError:
+            If the slice exceeds the buffer or, in case `check` is set to `True`,
+            if one or more arguments were invalid
+        """
+        if is_remote_frame:
+            view = memoryview(b"")
+        else:
+            view = data if isinstance(data, memoryview) else memoryview(data)
+            if view.format != "B" or view.ndim != 1:
+                view = view.cast("B")
+            end = len(view) if length is None else offset + length
+            if offset < 0 or end > len(view):
+                raise ValueError(
+                    f"the payload {offset}:{end} exceeds the buffer of length {len(view)}"
+                )
+            if offset or end != len(view):
+                view = view[offset:end]
+            if not view.readonly:
+                view = view.toreadonly()
+
+        # bypass the constructor, which would copy the data
+        msg = cls.__new__(cls)
+        msg.timestamp = timestamp
+        msg.arbitration_id = arbitration_id
+        msg.is_extended_id = is_extended_id
+        msg.is_remote_frame = is_remote_frame
+        msg.is_error_frame = is_error_frame
+        msg.channel = channel
+        msg.is_fd = is_fd
+        msg.is_rx = is_rx
+        msg.bitrate_switch = bitrate_switch
+        msg.error_state_indicator = error_state_indicator
+        msg.data = view  # type: ignore[assignment]
+        msg.dlc = len(view) if dlc is None else dlc
+
+        if check:
+            msg._check()
+        return msg
+
     def __str__(self) -> str:
         field_strings = [f"Timestamp: {self.timestamp:>15.6f}"]
         if self.is_extended_id:
@@ -138,8 +251,8 @@ class Message:  # pylint: disable=too-many-instance-attributes; OK for a datacla
         else:
             field_strings.append(" " * 24)
 
-        if (self.data is not None) and (self.data.isalnum()):
-            field_strings.append(f"'{self.data.decode('utf-8', 'replace')}'")
+        if (self.data is not None) and (data := bytes(self.data)).isalnum():
+            field_strings.append(f"'{data.decode('utf-8', 'replace')}'")
 
         if self.channel is not None:
             try:
@@ -195,37 +308,178 @@ class Message:  # pylint: disable=too-many-instance-attributes; OK for a datacla
         return bytes(self.data)
 
     def __copy__(self) -> "Message":
-        return Message(
-            timestamp=self.timestamp,
-            arbitration_id=self.arbitration_id,
-            is_extended_id=self.is_extended_id,
-            is_remote_frame=self.is_remote_frame,
-            is_error_frame=self.is_error_frame,
-            channel=self.channel,
-            dlc=self.dlc,
-            data=self.data,
-            is_fd=self.is_fd,
-            is_rx=self.is_rx,
-            bitrate_switch=self.bitrate_switch,
-            error_state_indicator=self.error_state_indicator,
+        return self._clone(
+            self.data if isinstance(self.data, bytearray) else bytearray(self.data)
         )
 
     def __deepcopy__(self, memo: Optional[dict[int, Any]]) -> "Message":
-        return Message(
-            timestamp=self.timestamp,
-            arbitration_id=self.arbitration_id,
-            is_extended_id=self.is_extended_id,
-            is_remote_frame=self.is_remote_frame,
-            is_error_frame=self.is_error_frame,
-            channel=deepcopy(self.channel, memo),
-            dlc=self.dlc,
-            data=deepcopy(self.data, memo),
-            is_fd=self.is_fd,
-            is_rx=self.is_rx,
-            bitrate_switch=self.bitrate_switch,
-            error_state_indicator=self.error_state_indicator,
+        msg = self._clone(bytearray(self.data))
+        if type(self.channel) not in _IMMUTABLE_CHANNEL_TYPES:
+            msg.channel = deepcopy(self.channel, memo)
+        return msg
+
+    def _record_flags(self) -> int:
+        flags = 0
+        if self.is_extended_id:
+            flags |= FLAG_EXTENDED_ID
+        if self.is_remote_frame:
+            flags |= FLAG_REMOTE_FRAME
+        if self.is_error_frame:
+            flags |= FLAG_ERROR_FRAME
+        if self.is_fd:
+            flags |= FLAG_FD
+        if self.bitrate_switch:
+            flags |= FLAG_BITRATE_SWITCH
+        if self.error_state_indicator:
+            flags |= FLAG_ERROR_STATE_INDICATOR
+        if self.is_rx:
+            flags |= FLAG_RX
+        return flags
+
+    def to_bytes(self) -> bytes:
+        """Encode this message into a fixed size binary record.
+
+        The record is little endian and consists of the timestamp as a double,
+        the arbitration ID as an unsigned 32 bit integer, a byte of flags (see
+        the ``FLAG_*`` constants of :mod:`can.message`), the DLC, the length of
+        the data, a padding byte and the data. The data field is 8 bytes long,
+        resulting in a record of :attr:`RECORD_STRUCT.size <struct.Struct.size>`
+        (24) bytes. Messages with more than 8 data bytes are encoded with a
+        64 byte data field instead, i.e. as a record of
+        :attr:`FD_RECORD_STRUCT.size <struct.Struct.size>` (80) bytes.
+
+        The :attr:`channel` is not encoded.
+
+        :raises ValueError: if the data is longer than 64 bytes
+        :raises struct.error: if an attribute does not fit into its field
+        """
+        # struct only packs bytes, not e.g. the memoryview of from_buffer()
+        data = bytes(self.data)
+        length = len(data)
+        if length <= 8:
+            return RECORD_STRUCT.pack(
+                self.timestamp,
+                self.arbitration_id,
+                self._record_flags(),
+                self.dlc,
+                length,
+                data,
+            )
+        if length > 64:
+            raise ValueError(f"data of length {length} does not fit into 64 bytes")
+        return FD_RECORD_STRUCT.pack(
+            self.timestamp,
+            self.arbitration_id,
+            self._record_flags() | _FLAG_LONG_RECORD,
+            self.dlc,
+            length,
+            data,
         )
 
+    @classmethod
+    def from_bytes(
+        cls, data: typechecking.ReadableBytesLike, offset: int = 0
+    ) -> "Message":
+        """Decode a message from a record created by :meth:`to_bytes`.
+
+        :param data: the buffer holding the record
+        :param offset: the position of the record in `data`
+
+        :raises ValueError: if the buffer ends within the record
+        """
+        return cls._unpack_record(data, offset)[0]
+
+    @staticmethod
+    def pack_many(messages: Iterable["Message"]) -> bytes:
+        """Encode several messages into consecutive records, see :meth:`to_bytes`.
+
+        :param messages: the messages to encode
+        """
+        return b"".join([msg.to_bytes() for msg in messages])
+
+    @classmethod
+    def unpack_many(cls, data: typechecking.ReadableBytesLike) -> list["Message"]:
+        """Decode all records in a buffer created by :meth:`pack_many`.
+
+        :param data: the buffer holding the records
+
+        :raises ValueError: if the buffer ends within a record
+        """
+        unpack_record = cls._unpack_record
+        messages = []
+        offset = 0
+        end = len(data)
+        while offset < end:
+            msg, offset = unpack_record(data, offset)
+            messages.append(msg)
+        return messages
+
+    @classmethod
+    def _unpack_record(
+        cls, data: typechecking.ReadableBytesLike, offset: int
+    ) -> tuple["Message", int]:
+        available = len(data) - offset
+        # every record is at least as long as a short one
+        if available < RECORD_STRUCT.size:
+            raise ValueError(f"incomplete record at offset {offset}")
+        if data[offset + _RECORD_FLAGS_OFFSET] & _FLAG_LONG_RECORD:
+            record_struct = FD_RECORD_STRUCT
+            if available < record_struct.size:
+                raise ValueError(f"incomplete record at offset {offset}")
+        else:
+            record_struct = RECORD_STRUCT
+        timestamp, arbitration_id, flags, dlc, length, payload = (
+            record_struct.unpack_from(data, offset)
+        )
+
+        # bypass the constructor since all attributes are known already
+        msg = cls.__new__(cls)
+        msg.timestamp = timestamp
+        msg.arbitration_id = arbitration_id
+        msg.is_extended_id = bool(flags & FLAG_EXTENDED_ID)
+        msg.is_remote_frame = bool(flags & FLAG_REMOTE_FRAME)
+        msg.is_error_frame = bool(flags & FLAG_ERROR_FRAME)
+        msg.channel = None
+        msg.dlc = dlc
+        msg.data = bytearray(payload[:length])
+        msg.is_fd = bool(flags & FLAG_FD)
+        msg.is_rx = bool(flags & FLAG_RX)
+        msg.bitrate_switch = bool(flags & FLAG_BITRATE_SWITCH)
+        msg.error_state_indicator = bool(flags & FLAG_ERROR_STATE_INDICATOR)
+        return msg, offset + record_struct.size
+
+    def _clone(self, data: bytearray) -> "Message":
+        """Copy all attributes into a new message, using the given payload.
+
+        This bypasses the constructor, which makes it considerably faster than
+        creating a new message from the attributes of this one.
+        """
+        msg = Message.__new__(Message)
+        msg.timestamp = self.timestamp
+        msg.arbitration_id = self.arbitration_id
+        msg.is_extended_id = self.is_extended_id
+        msg.is_remote_frame = self.is_remote_frame
+        msg.is_error_frame = self.is_error_frame
+        msg.channel = self.channel
+        msg.dlc = self.dlc
+        msg.data = data
+        msg.is_fd = self.is_fd
+        msg.is_rx = self.is_rx
+        msg.bitrate_switch = self.bitrate_switch
+        msg.error_state_indicator = self.error_state_indicator
+        return msg
+
+    def __getstate__(self) -> tuple[None, dict[str, Any]]:
+        state = {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name != "__weakref__" and hasattr(self, name)
+        }
+        if not isinstance(self.data, bytearray):
+            # views on a buffer cannot be pickled
+            state["data"] = bytearray(self.data)
+        return None, state
+
     def _check(self) -> None:
         """Checks if the message parameters are valid.
 
@@ -329,3 +583,142 @@ class Message:  # pylint: disable=too-many-instance-attributes; OK for a datacla
                 and self.error_state_indicator == other.error_state_indicator
             )
         )
+
+
+class MessagePool:
+    """A free list of :class:`~can.Message` objects that can be recycled
+    instead of allocating a new message for every frame.
+
+    Receive loops and readers that process a large number of frames can
+    :meth:`acquire` a message, fill it and :meth:`release` it again once it is
+    no longer needed::
+
+        pool = can.MessagePool()
+        msg = pool.acquire(arbitration_id=0x123, data=payload)
+        process(msg)
+        pool.release(msg)
+
+    The payload buffer of a released message is reused as well, as long as
+    it is a :class:`bytearray`.
+
+    .. warning::
+        A message must not be used anymore after it was released, since it
+        will be handed out again by a later call to :meth:`acquire`.
+
+    The pool may be shared between threads, although the statistics are
+    not updated atomically then.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        """
+        :param max_size:
+            The maximum number of released messages kept for reuse. Further
+            released messages are left to the garbage collector.
+        """
+        if max_size < 0:
+            raise ValueError("max_size may not be negative")
+        self.max_size = max_size
+        self._free: deque[Message] = deque()
+        #: The number of messages that were taken from the pool
+        self.hits = 0
+        #: The number of messages that had to be allocated
+        self.misses = 0
+
+    def acquire(  # pylint: disable=too-many-arguments
+        self,
+        timestamp: float = 0.0,
+        arbitration_id: int = 0,
+        is_extended_id: bool = True,
+        is_remote_frame: bool = False,
+        is_error_frame: bool = False,
+        channel: Optional[typechecking.Channel] = None,
+        dlc: Optional[int] = None,
+        data: Optional[typechecking.CanData] = None,
+        is_fd: bool = False,
+        is_rx: bool = True,
+        bitrate_switch: bool = False,
+        error_state_indicator: bool = False,
+    ) -> Message:
+        """Take a message from the pool or allocate a new one if it is empty.
+
+        All attributes are set as if the message was newly created with the
+        same arguments, see :class:`~can.Message`. Unlike there, *data* is
+        always copied into the buffer of the message.
+        """
+        try:
+            msg = self._free.pop()
+        except IndexError:
+            self.misses += 1
+            if isinstance(data, bytearray):
+                # the message is reused later, so it must own its buffer
+                data = bytearray(data)
+            return Message(
+                timestamp=timestamp,
+                arbitration_id=arbitration_id,
+                is_extended_id=is_extended_id,
+                is_remote_frame=is_remote_frame,
+                is_error_frame=is_error_frame,
+                channel=channel,
+                dlc=dlc,
+                data=data,
+                is_fd=is_fd,
+                is_rx=is_rx,
+                bitrate_switch=bitrate_switch,
+                error_state_indicator=error_state_indicator,
+            )
+
+        self.hits += 1
+        msg.timestamp = timestamp
+        msg.arbitration_id = arbitration_id
+        msg.is_extended_id = is_extended_id
+        msg.is_remote_frame = is_remote_frame
+        msg.is_error_frame = is_error_frame
+        msg.channel = channel
+        msg.is_fd = is_fd
+        msg.is_rx = is_rx
+        msg.bitrate_switch = bitrate_switch
+        msg.error_state_indicator = error_state_indicator
+
+        if data is None or is_remote_frame:
+            msg.data.clear()
+        elif isinstance(data, int):
+            msg.data[:] = bytes(data)
+        else:
+            # reuse the existing buffer of the message
+            msg.data[:] = data
+        msg.dlc = len(msg.data) if dlc is None else dlc
+        return msg
+
+    def release(self, msg: Message) -> None:
+        """Return a message to the pool.
+
+        :param msg: a message that is not referenced anywhere else anymore
+        """
+        if len(self._free) >= self.max_size:
+            return
+        if not isinstance(msg.data, bytearray):
+            # e.g. messages created with Message.from_buffer()
+            msg.data = bytearray()
+        msg.channel = None
+        self._free.append(msg)
+
+    def clear(self) -> None:
+        """Drop all pooled messages and reset the statistics."""
+        self._free.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """A snapshot of the pool statistics with the keys ``"hits"``,
+        ``"misses"`` and ``"size"`` (the number of messages available)."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._free)}
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_size={self.max_size}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
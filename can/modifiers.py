@@ -0,0 +1,373 @@
+"""
+This module contains declarative modifiers for the data of cyclic messages,
+e.g. alive counters and checksums, see :class:`~can.CyclicModifiers`.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from copy import deepcopy
+from functools import cache
+from typing import Callable, NamedTuple, Optional, Union
+
+from can.message import Message
+
+#: The signature of a compiled modifier, which writes its value for the given
+#: send index into the data of a message
+ApplyFunction = Callable[[bytearray, int], None]
+
+
+class Crc8Profile(NamedTuple):
+    """The parameters of an 8 bit CRC."""
+
+    #: The generator polynomial without the leading bit
+    polynomial: int
+    #: The initial value of the register
+    initial: int
+    #: The value the result is XORed with
+    final_xor: int
+
+
+#: CRC-8 according to SAE J1850, as used by AUTOSAR E2E profiles 1 and 11
+CRC8_SAE_J1850 = Crc8Profile(polynomial=0x1D, initial=0xFF, final_xor=0xFF)
+#: CRC-8 with the polynomial 0x2F (CRC8H2F), as used by AUTOSAR E2E profile 2
+CRC8_AUTOSAR = Crc8Profile(polynomial=0x2F, initial=0xFF, final_xor=0xFF)
+
+
+@cache
+def _crc8_table(polynomial: int) -> bytes:
+    table = bytearray(256)
+    for value in range(256):
+        crc = value
+        for _ in range(8):
+            crc = ((crc << 1) ^ polynomial if crc & 0x80 else crc << 1) & 0xFF
+        table[value] = crc
+    return bytes(table)
+
+
+def crc8(data: Union[bytes, bytearray], profile: Crc8Profile = CRC8_SAE_J1850) -> int:
+    """Calculate an 8 bit CRC with a lookup table.
+
+    :param data: The data to calculate the CRC of.
+    :param profile: The parameters of the CRC.
+    :return: The CRC.
+    """
+    table = _crc8_table(profile.polynomial)
+    crc = profile.initial
+    for byte in data:
+        crc = table[crc ^ byte]
+    return crc ^ profile.final_xor
+
+
+def _compile_writer(start_bit: int, length: int) -> Callable[[bytearray, int], None]:
+    """Return a function writing an unsigned value into a bit field.
+
+    The bits are numbered in little endian (Intel) order, i.e. bit ``n`` is
+    bit ``n % 8`` of byte ``n // 8`` and *start_bit* is the least significant
+    bit of the field.
+    """
+    if start_bit < 0 or length < 1:
+        raise ValueError("the bit field must have a start bit >= 0 and a length >= 1")
+
+    first_byte, shift = divmod(start_bit, 8)
+    if shift + length <= 8:
+        # the common case of a field within a single byte
+        keep = ~(((1 << length) - 1) << shift) & 0xFF
+
+        def write_byte(data: bytearray, value: int) -> None:
+            data[first_byte] = (data[first_byte] & keep) | (value << shift)
+
+        return write_byte
+
+    last_byte = (start_bit + length - 1) // 8
+    field_mask = ((1 << length) - 1) << shift
+    size = last_byte - first_byte + 1
+
+    def write_bytes(data: bytearray, value: int) -> None:
+        old = int.from_bytes(data[first_byte : last_byte + 1], "little")
+        new = (old & ~field_mask) | (value << shift)
+        data[first_byte : last_byte + 1] = new.to_bytes(size, "little")
+
+    return write_bytes
+
+
+class Modifier(ABC):
+    """A declarative modification of the data of a cyclic message.
+
+    The value written by a modifier only depends on the number of messages
+    sent before, such that the modified messages can be calculated in
+    advance, see :meth:`CyclicModifiers.render`.
+    """
+
+    #: The number of messages after which the written values repeat
+    cycle_length: int = 1
+
+    @abstractmethod
+    def compile(self) -> ApplyFunction:
+        """Return a function applying the modification to the data of a
+        message, given the data and the number of messages sent before."""
+
+
+class _FieldModifier(Modifier, ABC):
+    """Writes a value into a bit field."""
+
+    def __init__(self, start_bit: int, length: int) -> None:
+        self.start_bit = start_bit
+        self.length = length
+        self._write = _compile_writer(start_bit, length)
+
+    def _check_value(self, value: int) -> None:
+        if not 0 <= value < 1 << self.length:
+            raise ValueError(f"{value} does not fit into {self.length} bits")
+
+
+class Counter(_FieldModifier):
+    """A rolling counter, e.g. the alive counter of a message in the low
+    nibble of the eighth byte::
+
+        Counter(start_bit=56, length=4)
+    """
+
+    def __init__(
+        self,
+        start_bit: int,
+        length: int = 4,
+        start: int = 0,
+        step: int = 1,
+        modulus: Optional[int] = None,
+    ) -> None:
+        """
+        :param start_bit:
+            The least significant bit of the counter in little endian (Intel)
+            bit numbering, i.e. bit ``n`` is bit ``n % 8`` of byte ``n // 8``.
+        :param length: The length of the counter in bits.
+        :param start: The value of the first message.
+        :param step: The increment per message.
+        :param modulus:
+            The counter wraps to 0 when reaching this value.
+            Defaults to ``2 ** length``.
+        :raises ValueError: If the counter does not fit into the bit field
+        """
+        super().__init__(start_bit, length)
+        self.modulus = 1 << length if modulus is None else modulus
+        if not 0 < self.modulus <= 1 << length:
+            raise ValueError(f"the modulus must be in the range 1..{1 << length}")
+        self._check_value(start)
+        self.start = start
+        self.step = step
+        self.cycle_length = self.modulus // math.gcd(step, self.modulus)
+
+    def compile(self) -> ApplyFunction:
+        write, start, step, modulus = self._write, self.start, self.step, self.modulus
+
+        def apply(data: bytearray, index: int) -> None:
+            write(data, (start + step * index) % modulus)
+
+        return apply
+
+
+class Ramp(_FieldModifier):
+    """A linear ramp of a raw signal value, which restarts after reaching
+    its end, i.e. a sawtooth::
+
+        Ramp(start_bit=0, length=16, start=0, stop=1000, step=10)
+    """
+
+    def __init__(
+        self, start_bit: int, length: int, start: int, stop: int, step: int = 1
+    ) -> None:
+        """
+        :param start_bit:
+            The least significant bit of the signal in little endian (Intel)
+            bit numbering.
+        :param length: The length of the signal in bits.
+        :param start: The value of the first message.
+        :param stop: The last value, if it is reached with the given *step*.
+        :param step:
+            The change per message, which is negative for a falling ramp.
+        :raises ValueError:
+            If the values do not fit into the bit field or *step* does not
+            lead from *start* to *stop*
+        """
+        super().__init__(start_bit, length)
+        self._check_value(start)
+        self._check_value(stop)
+        if step == 0 or (stop - start) * step < 0:
+            raise ValueError("step must lead from start to stop")
+        self.start = start
+        self.stop = stop
+        self.step = step
+        self.cycle_length = (stop - start) // step + 1
+
+    def compile(self) -> ApplyFunction:
+        write, start, step, cycle_length = (
+            self._write,
+            self.start,
+            self.step,
+            self.cycle_length,
+        )
+
+        def apply(data: bytearray, index: int) -> None:
+            write(data, start + step * (index % cycle_length))
+
+        return apply
+
+
+class ValueSequence(_FieldModifier):
+    """Writes the values of a table one after another and restarts at the
+    beginning after the last one::
+
+        ValueSequence(start_bit=8, length=8, values=[0x10, 0x20, 0x40])
+    """
+
+    def __init__(self, start_bit: int, length: int, values: Sequence[int]) -> None:
+        """
+        :param start_bit:
+            The least significant bit of the signal in little endian (Intel)
+            bit numbering.
+        :param length: The length of the signal in bits.
+        :param values: The raw values to send.
+        :raises ValueError: If there are no values or they do not fit into the bit field
+        """
+        super().__init__(start_bit, length)
+        if not values:
+            raise ValueError("at least one value is required")
+        for value in values:
+            self._check_value(value)
+        self.values = tuple(values)
+        self.cycle_length = len(self.values)
+
+    def compile(self) -> ApplyFunction:
+        write, values, cycle_length = self._write, self.values, self.cycle_length
+
+        def apply(data: bytearray, index: int) -> None:
+            write(data, values[index % cycle_length])
+
+        return apply
+
+
+class Crc8(Modifier):
+    """Writes an 8 bit CRC of the other data bytes into a byte of the message.
+
+    It must come after the modifiers changing the protected bytes::
+
+        CyclicModifiers(Counter(start_bit=8, length=4), Crc8(byte=0))
+    """
+
+    def __init__(
+        self,
+        byte: int,
+        profile: Crc8Profile = CRC8_SAE_J1850,
+        data_id: Union[bytes, bytearray] = b"",
+    ) -> None:
+        """
+        :param byte: The index of the byte to write the CRC into.
+        :param profile: The parameters of the CRC, e.g. :data:`CRC8_AUTOSAR`.
+        :param data_id:
+            Bytes which are included in the CRC before the data,
+            e.g. the data ID of an AUTOSAR E2E profile.
+        :raises ValueError: If *byte* is negative
+        """
+        if byte < 0:
+            raise ValueError("byte must not be negative")
+        self.byte = byte
+        self.profile = profile
+        self.data_id = bytes(data_id)
+
+    def compile(self) -> ApplyFunction:
+        byte, profile = self.byte, self.profile
+        table = _crc8_table(profile.polynomial)
+        # the CRC of the data ID does not change
+        initial = profile.initial
+        for value in self.data_id:
+            initial = table[initial ^ value]
+        final_xor = profile.final_xor
+
+        def apply(data: bytearray, index: int) -> None:
+            crc = initial
+            for value in data[:byte]:
+                crc = table[crc ^ value]
+            for value in data[byte + 1 :]:
+                crc = table[crc ^ value]
+            data[byte] = crc ^ final_xor
+
+        return apply
+
+
+class CyclicModifiers:
+    """A compiled set of :class:`~can.modifiers.Modifier`, which updates a
+    cyclic message before each transmission.
+
+    An instance can be passed as *modifier_callback* to
+    :meth:`~can.BusABC.send_periodic`, e.g. for a message with an alive
+    counter and a CRC::
+
+        from can.modifiers import Counter, Crc8
+
+        modifiers = can.CyclicModifiers(Counter(start_bit=8, length=4), Crc8(byte=0))
+        task = bus.send_periodic(msg, 0.01, modifier_callback=modifiers)
+
+    The modifiers are applied in the given order. Since their values only
+    depend on the number of messages sent before, the messages of a whole
+    cycle can be calculated in advance with :meth:`render`. Interfaces with a
+    native broadcast manager like SocketCAN then send them without any Python
+    code running per message::
+
+        task = bus.send_periodic(modifiers.render(msg), 0.01)
+    """
+
+    def __init__(self, *modifiers: Modifier) -> None:
+        """
+        :param modifiers: The modifications to apply, in this order.
+        """
+        self.modifiers = modifiers
+        self._functions = tuple(modifier.compile() for modifier in modifiers)
+        #: The number of messages modified so far
+        self.index = 0
+
+    @property
+    def cycle_length(self) -> int:
+        """The number of messages after which the modified data repeats."""
+        return math.lcm(1, *(modifier.cycle_length for modifier in self.modifiers))
+
+    def apply(self, data: bytearray, index: int) -> None:
+        """Apply all modifiers to *data* as for the message with the given index."""
+        for function in self._functions:
+            function(data, index)
+
+    def __call__(self, msg: Message) -> None:
+        index = self.index
+        for function in self._functions:
+            function(msg.data, index)
+        self.index = index + 1
+
+    def render(
+        self,
+        messages: Union[Message, Sequence[Message]],
+        count: Optional[int] = None,
+    ) -> list[Message]:
+        """Calculate the modified messages in advance.
+
+        The messages are modified as if they were sent one after another
+        starting with index 0, independently of :attr:`index`.
+
+        :param messages:
+            The message or the messages to modify. The n-th rendered message
+            is based on a copy of the message ``messages[n % len(messages)]``.
+        :param count:
+            The number of messages to calculate. Defaults to the least common
+            multiple of the number of messages and the :attr:`cycle_length`,
+            after which the rendered messages repeat.
+        :return: The modified messages.
+        """
+        if isinstance(messages, Message):
+            messages = [messages]
+        if count is None:
+            count = math.lcm(len(messages), self.cycle_length)
+
+        rendered = []
+        for index in range(count):
+            msg = deepcopy(messages[index % len(messages)])
+            self.apply(msg.data, index)
+            rendered.append(msg)
+        return rendered
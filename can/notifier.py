@@ -5,6 +5,7 @@ This module contains the implementation of :class:`~can.Notifier`.
 import asyncio
 import functools
 import logging
+import selectors
 import threading
 import time
 from collections.abc import Awaitable, Iterable
@@ -20,7 +21,7 @@ from typing import (
 )
 
 from can.bus import BusABC
-from can.listener import Listener
+from can.listener import Listener, OverflowPolicy, QueuedListener, _batch_handler
 from can.message import Message
 
 logger = logging.getLogger("can.Notifier")
@@ -107,12 +108,21 @@ class Notifier(AbstractContextManager["Notifier"]):
 
     _registry: Final = _NotifierRegistry()
 
+    #: The default maximum number of messages read from a bus at once, which
+    #: also prevents a busy bus from starving the others in the selector thread
+    _MAX_BATCH_SIZE: Final = 64
+
     def __init__(
         self,
         bus: Union[BusABC, list[BusABC]],
         listeners: Iterable[MessageRecipient],
         timeout: float = 1.0,
         loop: Optional[asyncio.AbstractEventLoop] = None,
+        use_selector: bool = False,
+        listener_queue_size: Optional[int] = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        max_batch_size: int = _MAX_BATCH_SIZE,
+        max_batch_latency: float = 0.0,
     ) -> None:
         """Manages the distribution of :class:`~can.Message` instances to listeners.
 
@@ -133,13 +143,61 @@ class Notifier(AbstractContextManager["Notifier"]):
             An optional maximum number of seconds to wait for any :class:`~can.Message`.
         :param loop:
             An :mod:`asyncio` event loop to schedule the ``listeners`` in.
+        :param use_selector:
+            If ``True`` and no *loop* is given, all buses which provide a file
+            descriptor (see :meth:`~can.BusABC.fileno`) are served by a single
+            thread waiting on a :mod:`selectors` selector instead of one thread
+            per bus. Buses without a file descriptor still get their own thread.
+            This reduces the number of threads and context switches when many
+            buses are used.
+        :param listener_queue_size:
+            If given, every listener is wrapped into a :class:`~can.QueuedListener`
+            with a queue of this size, such that each listener is called by its
+            own worker thread and a slow listener does not delay the reception
+            of messages or the other listeners. The wrappers are available in
+            :attr:`listeners`. Cannot be combined with *loop*.
+        :param overflow_policy:
+            What to do with a new message while the queue of a listener is full,
+            only used with *listener_queue_size*.
+        :param max_batch_size:
+            The maximum number of messages which are read from a bus at once
+            and passed to the listeners together. This also limits how many
+            messages are read per wakeup of the *loop* or of the selector
+            thread, such that a busy bus cannot starve the other buses or
+            callbacks.
+        :param max_batch_latency:
+            The number of seconds a reader thread keeps collecting messages
+            after the first one of a batch has arrived, until *max_batch_size*
+            is reached. Coalescing bursts of messages this way reduces the number
+            of wakeups of the event loop, since every batch is scheduled in the
+            *loop* with a single call to
+            :meth:`~asyncio.loop.call_soon_threadsafe`. This delays the delivery
+            of messages by up to this duration. Buses watched by the event loop
+            or by the selector thread are not affected.
         :raises ValueError:
-            If a passed in *bus* is already assigned to an active :class:`~can.Notifier`.
+            If a passed in *bus* is already assigned to an active :class:`~can.Notifier`,
+            if both *loop* and *listener_queue_size* are given or if the batch
+            parameters are out of range.
         """
-        self.listeners: list[MessageRecipient] = list(listeners)
+        if loop is not None and listener_queue_size is not None:
+            raise ValueError("listener queues cannot be used with an event loop")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if max_batch_latency < 0:
+            raise ValueError("max_batch_latency must not be negative")
+
+        self._listener_queue_size = listener_queue_size
+        self._overflow_policy = overflow_policy
+        self.listeners: list[MessageRecipient] = [
+            self._wrap_listener(listener) for listener in listeners
+        ]
         self._bus_list: list[BusABC] = []
         self.timeout = timeout
         self._loop = loop
+        self._use_selector = use_selector
+        self._max_batch_size = max_batch_size
+        self._max_batch_latency = max_batch_latency
+        self._selector: Optional[selectors.BaseSelector] = None
 
         #: Exception raised in thread
         self.exception: Optional[Exception] = None
@@ -184,6 +242,13 @@ class Notifier(AbstractContextManager["Notifier"]):
             # Use bus file descriptor to watch for messages
             self._loop.add_reader(file_descriptor, self._on_message_available, bus)
             self._readers.append(file_descriptor)
+        elif (
+            self._use_selector
+            and file_descriptor >= 0
+            and self._register_selector(bus, file_descriptor)
+        ):
+            # the bus is served by the selector thread
+            pass
         else:
             reader_thread = threading.Thread(
                 target=self._rx_thread,
@@ -194,6 +259,65 @@ class Notifier(AbstractContextManager["Notifier"]):
             reader_thread.start()
             self._readers.append(reader_thread)
 
+    def _register_selector(self, bus: BusABC, file_descriptor: int) -> bool:
+        """Watch the file descriptor of *bus* with the selector thread, which
+        is started for the first bus.
+
+        :return: ``False`` if the file descriptor cannot be watched by a selector
+        """
+        if self._selector is None:
+            self._selector = selectors.DefaultSelector()
+
+        try:
+            # buses which are added later are picked up with the next call
+            # to select(), i.e. after at most self.timeout seconds
+            self._selector.register(file_descriptor, selectors.EVENT_READ, bus)
+        except (KeyError, OSError, ValueError) as exc:
+            # e.g. not a socket on Windows or the same descriptor twice
+            logger.debug("cannot select on %s: %s", bus.channel_info, exc)
+            return False
+
+        if len(self._selector.get_map()) == 1:
+            selector_thread = threading.Thread(
+                target=self._selector_thread,
+                args=(self._selector,),
+                name=f"{self.__class__.__qualname__} selector",
+            )
+            selector_thread.daemon = True
+            selector_thread.start()
+            self._readers.append(selector_thread)
+        return True
+
+    def _selector_thread(self, selector: selectors.BaseSelector) -> None:
+        # buses which returned a full batch and may thus have more messages
+        # buffered, which would not necessarily wake up the selector
+        pending: list[BusABC] = []
+
+        while not self._stopped:
+            try:
+                events = selector.select(0.0 if pending else self.timeout)
+                ready = pending + [
+                    key.data for key, _ in events if key.data not in pending
+                ]
+                pending = []
+                for bus in ready:
+                    msgs = bus.recv_batch(max_count=self._max_batch_size, timeout=0.0)
+                    if len(msgs) >= self._max_batch_size:
+                        pending.append(bus)
+                    if msgs:
+                        with self._lock:
+                            self._on_messages_received(msgs)
+            except Exception as exc:  # pylint: disable=broad-except
+                if self._stopped:
+                    # the selector was closed by stop()
+                    break
+                self.exception = exc
+                if not self._on_error(exc):
+                    # If it was not handled, raise the exception here
+                    raise
+                # It was handled, so only log it
+                logger.debug("suppressed exception: %s", exc)
+
     def stop(self, timeout: float = 5.0) -> None:
         """Stop notifying Listeners when new :class:`~can.Message` objects arrive
         and call :meth:`~can.Listener.stop` on each Listener.
@@ -212,6 +336,9 @@ class Notifier(AbstractContextManager["Notifier"]):
             elif self._loop:
                 # reader is a file descriptor
                 self._loop.remove_reader(reader)
+        if self._selector is not None:
+            self._selector.close()
+
         for listener in self.listeners:
             if hasattr(listener, "stop"):
                 listener.stop()
@@ -223,18 +350,18 @@ class Notifier(AbstractContextManager["Notifier"]):
     def _rx_thread(self, bus: BusABC) -> None:
         # determine message handling callable early, not inside while loop
         if self._loop:
-            handle_message: Callable[[Message], Any] = functools.partial(
+            handle_messages: Callable[[list[Message]], Any] = functools.partial(
                 self._loop.call_soon_threadsafe,
-                self._on_message_received,  # type: ignore[arg-type]
+                self._on_messages_received,  # type: ignore[arg-type]
             )
         else:
-            handle_message = self._on_message_received
+            handle_messages = self._on_messages_received
 
         while not self._stopped:
             try:
-                if msg := bus.recv(self.timeout):
+                if msgs := self._recv_batch(bus):
                     with self._lock:
-                        handle_message(msg)
+                        handle_messages(msgs)
             except Exception as exc:  # pylint: disable=broad-except
                 self.exception = exc
                 if self._loop is not None:
@@ -248,16 +375,76 @@ class Notifier(AbstractContextManager["Notifier"]):
                     # It was handled, so only log it
                     logger.debug("suppressed exception: %s", exc)
 
+    def _recv_batch(self, bus: BusABC) -> list[Message]:
+        """Wait for the next messages of *bus* and keep collecting them for up
+        to :attr:`_max_batch_latency` seconds."""
+        msgs = bus.recv_batch(self._max_batch_size, self.timeout)
+        if not msgs or self._max_batch_latency <= 0:
+            return msgs
+
+        deadline = time.perf_counter() + self._max_batch_latency
+        while len(msgs) < self._max_batch_size and not self._stopped:
+            time_left = deadline - time.perf_counter()
+            if time_left <= 0:
+                break
+            msgs += bus.recv_batch(self._max_batch_size - len(msgs), time_left)
+        return msgs
+
     def _on_message_available(self, bus: BusABC) -> None:
-        if msg := bus.recv(0):
-            self._on_message_received(msg)
+        # read all messages that are immediately available, up to a limit that
+        # gives other callbacks of the event loop a chance to run in between
+        if self._stopped:
+            return
+        msgs = bus.recv_batch(self._max_batch_size, 0.0)
+        if len(msgs) >= self._max_batch_size and self._loop is not None:
+            # the bus may have more messages buffered, which would not
+            # necessarily make its file descriptor readable again
+            self._loop.call_soon(self._on_message_available, bus)
+        if msgs:
+            self._on_messages_received(msgs)
+
+    def _on_messages_received(self, msgs: list[Message]) -> None:
+        """Pass the messages to every listener, even if some of them fail.
+
+        :raises Exception:
+            The first exception which no listener handled, after the messages
+            were passed to all listeners.
+        """
+        unhandled: Optional[Exception] = None
 
-    def _on_message_received(self, msg: Message) -> None:
         for callback in self.listeners:
-            res = callback(msg)
-            if res and self._loop and asyncio.iscoroutine(res):
-                # Schedule coroutine
-                self._loop.create_task(res)
+            on_messages_received = _batch_handler(callback)
+            if on_messages_received is not None:
+                try:
+                    on_messages_received(msgs)
+                except Exception as exc:  # pylint: disable=broad-except
+                    if not self._on_listener_error(exc) and unhandled is None:
+                        unhandled = exc
+                continue
+
+            # other listeners are called for every message, such that a
+            # failing message does not affect the rest of the batch
+            for msg in msgs:
+                try:
+                    res = callback(msg)
+                except Exception as exc:  # pylint: disable=broad-except
+                    if not self._on_listener_error(exc) and unhandled is None:
+                        unhandled = exc
+                    continue
+                if res and self._loop and asyncio.iscoroutine(res):
+                    # Schedule coroutine
+                    self._loop.create_task(res)
+
+        if unhandled is not None:
+            raise unhandled
+
+    def _on_listener_error(self, exc: Exception) -> bool:
+        self.exception = exc
+        if self._on_error(exc):
+            # It was handled, so only log it
+            logger.debug("suppressed exception: %s", exc)
+            return True
+        return False
 
     def _on_error(self, exc: Exception) -> bool:
         """Calls ``on_error()`` for all listeners if they implement it.
@@ -284,7 +471,7 @@ class Notifier(AbstractContextManager["Notifier"]):
 
         :param listener: Listener to be added to the list to be notified
         """
-        self.listeners.append(listener)
+        self.listeners.append(self._wrap_listener(listener))
 
     def remove_listener(self, listener: MessageRecipient) -> None:
         """Remove a listener from the notification list. This method
@@ -294,8 +481,25 @@ class Notifier(AbstractContextManager["Notifier"]):
         :param listener: Listener to be removed from the list to be notified
         :raises ValueError: if `listener` was never added to this notifier
         """
+        if self._listener_queue_size is None:
+            self.listeners.remove(listener)
+            return
+
+        for index, queued in enumerate(self.listeners):
+            if isinstance(queued, QueuedListener) and queued.listener is listener:
+                del self.listeners[index]
+                # deliver the pending messages, but do not stop the listener itself
+                queued._stop_worker()  # pylint: disable=protected-access
+                return
         self.listeners.remove(listener)
 
+    def _wrap_listener(self, listener: MessageRecipient) -> MessageRecipient:
+        if self._listener_queue_size is None:
+            return listener
+        return QueuedListener(
+            listener, self._listener_queue_size, self._overflow_policy
+        )
+
     @property
     def stopped(self) -> bool:
         """Return ``True``, if Notifier was properly shut down with :meth:`~can.Notifier.stop`."""
@@ -0,0 +1,274 @@
+"""
+This module contains :class:`~can.MessageRouter`, a listener which dispatches
+messages to handlers by their arbitration ID.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+from collections.abc import Sequence
+from typing import Any, Final, Optional
+
+from can.listener import Listener
+from can.message import Message
+from can.notifier import MessageRecipient
+
+logger = logging.getLogger(__name__)
+
+#: A mask which compares all bits of standard and extended identifiers
+_FULL_MASK: Final = 0x1FFFFFFF
+
+# a route: (sequence number, handler), the number preserves the registration order
+_Route = tuple[int, MessageRecipient]
+
+
+class MessageRouter(Listener):
+    """Dispatches every message only to the handlers which are registered
+    for its arbitration ID.
+
+    Instead of registering many listeners with a :class:`~can.Notifier`, which
+    would all be called for every message, a single router is registered and
+    the handlers are added to it::
+
+        router = can.MessageRouter(default=unknown_message)
+        router.add_route(0x123, on_engine_speed)
+        router.add_route(0x400, on_diagnostics, can_mask=0x700)
+        notifier = can.Notifier(bus, [router])
+
+    A route matches, when ``<received_can_id> & can_mask == can_id & can_mask``,
+    the same rule as for :meth:`can.BusABC.set_filters`. If several routes match,
+    their handlers are called in the order they were added. The *default*
+    handler is only called for messages which do not match any route.
+
+    Like in :class:`~can.filters.CompiledFilters`, the routes are grouped by
+    mask, so resolving the handlers of an arbitration ID takes time proportional
+    to the number of distinct masks. The result is cached per arbitration ID,
+    such that dispatching a message takes constant time, no matter how many
+    handlers are registered.
+
+    The handlers may be :class:`~can.Listener` instances or callables. They
+    may also be coroutine functions, which are scheduled as tasks in the
+    running event loop of an :mod:`asyncio` :class:`~can.Notifier`. With a
+    threaded notifier, the event loop to run them in must be passed as *loop*.
+    """
+
+    #: The maximum number of arbitration IDs whose handlers are cached
+    CACHE_SIZE: Final = 4096
+
+    def __init__(
+        self,
+        default: Optional[MessageRecipient] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> None:
+        """
+        :param default:
+            The handler for all messages which do not match any route.
+        :param loop:
+            The event loop to run coroutine handlers in, if the messages are
+            not dispatched from a running event loop. Otherwise, such handlers
+            are not run and a warning is logged.
+        """
+        self._default = default
+        self._loop = loop
+
+        # is_extended_id => can_mask => can_id & can_mask => routes
+        self._routes: dict[bool, dict[int, dict[int, list[_Route]]]] = {
+            False: {},
+            True: {},
+        }
+        self._sequence = itertools.count()
+        self._cache: dict[tuple[int, bool], tuple[MessageRecipient, ...]] = {}
+        self._tasks: set[asyncio.Task[Any]] = set()
+        # serializes changes of the routes with resolving the handlers of an ID
+        self._lock = threading.Lock()
+
+    @property
+    def default(self) -> Optional[MessageRecipient]:
+        """The handler for all messages which do not match any route."""
+        return self._default
+
+    @default.setter
+    def default(self, handler: Optional[MessageRecipient]) -> None:
+        with self._lock:
+            self._default = handler
+            self._cache.clear()
+
+    def add_route(
+        self,
+        can_id: int,
+        handler: MessageRecipient,
+        can_mask: int = _FULL_MASK,
+        extended: Optional[bool] = None,
+    ) -> None:
+        """Call *handler* for every message matching *can_id* and *can_mask*.
+
+        :param can_id: The arbitration ID to match.
+        :param handler: The :class:`~can.Listener` or callable to call.
+        :param can_mask:
+            The bits of the arbitration ID to compare, by default all of them.
+        :param extended:
+            Only match extended (``True``) or standard (``False``) identifiers.
+            By default, both are matched.
+        """
+        with self._lock:
+            route = (next(self._sequence), handler)
+            for is_extended in self._kinds(extended):
+                buckets = self._routes[is_extended].setdefault(can_mask, {})
+                buckets.setdefault(can_id & can_mask, []).append(route)
+            self._cache.clear()
+
+    def remove_route(
+        self,
+        can_id: int,
+        handler: MessageRecipient,
+        can_mask: int = _FULL_MASK,
+        extended: Optional[bool] = None,
+    ) -> None:
+        """Remove a route which was added with the same arguments
+        by :meth:`add_route`.
+
+        :raises ValueError: If no such route exists.
+        """
+        removed = False
+        with self._lock:
+            for is_extended in self._kinds(extended):
+                buckets = self._routes[is_extended].get(can_mask, {})
+                routes = buckets.get(can_id & can_mask, [])
+                for index, (_, routed_handler) in enumerate(routes):
+                    if routed_handler is handler:
+                        del routes[index]
+                        removed = True
+                        break
+                if not routes:
+                    buckets.pop(can_id & can_mask, None)
+                if not buckets:
+                    self._routes[is_extended].pop(can_mask, None)
+            self._cache.clear()
+
+        if not removed:
+            raise ValueError(f"no route for {handler!r} on ID 0x{can_id:X}")
+
+    @staticmethod
+    def _kinds(extended: Optional[bool]) -> tuple[bool, ...]:
+        return (False, True) if extended is None else (extended,)
+
+    def handlers(
+        self, arbitration_id: int, is_extended_id: bool
+    ) -> tuple[MessageRecipient, ...]:
+        """Return the handlers which are called for the given identifier.
+
+        :param arbitration_id: the arbitration ID of a message
+        :param is_extended_id: whether the ID is an extended (29 bit) identifier
+        :return: the matching handlers in the order they were added
+        """
+        key = (arbitration_id, is_extended_id)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            matches: list[_Route] = []
+            for can_mask, buckets in self._routes[is_extended_id].items():
+                matches += buckets.get(arbitration_id & can_mask, ())
+            handlers = tuple(
+                handler for _, handler in sorted(matches, key=_sequence_key)
+            )
+            if not handlers and self._default is not None:
+                handlers = (self._default,)
+
+            if len(self._cache) >= self.CACHE_SIZE:
+                self._cache.clear()
+            self._cache[key] = handlers
+        return handlers
+
+    def on_message_received(self, msg: Message) -> None:
+        for handler in self.handlers(msg.arbitration_id, msg.is_extended_id):
+            result = handler(msg)
+            if result is not None and asyncio.iscoroutine(result):
+                self._schedule(result)
+
+    def on_messages_received(self, msgs: Sequence[Message]) -> None:
+        cache = self._cache
+        for msg in msgs:
+            key = (msg.arbitration_id, msg.is_extended_id)
+            handlers = cache.get(key)
+            if handlers is None:
+                handlers = self.handlers(*key)
+            for handler in handlers:
+                result = handler(msg)
+                if result is not None and asyncio.iscoroutine(result):
+                    self._schedule(result)
+
+    def _schedule(self, coroutine: Any) -> None:
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = (
+                asyncio.get_running_loop()
+            )
+        except RuntimeError:
+            # e.g. called by the thread of a threaded Notifier
+            running_loop = None
+
+        if running_loop is not None and self._loop in (None, running_loop):
+            # keep a reference, since the event loop only holds weak references to tasks
+            task = running_loop.create_task(coroutine)
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        elif self._loop is not None:
+            asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        else:
+            logger.warning("no event loop to run %r in", coroutine)
+            coroutine.close()
+
+    def _all_handlers(self) -> list[MessageRecipient]:
+        # every handler once, in the order they were added, then the default
+        with self._lock:
+            routes = sorted(
+                (
+                    route
+                    for routes_by_mask in self._routes.values()
+                    for buckets in routes_by_mask.values()
+                    for routes in buckets.values()
+                    for route in routes
+                ),
+                key=_sequence_key,
+            )
+            if self._default is not None:
+                routes.append((-1, self._default))
+
+        handlers: list[MessageRecipient] = []
+        seen: set[int] = set()
+        for _, handler in routes:
+            if id(handler) not in seen:
+                seen.add(id(handler))
+                handlers.append(handler)
+        return handlers
+
+    def on_error(self, exc: Exception) -> None:
+        """Pass the exception to all handlers which handle errors.
+
+        :raises NotImplementedError: If none of the handlers handles errors.
+        """
+        was_handled = False
+        for handler in self._all_handlers():
+            if hasattr(handler, "on_error"):
+                try:
+                    handler.on_error(exc)
+                except NotImplementedError:
+                    pass
+                else:
+                    was_handled = True
+
+        if not was_handled:
+            raise NotImplementedError()
+
+    def stop(self) -> None:
+        """Stop all handlers which implement :meth:`~can.Listener.stop`."""
+        for handler in self._all_handlers():
+            if hasattr(handler, "stop"):
+                handler.stop()
+
+
+def _sequence_key(route: _Route) -> int:
+    return route[0]
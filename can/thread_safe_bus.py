@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from contextlib import nullcontext
 from threading import RLock
 from typing import Any, Optional
@@ -71,10 +72,22 @@ class ThreadSafeBus(ObjectProxy):  # pylint: disable=abstract-method
         with self._lock_recv:
             return self.__wrapped__.recv(timeout=timeout)
 
+    def recv_batch(
+        self, max_count: int = 64, timeout: Optional[float] = None
+    ) -> list[Message]:
+        with self._lock_recv:
+            return self.__wrapped__.recv_batch(max_count=max_count, timeout=timeout)
+
     def send(self, msg: Message, timeout: Optional[float] = None) -> None:
         with self._lock_send:
             return self.__wrapped__.send(msg=msg, timeout=timeout)
 
+    def send_batch(
+        self, msgs: Sequence[Message], timeout: Optional[float] = None
+    ) -> int:
+        with self._lock_send:
+            return self.__wrapped__.send_batch(msgs=msgs, timeout=timeout)
+
     # send_periodic does not need a lock, since the underlying
     # `send` method is already synchronized
 
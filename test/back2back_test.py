@@ -212,6 +212,39 @@ class Back2BackTestCase(unittest.TestCase):
         finally:
             bus3.shutdown()
 
+    def test_recv_batch(self):
+        sent_msgs = [
+            can.Message(is_extended_id=False, arbitration_id=0x100 + i, data=[i])
+            for i in range(5)
+        ]
+        for msg in sent_msgs:
+            self.bus1.send(msg)
+
+        recv_msgs = []
+        while len(recv_msgs) < len(sent_msgs):
+            batch = self.bus2.recv_batch(max_count=len(sent_msgs), timeout=self.TIMEOUT)
+            self.assertTrue(batch, "No message was received on %s" % self.INTERFACE_2)
+            self.assertLessEqual(len(batch), len(sent_msgs) - len(recv_msgs))
+            recv_msgs += batch
+
+        for recv_msg, sent_msg in zip(recv_msgs, sent_msgs):
+            self._check_received_message(recv_msg, sent_msg)
+
+    def test_send_batch(self):
+        sent_msgs = [
+            can.Message(is_extended_id=True, arbitration_id=0x200 + i, data=[i, i])
+            for i in range(20)
+        ]
+        self.assertEqual(self.bus1.send_batch(sent_msgs), len(sent_msgs))
+
+        for sent_msg in sent_msgs:
+            recv_msg = self.bus2.recv(self.TIMEOUT)
+            self._check_received_message(recv_msg, sent_msg)
+        self.assertIsNone(self.bus2.recv(0))
+
+    def test_recv_batch_timeout(self):
+        self.assertEqual(self.bus1.recv_batch(timeout=0.1), [])
+
     def test_fd_message(self):
         msg = can.Message(
             is_fd=True, is_extended_id=True, arbitration_id=0x56789, data=[0xFF] * 64
@@ -6,6 +6,7 @@ import logging
 import os
 import random
 import tempfile
+import threading
 import unittest
 import warnings
 from os.path import dirname, join
@@ -158,6 +159,155 @@ class ListenerTest(BusTest):
         self.assertIsNotNone(a_listener.get_message(0.1))
 
 
+class QueuedListenerTest(unittest.TestCase):
+    def setUp(self):
+        self.release = threading.Event()
+        self.received = []
+
+    def slow_listener(self, msg):
+        self.release.wait(5)
+        self.received.append(msg.arbitration_id)
+
+    def _fill(self, listener, count):
+        for arbitration_id in range(count):
+            listener(can.Message(arbitration_id=arbitration_id))
+
+    def test_delivers_in_order(self):
+        reader = can.BufferedReader()
+        listener = can.QueuedListener(reader, max_size=10)
+        self._fill(listener, 5)
+        listener.stop()
+        self.assertTrue(reader.is_stopped)
+        self.assertEqual(listener.delivered, 5)
+        self.assertEqual(
+            [reader.get_message(0).arbitration_id for _ in range(5)], list(range(5))
+        )
+
+    def test_drop_newest(self):
+        listener = can.QueuedListener(
+            self.slow_listener,
+            max_size=2,
+            overflow_policy=can.OverflowPolicy.DROP_NEWEST,
+        )
+        self._fill(listener, 6)
+        self.release.set()
+        listener.stop()
+        # the first message may have been taken by the worker already
+        self.assertIn(self.received, ([0, 1], [0, 1, 2]))
+        self.assertEqual(listener.dropped + listener.delivered, 6)
+        self.assertEqual(listener.max_lag, 2)
+
+    def test_drop_oldest(self):
+        listener = can.QueuedListener(
+            self.slow_listener,
+            max_size=2,
+            overflow_policy=can.OverflowPolicy.DROP_OLDEST,
+        )
+        self._fill(listener, 6)
+        self.assertEqual(listener.lag, 2)
+        self.release.set()
+        listener.stop()
+        self.assertEqual(self.received[-2:], [4, 5])
+        self.assertEqual(listener.dropped + listener.delivered, 6)
+
+    def test_block(self):
+        listener = can.QueuedListener(self.slow_listener, max_size=2)
+        producer = threading.Thread(target=self._fill, args=(listener, 6))
+        producer.start()
+        producer.join(0.2)
+        # the producer waits for the listener
+        self.assertTrue(producer.is_alive())
+        self.release.set()
+        producer.join(5)
+        listener.stop()
+        self.assertEqual(self.received, list(range(6)))
+        self.assertEqual(listener.dropped, 0)
+
+    def test_error(self):
+        errors = []
+
+        class FailingListener(can.Listener):
+            def on_message_received(self, msg):
+                raise ValueError(msg.arbitration_id)
+
+            def on_error(self, exc):
+                errors.append(exc)
+
+        listener = can.QueuedListener(FailingListener())
+        self._fill(listener, 3)
+        listener.stop()
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(listener.delivered, 3)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            can.QueuedListener(self.slow_listener, max_size=0)
+
+
+class RingBufferedReaderTest(unittest.TestCase):
+    def _fill(self, reader, count):
+        for arbitration_id in range(count):
+            reader(can.Message(arbitration_id=arbitration_id))
+
+    def _ids(self, msgs):
+        return [msg.arbitration_id for msg in msgs]
+
+    def test_fifo(self):
+        reader = can.RingBufferedReader(size=4)
+        self._fill(reader, 3)
+        self.assertEqual(reader.occupancy, 3)
+        self.assertEqual(reader.get_message(0).arbitration_id, 0)
+        self.assertEqual(self._ids(reader.get_messages()), [1, 2])
+        self.assertIsNone(reader.get_message(0.01))
+        self.assertEqual(reader.get_messages(timeout=0.01), [])
+        self.assertEqual(reader.high_water_mark, 3)
+
+    def test_wraps_around(self):
+        reader = can.RingBufferedReader(size=3)
+        for batch in ([0, 1], [2, 3], [4, 5]):
+            reader.on_messages_received([can.Message(arbitration_id=i) for i in batch])
+            self.assertEqual(self._ids(reader.get_messages(max_count=2)), batch)
+        self.assertEqual(reader.dropped, 0)
+
+    def test_drop_oldest(self):
+        reader = can.RingBufferedReader(size=3)
+        self._fill(reader, 5)
+        self.assertEqual(reader.dropped, 2)
+        self.assertEqual(reader.occupancy, 3)
+        self.assertEqual(self._ids(reader.get_messages()), [2, 3, 4])
+
+    def test_drop_newest(self):
+        reader = can.RingBufferedReader(
+            size=3, overflow_policy=can.OverflowPolicy.DROP_NEWEST
+        )
+        self._fill(reader, 5)
+        self.assertEqual(reader.dropped, 2)
+        self.assertEqual(self._ids(reader.get_messages(max_count=10)), [0, 1, 2])
+
+    def test_waits_for_message(self):
+        reader = can.RingBufferedReader()
+        timer = threading.Timer(0.05, reader, args=(can.Message(arbitration_id=7),))
+        timer.start()
+        self.assertEqual(self._ids(reader.get_messages(timeout=2.0)), [7])
+        timer.join()
+
+    def test_stop(self):
+        reader = can.RingBufferedReader()
+        self._fill(reader, 1)
+        reader.stop()
+        with self.assertRaises(RuntimeError):
+            reader(can.Message())
+        # buffered messages can still be fetched without blocking
+        self.assertIsNotNone(reader.get_message(5))
+        self.assertIsNone(reader.get_message(5))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            can.RingBufferedReader(size=0)
+        with self.assertRaises(ValueError):
+            can.RingBufferedReader(overflow_policy=can.OverflowPolicy.BLOCK)
+
+
 def test_deprecated_loop_arg(recwarn):
     try:
         loop = asyncio.get_running_loop()
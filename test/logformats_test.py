@@ -19,7 +19,7 @@ import unittest
 from abc import ABCMeta, abstractmethod
 from contextlib import contextmanager
 from datetime import datetime
-from itertools import zip_longest
+from itertools import cycle, zip_longest
 from pathlib import Path
 from unittest.mock import patch
 
@@ -236,6 +236,34 @@ class ReaderWriterTest(unittest.TestCase, ComparingMessagesTestCase, metaclass=A
         self.assertMessagesEqual(self.original_messages, read_messages)
         self.assertIncludesComments(self.test_file_name)
 
+    def test_batches(self):
+        """testing that on_messages_received() writes the same messages as
+        on_message_received() with batches of varying size"""
+        with self.writer_constructor(self.test_file_name) as writer:
+            for msg in self.original_messages:
+                writer.on_message_received(msg)
+        with self.reader_constructor(self.test_file_name) as reader:
+            expected_messages = list(reader)
+
+        # use another file, since some formats always append
+        with tempfile.NamedTemporaryFile("w+", delete=False) as test_file:
+            batch_file_name = test_file.name
+        self.addCleanup(os.remove, batch_file_name)
+
+        with self.writer_constructor(batch_file_name) as writer:
+            messages = self.original_messages
+            start = 0
+            for size in cycle((1, 3, 7)):
+                if start >= len(messages):
+                    break
+                writer.on_messages_received(messages[start : start + size])
+                start += size
+        with self.reader_constructor(batch_file_name) as reader:
+            read_messages = list(reader)
+
+        self.assertEqual(len(read_messages), len(self.original_messages))
+        self.assertMessagesEqual(expected_messages, read_messages)
+
     def test_path_like_context_manager(self):
         """testing with path-like object and context manager"""
 
@@ -705,6 +733,28 @@ class TestBlfFileFormat(ReaderWriterTest):
         with can.BLFReader(logfile) as reader:
             return list(reader)
 
+    def test_batch_spanning_containers(self):
+        messages = self.original_messages * 20
+        with can.BLFWriter(self.test_file_name, max_container_size=256) as writer:
+            writer.on_messages_received(messages)
+            # the buffer never holds more than a single container
+            self.assertLess(writer._buffer_size, writer.max_container_size)
+        self.assertMessagesEqual(messages, self._read_log_file(self.test_file_name))
+
+    def test_zero_copy(self):
+        for filename in (
+            "test_CanMessage.blf",
+            "test_CanFdMessage.blf",
+            "test_CanFdMessage64.blf",
+            "test_CanErrorFrameExt.blf",
+            "test_CanMessage2.blf",
+            "issue_1905.blf",
+        ):
+            logfile = os.path.join(os.path.dirname(__file__), "data", filename)
+            with can.BLFReader(logfile, zero_copy=True) as reader:
+                actual = list(reader)
+            self.assertMessagesEqual(actual, self._read_log_file(filename))
+
     def test_can_message(self):
         expected = can.Message(
             timestamp=2459565876.494607,
@@ -907,6 +957,16 @@ class TestSqliteDatabaseFormat(ReaderWriterTest):
 
         self.assertMessagesEqual(self.original_messages, read_messages)
 
+    def test_reused_batch(self):
+        """the writer must not keep a reference to the batch of the caller"""
+        with self.writer_constructor(self.test_file_name) as writer:
+            batch = list(self.original_messages)
+            writer.on_messages_received(batch)
+            batch.clear()
+
+        with self.reader_constructor(self.test_file_name) as reader:
+            self.assertMessagesEqual(self.original_messages, list(reader))
+
 
 class TestPrinter(unittest.TestCase):
     """Tests that can.Printer does not crash.
@@ -1,10 +1,67 @@
 #!/usr/bin/env python
 
 import asyncio
+import select
+import socket
+import threading
 import time
 import unittest
+from collections import deque
+from typing import Optional
 
 import can
+from can.message import RECORD_STRUCT
+
+
+class _SocketBus(can.BusABC):
+    """A minimal bus which transfers messages over one end of a socket pair."""
+
+    def __init__(self, sock: socket.socket, channel: int) -> None:
+        self._socket = sock
+        self.channel_info = f"socket {channel}"
+        super().__init__(channel=channel)
+
+    @classmethod
+    def pair(cls, channel: int) -> tuple["_SocketBus", "_SocketBus"]:
+        sock_a, sock_b = socket.socketpair()
+        return cls(sock_a, channel), cls(sock_b, channel)
+
+    def _recv_internal(
+        self, timeout: Optional[float]
+    ) -> tuple[Optional[can.Message], bool]:
+        if not select.select([self._socket], [], [], timeout)[0]:
+            return None, False
+        data = self._socket.recv(RECORD_STRUCT.size)
+        return can.Message.from_bytes(data), False
+
+    def send(self, msg: can.Message, timeout: Optional[float] = None) -> None:
+        self._socket.sendall(msg.to_bytes())
+
+    def fileno(self) -> int:
+        return self._socket.fileno()
+
+    def shutdown(self) -> None:
+        super().shutdown()
+        self._socket.close()
+
+
+class _BufferingSocketBus(_SocketBus):
+    """Reads everything that is available from the socket at once and keeps
+    the messages in user space, like e.g. the udp_multicast interface."""
+
+    def __init__(self, sock: socket.socket, channel: int) -> None:
+        super().__init__(sock, channel)
+        self._buffer: deque[can.Message] = deque()
+
+    def _recv_internal(
+        self, timeout: Optional[float]
+    ) -> tuple[Optional[can.Message], bool]:
+        if not self._buffer:
+            if not select.select([self._socket], [], [], timeout)[0]:
+                return None, False
+            data = self._socket.recv(100 * RECORD_STRUCT.size)
+            self._buffer.extend(can.Message.unpack_many(data))
+        return self._buffer.popleft(), False
 
 
 class NotifierTest(unittest.TestCase):
@@ -70,6 +127,191 @@ class NotifierTest(unittest.TestCase):
                 # find_instance must return the existing instance
                 self.assertEqual(can.Notifier.find_instances(bus), (notifier,))
 
+    def test_batches(self):
+        batches = []
+
+        class BatchListener(can.Listener):
+            def on_message_received(self, msg):
+                batches.append([msg])
+
+            def on_messages_received(self, msgs):
+                batches.append(list(msgs))
+
+        single = can.BufferedReader()
+        with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+            # buffered messages are read at once by the notifier
+            for arbitration_id in range(10):
+                bus.send(can.Message(arbitration_id=arbitration_id))
+            with can.Notifier(bus, [BatchListener(), single], 0.1):
+                received = [single.get_message(1) for _ in range(10)]
+
+        self.assertEqual([msg.arbitration_id for msg in received], list(range(10)))
+        self.assertEqual(
+            [msg.arbitration_id for batch in batches for msg in batch], list(range(10))
+        )
+        self.assertLess(len(batches), 10)
+
+    def test_failing_listener(self):
+        errors = []
+
+        class FailingListener(can.Listener):
+            def on_message_received(self, msg):
+                if msg.arbitration_id == 1:
+                    raise ValueError("listener failed")
+
+            def on_error(self, exc):
+                errors.append(exc)
+
+        with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+            for arbitration_id in range(5):
+                bus.send(can.Message(arbitration_id=arbitration_id))
+            reader = can.BufferedReader()
+            with can.Notifier(bus, [FailingListener(), reader], 0.1) as notifier:
+                received = [reader.get_message(1) for _ in range(5)]
+                self.assertIsInstance(notifier.exception, ValueError)
+        # neither the other messages nor the other listeners are affected
+        self.assertEqual([msg.arbitration_id for msg in received], list(range(5)))
+        self.assertEqual(len(errors), 1)
+
+
+class QueuedNotifierTest(unittest.TestCase):
+    def test_slow_listener(self):
+        release = threading.Event()
+
+        def slow_listener(msg):
+            release.wait(5)
+
+        with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+            reader = can.BufferedReader()
+            notifier = can.Notifier(
+                bus,
+                [slow_listener, reader],
+                0.1,
+                listener_queue_size=5,
+                overflow_policy=can.OverflowPolicy.DROP_NEWEST,
+            )
+            self.assertIsInstance(notifier.listeners[0], can.QueuedListener)
+
+            for _ in range(20):
+                bus.send(can.Message())
+                time.sleep(0.005)
+            # the fast listener is not delayed by the slow one
+            for _ in range(20):
+                self.assertIsNotNone(reader.get_message(1))
+            self.assertEqual(notifier.listeners[1].dropped, 0)
+            self.assertGreater(notifier.listeners[0].dropped, 0)
+
+            release.set()
+            notifier.stop()
+            self.assertTrue(reader.is_stopped)
+
+    def test_add_remove_listener(self):
+        with can.Bus("test", interface="virtual") as bus:
+            reader = can.BufferedReader()
+            with can.Notifier(bus, [], 0.1, listener_queue_size=10) as notifier:
+                notifier.add_listener(reader)
+                self.assertIs(notifier.listeners[0].listener, reader)
+                notifier.remove_listener(reader)
+                self.assertEqual(notifier.listeners, [])
+                self.assertFalse(reader.is_stopped)
+
+    def test_remove_listener_from_callback(self):
+        with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+            with can.Notifier(bus, [], 0.1, listener_queue_size=10) as notifier:
+                received = []
+                removed = threading.Event()
+
+                def one_shot(msg):
+                    received.append(msg)
+                    notifier.remove_listener(one_shot)
+                    removed.set()
+
+                notifier.add_listener(one_shot)
+                bus.send(can.Message())
+                self.assertTrue(removed.wait(1))
+                self.assertEqual(notifier.listeners, [])
+                self.assertIsNone(notifier.exception)
+            self.assertEqual(len(received), 1)
+
+    def test_loop(self):
+        with can.Bus("test", interface="virtual") as bus:
+            with self.assertRaises(ValueError):
+                can.Notifier(
+                    bus, [], loop=asyncio.new_event_loop(), listener_queue_size=10
+                )
+
+
+class SelectorNotifierTest(unittest.TestCase):
+    def setUp(self):
+        self.pairs = [_SocketBus.pair(channel) for channel in range(4)]
+
+    def tearDown(self):
+        for pair in self.pairs:
+            for bus in pair:
+                bus.shutdown()
+
+    def test_single_thread(self):
+        threads_before = threading.active_count()
+        with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+            reader = can.BufferedReader()
+            buses = [pair[0] for pair in self.pairs] + [bus]
+            notifier = can.Notifier(buses, [reader], 0.1, use_selector=True)
+
+            # one selector thread and one thread for the bus without fileno()
+            self.assertEqual(threading.active_count() - threads_before, 2)
+
+            for channel, (_, remote) in enumerate(self.pairs):
+                remote.send(can.Message(arbitration_id=channel, channel=channel))
+            bus.send(can.Message(arbitration_id=0x100))
+
+            received = [reader.get_message(1) for _ in range(len(buses))]
+            self.assertNotIn(None, received)
+            self.assertEqual(
+                sorted(msg.arbitration_id for msg in received), [0, 1, 2, 3, 0x100]
+            )
+
+            notifier.stop()
+            self.assertEqual(threading.active_count(), threads_before)
+
+    def test_burst(self):
+        # more messages than are read per wakeup
+        local, remote = self.pairs[0]
+        count = 3 * can.Notifier._MAX_BATCH_SIZE + 1
+        reader = can.BufferedReader()
+        with can.Notifier(local, [reader], 0.1, use_selector=True):
+            for index in range(count):
+                remote.send(can.Message(arbitration_id=index))
+            received = [reader.get_message(1) for _ in range(count)]
+        self.assertEqual([msg.arbitration_id for msg in received], list(range(count)))
+
+    def test_add_bus(self):
+        reader = can.BufferedReader()
+        with can.Notifier(
+            self.pairs[0][0], [reader], 0.1, use_selector=True
+        ) as notifier:
+            notifier.add_bus(self.pairs[1][0])
+            self.pairs[1][1].send(can.Message(arbitration_id=1))
+            msg = reader.get_message(1)
+            self.assertIsNotNone(msg)
+            self.assertEqual(msg.arbitration_id, 1)
+
+    def test_error(self):
+        local, remote = self.pairs[0]
+        errors = []
+
+        class ErrorListener(can.Listener):
+            def on_message_received(self, msg):
+                raise ValueError("listener failed")
+
+            def on_error(self, exc):
+                errors.append(exc)
+
+        with can.Notifier(local, [ErrorListener()], 0.1, use_selector=True) as notifier:
+            remote.send(can.Message())
+            time.sleep(0.2)
+            self.assertIsInstance(notifier.exception, ValueError)
+        self.assertEqual(len(errors), 1)
+
 
 class AsyncNotifierTest(unittest.TestCase):
     def test_asyncio_notifier(self):
@@ -86,6 +328,116 @@ class AsyncNotifierTest(unittest.TestCase):
 
         asyncio.run(run_it())
 
+    def test_max_batch_latency(self):
+        batches = []
+
+        class BatchListener(can.Listener):
+            def on_message_received(self, msg):
+                batches.append([msg])
+
+            def on_messages_received(self, msgs):
+                batches.append(list(msgs))
+
+        async def run_it():
+            with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+                notifier = can.Notifier(
+                    bus,
+                    [BatchListener()],
+                    0.1,
+                    loop=asyncio.get_running_loop(),
+                    max_batch_size=4,
+                    max_batch_latency=0.5,
+                )
+
+                def send_burst():
+                    for arbitration_id in range(6):
+                        bus.send(can.Message(arbitration_id=arbitration_id))
+                        time.sleep(0.01)
+
+                sender = threading.Thread(target=send_burst)
+                sender.start()
+                await asyncio.sleep(0.2)
+                # the first batch is full, the rest waits for the latency
+                self.assertEqual([len(batch) for batch in batches], [4])
+                await asyncio.sleep(0.5)
+                sender.join()
+                notifier.stop()
+
+        asyncio.run(run_it())
+        self.assertEqual([len(batch) for batch in batches], [4, 2])
+        self.assertEqual(
+            [msg.arbitration_id for batch in batches for msg in batch], list(range(6))
+        )
+
+    def test_drain_file_descriptor(self):
+        batches = []
+
+        class BatchListener(can.Listener):
+            def on_message_received(self, msg):
+                batches.append([msg])
+
+            def on_messages_received(self, msgs):
+                batches.append(list(msgs))
+
+        async def run_it():
+            bus, remote = _SocketBus.pair(0)
+            try:
+                for arbitration_id in range(10):
+                    remote.send(can.Message(arbitration_id=arbitration_id))
+                notifier = can.Notifier(
+                    bus,
+                    [BatchListener()],
+                    loop=asyncio.get_running_loop(),
+                    max_batch_size=4,
+                )
+                for _ in range(10):
+                    await asyncio.sleep(0.01)
+                notifier.stop()
+            finally:
+                bus.shutdown()
+                remote.shutdown()
+
+        asyncio.run(run_it())
+        # every wakeup of the event loop reads up to max_batch_size messages
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+        self.assertEqual(
+            [msg.arbitration_id for batch in batches for msg in batch], list(range(10))
+        )
+
+    def test_drain_user_space_buffer(self):
+        received = []
+
+        async def run_it():
+            bus, remote = _BufferingSocketBus.pair(0)
+            try:
+                notifier = can.Notifier(
+                    bus,
+                    [received.append],
+                    loop=asyncio.get_running_loop(),
+                    max_batch_size=4,
+                )
+                # the first read moves all messages into the buffer of the
+                # bus, after which the socket does not signal the others
+                remote.send_batch(
+                    [can.Message(arbitration_id=index) for index in range(10)]
+                )
+                for _ in range(10):
+                    await asyncio.sleep(0.01)
+                notifier.stop()
+            finally:
+                bus.shutdown()
+                remote.shutdown()
+
+        asyncio.run(run_it())
+        self.assertEqual([msg.arbitration_id for msg in received], list(range(10)))
+
+    def test_invalid_batch_parameters(self):
+        with can.Bus("test", interface="virtual") as bus:
+            with self.assertRaises(ValueError):
+                can.Notifier(bus, [], max_batch_size=0)
+            with self.assertRaises(ValueError):
+                can.Notifier(bus, [], max_batch_latency=-1.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,13 +6,14 @@ This module tests cyclic send tasks.
 
 import gc
 import sys
+import threading
 import time
 import traceback
 import unittest
 from threading import Thread
 from time import sleep
 from typing import List
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import can
 
@@ -289,6 +290,216 @@ class SimpleCyclicSendTaskTest(unittest.TestCase, ComparingMessagesTestCase):
         self.assertEqual(b"\x06\x00\x00\x00\x00\x00\x00\x00", bytes(msg_list[5].data))
         self.assertEqual(b"\x07\x00\x00\x00\x00\x00\x00\x00", bytes(msg_list[6].data))
 
+    def test_scheduler_shares_thread(self):
+        scheduler = can.broadcastmanager.CyclicTaskScheduler()
+        with can.ThreadSafeBus(interface="virtual", receive_own_messages=True) as bus:
+            tasks = [
+                can.broadcastmanager.ThreadBasedCyclicSendTask(
+                    bus=bus,
+                    lock=bus._lock_send_periodic,
+                    messages=can.Message(arbitration_id=arbitration_id),
+                    period=0.01,
+                    scheduler=scheduler,
+                )
+                for arbitration_id in range(50)
+            ]
+            sleep(0.1)
+            self.assertEqual({task.thread for task in tasks}, {scheduler.thread})
+
+            received = set()
+            while not bus.queue.empty():
+                received.add(bus.recv(0).arbitration_id)
+            self.assertEqual(received, set(range(50)))
+            self.assertGreater(tasks[0].statistics.lateness.count, 1)
+
+            thread = scheduler.thread
+            for task in tasks:
+                task.stop()
+            # the thread ends once all tasks are stopped
+            self.join_threads([thread], 5.0)
+            self.assertIsNone(scheduler.thread)
+
+            # and is started again on demand
+            tasks[0].start()
+            self.assertIsNotNone(scheduler.thread)
+            tasks[0].stop()
+            self.join_threads([tasks[0].thread], 5.0)
+
+    def test_scheduler_ends_on_shutdown(self):
+        bus = can.interface.Bus(interface="virtual")
+        self.assertIsNone(bus._cyclic_scheduler)
+        task = bus.send_periodic(
+            can.Message(arbitration_id=0x123), 0.01, store_task=False
+        )
+        thread = bus._cyclic_scheduler.thread
+        self.assertIs(task.thread, thread)
+        self.assertTrue(thread.is_alive())
+
+        # the task is not stopped by the bus, but the thread ends anyway
+        bus.shutdown()
+        self.assertFalse(task.stopped)
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(bus._cyclic_scheduler.thread)
+        task.stop()
+
+    def test_scheduler_restart_and_duration(self):
+        scheduler = can.broadcastmanager.CyclicTaskScheduler()
+        with can.ThreadSafeBus(interface="virtual", receive_own_messages=True) as bus:
+            task = can.broadcastmanager.ThreadBasedCyclicSendTask(
+                bus=bus,
+                lock=bus._lock_send_periodic,
+                messages=can.Message(arbitration_id=0x123),
+                period=0.05,
+                duration=0.12,
+                scheduler=scheduler,
+            )
+            # restarting a running task must not schedule it twice
+            task.stop()
+            task.start()
+            self.join_threads([task.thread], 5.0)
+            self.assertTrue(task.stopped)
+
+            count = 0
+            while not bus.queue.empty():
+                bus.recv(0)
+                count += 1
+            self.assertIn(count, (3, 4))
+
+    def test_scheduler_on_error(self):
+        scheduler = can.broadcastmanager.CyclicTaskScheduler()
+        bus = can.ThreadSafeBus(interface="virtual")
+        bus.shutdown()
+        failing = can.broadcastmanager.ThreadBasedCyclicSendTask(
+            bus=bus,
+            lock=threading.Lock(),
+            messages=can.Message(arbitration_id=0x123),
+            period=0.01,
+            on_error=MagicMock(return_value=False),
+            scheduler=scheduler,
+        )
+        with can.ThreadSafeBus(interface="virtual", receive_own_messages=True) as bus2:
+            # a failing task does not affect the others
+            working = can.broadcastmanager.ThreadBasedCyclicSendTask(
+                bus=bus2,
+                lock=bus2._lock_send_periodic,
+                messages=can.Message(arbitration_id=0x456),
+                period=0.01,
+                scheduler=scheduler,
+            )
+            sleep(0.1)
+            self.assertTrue(failing.stopped)
+            self.assertEqual(failing.on_error.call_count, 1)
+            self.assertFalse(working.stopped)
+            self.assertIsNotNone(bus2.recv(0))
+            working.stop()
+            self.join_threads([working.thread], 5.0)
+
+    def test_statistics(self):
+        with can.ThreadSafeBus(interface="virtual") as bus:
+            task = bus.send_periodic(can.Message(arbitration_id=0x123), 0.01)
+            sleep(0.1)
+            task.stop()
+            self.join_threads([task.thread], 5.0)
+
+            statistics = task.statistics
+            self.assertGreaterEqual(statistics.sent, 5)
+            self.assertEqual(statistics.errors, 0)
+            self.assertEqual(statistics.send_duration.count, statistics.sent)
+            self.assertEqual(statistics.lateness.count, statistics.sent)
+            self.assertIs(task.jitter, statistics.lateness)
+            self.assertEqual(statistics.period.count, statistics.sent - 1)
+            self.assertAlmostEqual(statistics.period.mean, 0.01, delta=0.005)
+
+            # a message sent after the next one was due misses its deadline
+            task._send_next(time.perf_counter_ns() - 50_000_000)
+            self.assertEqual(statistics.missed_deadlines, 1)
+            self.assertEqual(statistics.snapshot()["missed_deadlines"], 1)
+
+            statistics.reset()
+            self.assertEqual(statistics.sent, 0)
+            self.assertEqual(statistics.period.count, 0)
+
+    def test_overrun_policy(self):
+        period_ns = 10_000_000
+        with can.ThreadSafeBus(interface="virtual") as bus:
+            task = can.broadcastmanager.ThreadBasedCyclicSendTask(
+                bus=bus,
+                lock=bus._lock_send_periodic,
+                messages=can.Message(arbitration_id=0x123),
+                period=period_ns / 1e9,
+                autostart=False,
+            )
+            self.assertIs(task.overrun_policy, can.OverrunPolicy.CATCH_UP)
+
+            with patch("can.broadcastmanager.time") as time_mock:
+                time_mock.perf_counter_ns.return_value = 35_000_000
+                task._last_sent_ns = 33_000_000
+
+                # the next slot at 10 ms is sent immediately
+                self.assertEqual(task._next_due_ns(0), 10_000_000)
+
+                # the slots at 10, 20 and 30 ms are dropped
+                task.overrun_policy = can.OverrunPolicy.SKIP
+                self.assertEqual(task._next_due_ns(0), 40_000_000)
+                self.assertEqual(task.statistics.skipped, 3)
+
+                # one period after the late message
+                task.overrun_policy = can.OverrunPolicy.REPHASE
+                self.assertEqual(task._next_due_ns(0), 43_000_000)
+                self.assertEqual(task.statistics.skipped, 6)
+
+                # the schedule is kept if the task is in time
+                self.assertEqual(task._next_due_ns(30_000_000), 40_000_000)
+
+    def test_zero_period(self):
+        with can.ThreadSafeBus(interface="virtual") as bus:
+            task = can.broadcastmanager.ThreadBasedCyclicSendTask(
+                bus=bus,
+                lock=bus._lock_send_periodic,
+                messages=can.Message(arbitration_id=0x123),
+                period=0,
+                autostart=False,
+                # the pywin32 timers do not support a period of 0
+                scheduler=can.broadcastmanager.CyclicTaskScheduler(),
+            )
+            for policy in can.OverrunPolicy:
+                task.overrun_policy = policy
+                self.assertEqual(task._next_due_ns(1_000), 1_000)
+            self.assertEqual(task.statistics.skipped, 0)
+
+            task._send_next(time.perf_counter_ns() - 50_000_000)
+            self.assertEqual(task.statistics.sent, 1)
+            self.assertEqual(task.statistics.missed_deadlines, 0)
+
+    def test_precompute_messages(self):
+        def increment_counter(msg: can.Message) -> None:
+            counter = (msg.data[7] + 1) % 4
+            msg.data[7] = counter
+            msg.data[6] = sum(msg.data[:6]) + counter
+
+        msg = can.Message(arbitration_id=0x123, data=[1, 2, 3, 0, 0, 0, 0, 0])
+        msgs = can.broadcastmanager.precompute_messages(msg, 4, increment_counter)
+        self.assertEqual([m.data[7] for m in msgs], [1, 2, 3, 0])
+        self.assertEqual([m.data[6] for m in msgs], [7, 8, 9, 6])
+        # the given message is not modified
+        self.assertEqual(msg.data[7], 0)
+
+        # each message is modified separately
+        other = can.Message(arbitration_id=0x123, data=[0] * 8)
+        msgs = can.broadcastmanager.precompute_messages(
+            [msg, other], 4, increment_counter
+        )
+        self.assertEqual([m.data[7] for m in msgs], [1, 1, 2, 2])
+        self.assertEqual([m.data[0] for m in msgs], [1, 0, 1, 0])
+
+        modifiers = can.CyclicModifiers(can.modifiers.Counter(start_bit=0))
+        msgs = can.broadcastmanager.precompute_messages(msg, 3, modifiers)
+        self.assertEqual([m.data[0] for m in msgs], [0, 1, 2])
+        self.assertEqual(modifiers.index, 0)
+
+        with self.assertRaises(ValueError):
+            can.broadcastmanager.precompute_messages(msg, 0, increment_counter)
+
     @staticmethod
     def join_threads(threads: List[Thread], timeout: float) -> None:
         stuck_threads: List[Thread] = []
@@ -311,5 +522,53 @@ class SimpleCyclicSendTaskTest(unittest.TestCase, ComparingMessagesTestCase):
             raise RuntimeError(err_message)
 
 
+class PreciseSleeperTest(unittest.TestCase):
+    def test_sleep_until(self):
+        for sleeper in (
+            can.broadcastmanager.PreciseSleeper(),
+            can.broadcastmanager.PreciseSleeper(spin_budget=0),
+            can.broadcastmanager.PreciseSleeper(use_timerfd=True),
+        ):
+            with self.subTest(spin_budget=sleeper.spin_budget):
+                deadline_ns = time.perf_counter_ns() + 2_000_000
+                sleeper.sleep_until(deadline_ns)
+                self.assertGreaterEqual(time.perf_counter_ns(), deadline_ns)
+                # a deadline in the past returns immediately
+                sleeper.sleep_until(deadline_ns)
+                sleeper.close()
+
+    @unittest.skipIf(IS_CI, "fails randomly when run on CI server")
+    def test_precision(self):
+        sleeper = can.broadcastmanager.PreciseSleeper(spin_budget=0.002)
+        start = time.perf_counter()
+        sleeper.sleep(0.005)
+        self.assertAlmostEqual(time.perf_counter() - start, 0.005, delta=0.001)
+
+    def test_spin_is_bounded(self):
+        sleeper = can.broadcastmanager.PreciseSleeper()
+        with patch("can.broadcastmanager.time.sleep") as sleep_mock:
+            start = time.perf_counter()
+            sleeper.sleep(1.0)
+            self.assertLess(time.perf_counter() - start, 0.5)
+        sleep_mock.assert_called_once()
+
+    def test_default_does_not_spin(self):
+        scheduler = can.broadcastmanager.CyclicTaskScheduler()
+        self.assertEqual(scheduler.sleeper.spin_budget, 0)
+        with can.ThreadSafeBus(interface="virtual") as bus:
+            task = can.broadcastmanager.ThreadBasedCyclicSendTask(
+                bus=bus,
+                lock=bus._lock_send_periodic,
+                messages=can.Message(arbitration_id=0x123),
+                period=0.01,
+                autostart=False,
+            )
+            self.assertEqual(task.sleeper.spin_budget, 0)
+
+    def test_invalid_spin_budget(self):
+        with self.assertRaises(ValueError):
+            can.broadcastmanager.PreciseSleeper(spin_budget=-1.0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+
+"""
+This module tests the :mod:`asyncio` API of :class:`can.BusABC`.
+"""
+
+import asyncio
+import unittest
+
+import can
+
+from .notifier_test import _SocketBus
+
+
+class FileDescriptorBusTest(unittest.TestCase):
+    """Buses with a file descriptor are watched by the event loop."""
+
+    def setUp(self):
+        self.bus, self.other = _SocketBus.pair(0)
+
+    def tearDown(self):
+        self.bus.shutdown()
+        self.other.shutdown()
+
+    def test_arecv(self):
+        async def run_it():
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, self.other.send, can.Message(arbitration_id=1))
+            msg = await self.bus.arecv(timeout=1.0)
+            self.assertEqual(msg.arbitration_id, 1)
+            self.assertIsNone(await self.bus.arecv(timeout=0.05))
+
+        asyncio.run(run_it())
+
+    def test_arecv_does_not_block_loop(self):
+        async def run_it():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticker = asyncio.create_task(tick())
+            self.assertIsNone(await self.bus.arecv(timeout=0.2))
+            ticker.cancel()
+            self.assertGreater(ticks, 5)
+
+        asyncio.run(run_it())
+
+    def test_asend_and_aiter(self):
+        async def run_it():
+            for arbitration_id in range(3):
+                await self.other.asend(can.Message(arbitration_id=arbitration_id))
+
+            received = []
+            async for msg in self.bus:
+                received.append(msg.arbitration_id)
+                if len(received) == 3:
+                    break
+            self.assertEqual(received, [0, 1, 2])
+
+        asyncio.run(run_it())
+
+
+class ExecutorBusTest(unittest.TestCase):
+    """Buses without a file descriptor are read in the executor of the loop."""
+
+    def setUp(self):
+        self.bus = can.Bus(interface="virtual", channel="test_bus_asyncio")
+        self.other = can.Bus(interface="virtual", channel="test_bus_asyncio")
+
+    def tearDown(self):
+        self.bus.shutdown()
+        self.other.shutdown()
+
+    def test_arecv(self):
+        async def run_it():
+            await self.other.asend(can.Message(arbitration_id=1))
+            msg = await self.bus.arecv(timeout=1.0)
+            self.assertEqual(msg.arbitration_id, 1)
+            self.assertIsNone(await self.bus.arecv(timeout=0.05))
+
+        asyncio.run(run_it())
+
+    def test_cancelled_arecv_keeps_message(self):
+        async def run_it():
+            task = asyncio.create_task(self.bus.arecv())
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            # the read started by the cancelled call receives this message
+            self.other.send(can.Message(arbitration_id=2))
+            msg = await self.bus.arecv(timeout=1.0)
+            self.assertEqual(msg.arbitration_id, 2)
+
+        asyncio.run(run_it())
+
+    def test_timed_out_read_is_retried(self):
+        async def run_it():
+            self.assertIsNone(await self.bus.arecv(timeout=0.01))
+            # the pending read of the previous call times out early,
+            # this call must keep waiting for the rest of its timeout
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.1, self.other.send, can.Message(arbitration_id=3))
+            msg = await self.bus.arecv(timeout=1.0)
+            self.assertEqual(msg.arbitration_id, 3)
+
+        asyncio.run(run_it())
+
+
+if __name__ == "__main__":
+    unittest.main()
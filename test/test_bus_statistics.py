@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+
+"""
+This module tests the optional traffic statistics of :class:`can.BusABC`.
+"""
+
+import time
+import unittest
+from unittest.mock import patch
+
+import can
+from can.bus_statistics import BusStatistics, Histogram
+
+
+class HistogramTest(unittest.TestCase):
+    def test_buckets(self):
+        histogram = Histogram([1.0, 2.0])
+        for value in (0.5, 1.0, 1.5, 3.0, 4.0):
+            histogram.add(value)
+
+        self.assertEqual(histogram.buckets, [2, 1, 2])
+        self.assertEqual(histogram.count, 5)
+        self.assertEqual(histogram.minimum, 0.5)
+        self.assertEqual(histogram.maximum, 4.0)
+        self.assertAlmostEqual(histogram.mean, 2.0)
+
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["buckets"], [(1.0, 2), (2.0, 1), (float("inf"), 2)])
+
+        histogram.reset()
+        self.assertEqual(histogram.buckets, [0, 0, 0])
+        self.assertIsNone(histogram.mean)
+
+    def test_unsorted_bounds(self):
+        with self.assertRaises(ValueError):
+            Histogram([2.0, 1.0])
+
+
+class BusStatisticsTest(unittest.TestCase):
+    def setUp(self):
+        self.bus = can.Bus(interface="virtual", channel="test_bus_statistics")
+        self.other = can.Bus(interface="virtual", channel="test_bus_statistics")
+
+    def tearDown(self):
+        self.bus.shutdown()
+        self.other.shutdown()
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(self.bus.statistics)
+
+    def test_rx(self):
+        statistics = self.bus.enable_statistics()
+        self.assertIsInstance(statistics, BusStatistics)
+        self.assertIs(self.bus.statistics, statistics)
+
+        self.bus.set_filters([{"can_id": 0x100, "can_mask": 0x7FF, "extended": False}])
+        for arbitration_id in (0x100, 0x200, 0x100):
+            self.other.send(
+                can.Message(
+                    arbitration_id=arbitration_id, is_extended_id=False, data=[1, 2]
+                )
+            )
+
+        self.assertIsNotNone(self.bus.recv(timeout=0.1))
+        self.assertEqual(len(self.bus.recv_batch(timeout=0.1)), 1)
+
+        snapshot = statistics.snapshot()
+        self.assertEqual(snapshot["rx_count"], 2)
+        self.assertEqual(snapshot["rx_bytes"], 4)
+        self.assertEqual(snapshot["rx_filtered"], 1)
+        self.assertEqual(snapshot["rx_latency"]["count"], 2)
+        self.assertGreaterEqual(snapshot["rx_latency"]["min"], 0.0)
+        self.assertEqual(snapshot["tx_count"], 0)
+
+    def test_rx_latency_of_foreign_clock(self):
+        statistics = self.bus.enable_statistics()
+        statistics.on_received(can.Message(timestamp=time.time() + 100), time.time())
+        self.assertEqual(statistics.rx_count, 1)
+        self.assertEqual(statistics.rx_latency.count, 0)
+
+    def test_tx(self):
+        statistics = self.bus.enable_statistics()
+        self.bus.send(can.Message(data=[1, 2, 3]))
+        self.assertEqual(self.bus.send_batch([can.Message(data=[1])] * 4), 4)
+
+        snapshot = statistics.snapshot()
+        self.assertEqual(snapshot["tx_count"], 5)
+        self.assertEqual(snapshot["tx_bytes"], 7)
+        self.assertEqual(snapshot["tx_errors"], 0)
+        self.assertEqual(snapshot["send_duration"]["count"], 2)
+        self.assertEqual(len(self.other.recv_batch(timeout=0.1)), 5)
+
+    def test_tx_error(self):
+        statistics = self.bus.enable_statistics()
+        with patch.object(
+            self.bus, "_check_if_open", side_effect=can.CanOperationError("failed")
+        ):
+            with self.assertRaises(can.CanOperationError):
+                self.bus.send(can.Message())
+            self.assertEqual(statistics.tx_errors, 1)
+            with self.assertRaises(can.CanOperationError):
+                self.bus.send_batch([can.Message()] * 2)
+            self.assertEqual(statistics.tx_errors, 3)
+        self.assertEqual(statistics.tx_count, 0)
+
+    def test_partial_batch(self):
+        with can.Bus(
+            interface="virtual", channel="test_bus_statistics", rx_queue_size=2
+        ):
+            statistics = self.bus.enable_statistics()
+            self.assertEqual(self.bus.send_batch([can.Message()] * 5, timeout=0.01), 2)
+        self.assertEqual(statistics.tx_count, 2)
+        self.assertEqual(statistics.tx_errors, 3)
+
+    def test_overridden_send(self):
+        class CountingBus(type(self.bus)):
+            def send(self, msg, timeout=None):
+                super().send(msg, timeout)
+
+        bus = CountingBus(channel="test_bus_statistics")
+        try:
+            statistics = bus.enable_statistics()
+            bus.send(can.Message())
+            # the call is only counted once
+            self.assertEqual(statistics.tx_count, 1)
+        finally:
+            bus.shutdown()
+
+    def test_disable(self):
+        self.bus.enable_statistics()
+        self.bus.disable_statistics()
+        self.assertIsNone(self.bus.statistics)
+
+        # still works without statistics
+        self.bus.send(can.Message())
+        self.assertIsNotNone(self.other.recv(timeout=0.1))
+
+    def test_reset(self):
+        statistics = self.bus.enable_statistics()
+        self.bus.send(can.Message())
+        statistics.reset()
+        self.assertEqual(statistics.tx_count, 0)
+        self.assertEqual(statistics.send_duration.count, 0)
+
+    def test_thread_safe_bus(self):
+        bus = can.ThreadSafeBus(interface="virtual", channel="test_bus_statistics")
+        try:
+            statistics = bus.enable_statistics()
+            bus.send(can.Message())
+            self.assertEqual(statistics.tx_count, 1)
+            self.assertIsNotNone(self.bus.recv(timeout=0.1))
+        finally:
+            bus.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
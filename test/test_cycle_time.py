@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+"""
+This module tests :class:`can.CycleTimeMonitor`.
+"""
+
+import statistics
+import time
+import unittest
+from unittest.mock import patch
+
+import can
+
+
+def _message(arbitration_id, timestamp):
+    return can.Message(
+        arbitration_id=arbitration_id, timestamp=timestamp, is_extended_id=False
+    )
+
+
+class CycleTimeMonitorTest(unittest.TestCase):
+    def test_statistics(self):
+        timestamps = [0.0, 0.010, 0.021, 0.030, 0.041, 0.050, 0.070]
+        intervals = [b - a for a, b in zip(timestamps, timestamps[1:])]
+
+        monitor = can.CycleTimeMonitor()
+        monitor.on_messages_received([_message(0x10, t) for t in timestamps])
+        cycle_time = monitor.get(0x10, is_extended_id=False)
+
+        self.assertEqual(cycle_time.msg_count, 7)
+        self.assertAlmostEqual(cycle_time.mean, statistics.mean(intervals))
+        self.assertAlmostEqual(cycle_time.jitter, statistics.stdev(intervals))
+        self.assertAlmostEqual(cycle_time.minimum, min(intervals))
+        self.assertAlmostEqual(cycle_time.maximum, 0.020)
+        self.assertEqual(cycle_time.histogram.count, 6)
+
+        snapshot = monitor.snapshot()
+        self.assertEqual(list(snapshot), [(None, 0x10, False)])
+        self.assertEqual(snapshot[(None, 0x10, False)]["msg_count"], 7)
+
+    def test_first_message(self):
+        monitor = can.CycleTimeMonitor()
+        monitor(_message(0x10, 1.0))
+        snapshot = monitor.snapshot()[(None, 0x10, False)]
+        self.assertIsNone(snapshot["mean"])
+        self.assertIsNone(snapshot["jitter"])
+        self.assertIsNone(snapshot["max"])
+
+    def test_timeout(self):
+        timeouts = []
+        monitor = can.CycleTimeMonitor(
+            on_timeout=lambda key, stats: timeouts.append(key), min_intervals=3
+        )
+        with patch("can.cycle_time.time", return_value=100.0):
+            monitor.on_messages_received([_message(0x10, t * 0.1) for t in range(4)])
+            monitor(_message(0x20, 0.0))
+
+        # within three periods
+        self.assertEqual(monitor.check_timeouts(100.25), [])
+        # the ID without a learned period never times out
+        self.assertEqual(monitor.check_timeouts(100.35), [(None, 0x10, False)])
+        # reported only once
+        self.assertEqual(monitor.check_timeouts(101.0), [])
+        self.assertEqual(timeouts, [(None, 0x10, False)])
+        self.assertTrue(monitor.get(0x10, is_extended_id=False).timed_out)
+
+        # the ID recovers with the next message
+        with patch("can.cycle_time.time", return_value=101.0):
+            monitor(_message(0x10, 1.0))
+        cycle_time = monitor.get(0x10, is_extended_id=False)
+        self.assertFalse(cycle_time.timed_out)
+        self.assertEqual(cycle_time.timeouts, 1)
+        self.assertAlmostEqual(cycle_time.maximum, 0.7)
+
+    def test_check_interval(self):
+        timeouts = []
+        monitor = can.CycleTimeMonitor(
+            on_timeout=lambda key, stats: timeouts.append(key),
+            min_intervals=2,
+            check_interval=0.01,
+        )
+        try:
+            start = time.time()
+            monitor.on_messages_received(
+                [_message(0x10, start + t * 0.01) for t in range(4)]
+            )
+            for _ in range(100):
+                if timeouts:
+                    break
+                time.sleep(0.01)
+        finally:
+            monitor.stop()
+        self.assertEqual(timeouts, [(None, 0x10, False)])
+
+    def test_notifier(self):
+        with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+            monitor = can.CycleTimeMonitor()
+            with can.Notifier(bus, [monitor], 0.1):
+                for _ in range(3):
+                    bus.send(can.Message(arbitration_id=0x10))
+                    time.sleep(0.01)
+                time.sleep(0.1)
+            self.assertEqual(monitor.get(0x10, channel="test").msg_count, 3)
+            self.assertGreater(monitor.get(0x10, channel="test").mean, 0.005)
+
+    def test_reset(self):
+        monitor = can.CycleTimeMonitor()
+        monitor(_message(0x10, 0.0))
+        monitor.reset()
+        self.assertEqual(monitor.snapshot(), {})
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            can.CycleTimeMonitor(timeout_factor=1.0)
+        with self.assertRaises(ValueError):
+            can.CycleTimeMonitor(min_intervals=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+"""
+This module tests that importing :mod:`can` stays cheap, i.e. that the
+file formats, the notifier and their dependencies are only loaded on demand.
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+import can
+
+from .config import IS_PYPY
+
+# generous upper bound for "import can" in a fresh interpreter, in seconds
+IMPORT_TIME_BUDGET = 0.5
+
+# modules which must not be loaded by "import can" alone
+LAZY_MODULES = (
+    "can.io",
+    "can.io.mf4",
+    "can.listener",
+    "can.modifiers",
+    "can.notifier",
+    "can.thread_safe_bus",
+    "asammdf",
+    "numpy",
+    "sqlite3",
+    "wrapt",
+)
+
+
+def _run(code: str):
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], encoding="utf-8", stderr=subprocess.STDOUT
+    )
+    return json.loads(output)
+
+
+class ImportTest(unittest.TestCase):
+    def test_import_is_lazy(self):
+        loaded = _run(
+            "import json, sys, can\n"
+            f"print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"
+        )
+        self.assertEqual(loaded, [])
+
+    def test_bus_does_not_load_io(self):
+        loaded = _run(
+            "import json, sys, can\n"
+            "with can.Bus(interface='virtual', channel='test_import'):\n"
+            "    pass\n"
+            f"print(json.dumps([m for m in {LAZY_MODULES!r} if m in sys.modules]))"
+        )
+        self.assertEqual(loaded, [])
+
+    @unittest.skipIf(IS_PYPY, "import time is not representative on PyPy")
+    def test_import_time_budget(self):
+        # take the best of a few runs to reduce the noise of a busy machine
+        durations = [
+            _run(
+                "import json, time\n"
+                "start = time.perf_counter()\n"
+                "import can\n"
+                "print(json.dumps(time.perf_counter() - start))"
+            )
+            for _ in range(3)
+        ]
+        self.assertLess(min(durations), IMPORT_TIME_BUDGET)
+
+    def test_lazy_attributes(self):
+        for name in can.__all__:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(can, name))
+        for name in can.io.__all__:
+            with self.subTest(name=name):
+                self.assertIsNotNone(getattr(can.io, name))
+
+        self.assertIs(can.Notifier, can.notifier.Notifier)
+        self.assertIs(can.BLFReader, can.io.blf.BLFReader)
+        self.assertIsInstance(can.__version__, str)
+        self.assertIn("ThreadSafeBus", dir(can))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            _ = can.does_not_exist
+        with self.assertRaises(AttributeError):
+            _ = can.io.does_not_exist
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,7 +6,7 @@ This module tests :meth:`can.interface.virtual`.
 
 import unittest
 
-from can import Bus, Message
+from can import Bus, BusABC, CanOperationError, Message
 
 EXAMPLE_MSG1 = Message(timestamp=1639739471.5565314, arbitration_id=0x481, data=b"\x01")
 
@@ -34,6 +34,45 @@ class TestMessageFiltering(unittest.TestCase):
         assert r.arbitration_id == EXAMPLE_MSG1.arbitration_id
         assert r.data == EXAMPLE_MSG1.data
 
+    def test_recv_batch_max_count(self):
+        for i in range(10):
+            self.node1.send(Message(arbitration_id=i))
+        batch = self.node2.recv_batch(max_count=4, timeout=0.1)
+        assert [msg.arbitration_id for msg in batch] == [0, 1, 2, 3]
+        batch = self.node2.recv_batch(max_count=10, timeout=0.1)
+        assert [msg.arbitration_id for msg in batch] == [4, 5, 6, 7, 8, 9]
+
+    def test_recv_batch_filtered(self):
+        self.node2.set_filters([{"can_id": 0x1, "can_mask": 0x1}])
+        for i in range(10):
+            self.node1.send(Message(arbitration_id=i))
+        batch = self.node2.recv_batch(max_count=10, timeout=0.1)
+        assert [msg.arbitration_id for msg in batch] == [1, 3, 5, 7, 9]
+
+    def test_recv_batch_default_implementation(self):
+        for i in range(3):
+            self.node1.send(Message(arbitration_id=i))
+        msgs, already_filtered = BusABC._recv_batch_internal(self.node2, 2, 0.1)
+        assert already_filtered
+        assert [msg.arbitration_id for msg in msgs] == [0, 1]
+        msgs, _ = BusABC._recv_batch_internal(self.node2, 2, 0.1)
+        assert [msg.arbitration_id for msg in msgs] == [2]
+
+    def test_send_batch_bounded_queue(self):
+        with Bus("test", interface="virtual", rx_queue_size=2) as bounded:
+            msgs = [Message(arbitration_id=i) for i in range(4)]
+            assert self.node1.send_batch(msgs, timeout=0.01) == 2
+            # the returned prefix reached every receiver, the failed message
+            # only the unbounded one
+            received = self.node2.recv_batch(max_count=10, timeout=0.1)
+            assert [msg.arbitration_id for msg in received] == [0, 1, 2]
+            received = bounded.recv_batch(max_count=10, timeout=0.1)
+            assert [msg.arbitration_id for msg in received] == [0, 1]
+
+            self.node1.send_batch(msgs[:2])
+            with self.assertRaises(CanOperationError):
+                self.node1.send_batch(msgs[2:], timeout=0.01)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+
+"""
+This module tests :mod:`can.io.arrays`.
+"""
+
+import os
+import tempfile
+import unittest
+
+import can
+from can.io import arrays
+
+from .data.example_data import (
+    TEST_ALL_MESSAGES,
+    TEST_MESSAGES_CAN_FD,
+    sort_messages,
+)
+from .message_helper import ComparingMessagesTestCase
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import asammdf
+except ImportError:
+    asammdf = None
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+
+MESSAGES = sort_messages(TEST_ALL_MESSAGES + TEST_MESSAGES_CAN_FD)
+
+
+@unittest.skipIf(np is None, "numpy is unavailable")
+class TestArrays(unittest.TestCase, ComparingMessagesTestCase):
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        ComparingMessagesTestCase.__init__(
+            self, allowed_timestamp_delta=1e-6, preserves_channel=False
+        )
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.tmp_dir.name, name)
+
+    def assertColumnsEqual(self, actual, expected):
+        self.assertEqual(set(actual), set(expected))
+        for name, column in expected.items():
+            self.assertEqual(actual[name].dtype, arrays.MESSAGE_DTYPE[name].base)
+            if name == "timestamp":
+                np.testing.assert_allclose(actual[name], column, rtol=0, atol=1e-6)
+            else:
+                np.testing.assert_array_equal(actual[name], column, err_msg=name)
+
+    def test_round_trip(self):
+        columns = arrays.messages_to_columns(MESSAGES)
+        self.assertEqual(len(columns["timestamp"]), len(MESSAGES))
+        self.assertEqual(columns["data"].shape, (len(MESSAGES), 64))
+        self.assertMessagesEqual(MESSAGES, list(arrays.columns_to_messages(columns)))
+
+        array = arrays.columns_to_array(columns)
+        self.assertEqual(array.dtype, arrays.MESSAGE_DTYPE)
+        self.assertMessagesEqual(MESSAGES, list(arrays.columns_to_messages(array)))
+
+    def test_channel(self):
+        messages = [
+            can.Message(channel="can1"),
+            can.Message(channel=2),
+            can.Message(channel=None),
+            can.Message(channel="vcan"),
+        ]
+        columns = arrays.messages_to_columns(messages)
+        np.testing.assert_array_equal(columns["channel"], [1, 2, -1, -1])
+
+    def test_empty(self):
+        columns = arrays.messages_to_columns([])
+        self.assertEqual(len(columns["timestamp"]), 0)
+        self.assertEqual(list(arrays.columns_to_messages(columns)), [])
+
+    def test_generic_format(self):
+        path = self._path("test.asc")
+        arrays.write_array(path, arrays.messages_to_columns(TEST_ALL_MESSAGES))
+        with can.LogReader(path) as reader:
+            expected = arrays.messages_to_columns(reader)
+        self.assertColumnsEqual(arrays.read_columns(path), expected)
+        self.assertEqual(len(arrays.read_array(path)), len(TEST_ALL_MESSAGES))
+
+    def test_blf_files(self):
+        for filename in (
+            "test_CanMessage.blf",
+            "test_CanMessage2.blf",
+            "test_CanFdMessage.blf",
+            "test_CanFdMessage64.blf",
+            "test_CanErrorFrameExt.blf",
+            "issue_1905.blf",
+        ):
+            path = os.path.join(DATA_DIR, filename)
+            with can.BLFReader(path) as reader:
+                expected = arrays.messages_to_columns(reader)
+            self.assertColumnsEqual(arrays.read_columns(path), expected)
+
+    def test_blf_bulk(self):
+        # enough messages to span multiple log containers
+        messages = [
+            can.Message(
+                timestamp=1700000000.0 + index * 0.001,
+                arbitration_id=index & 0x7FF,
+                is_extended_id=index % 3 == 0,
+                is_remote_frame=index % 7 == 0,
+                is_rx=index % 5 != 0,
+                is_fd=index % 4 == 0 and index % 7 != 0,
+                bitrate_switch=index % 8 == 0 and index % 7 != 0,
+                dlc=index % 9 if index % 7 == 0 else None,
+                data=[] if index % 7 == 0 else bytes(range(index % 9)),
+                channel=index % 3,
+            )
+            for index in range(5000)
+        ]
+        messages.insert(100, can.Message(is_error_frame=True, channel=1))
+        path = self._path("test.blf")
+        arrays.write_array(path, arrays.messages_to_columns(messages))
+
+        with can.BLFReader(path) as reader:
+            expected = arrays.messages_to_columns(reader)
+        columns = arrays.read_columns(path)
+        self.assertEqual(len(columns["timestamp"]), len(messages))
+        self.assertColumnsEqual(columns, expected)
+
+    @unittest.skipIf(asammdf is None, "MF4 is unavailable")
+    def test_mf4(self):
+        path = self._path("test.mf4")
+        with can.MF4Writer(path) as writer:
+            for msg in MESSAGES:
+                writer.on_message_received(msg)
+
+        with can.MF4Reader(path) as reader:
+            expected = arrays.messages_to_columns(reader)
+        self.assertColumnsEqual(arrays.read_columns(path), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+
+"""
+This module tests :class:`can.LastValueCache`.
+"""
+
+import unittest
+from unittest.mock import patch
+
+import can
+
+
+def _message(arbitration_id, timestamp, channel=None, data=b""):
+    return can.Message(
+        arbitration_id=arbitration_id,
+        timestamp=timestamp,
+        channel=channel,
+        is_extended_id=False,
+        data=data,
+    )
+
+
+class LastValueCacheTest(unittest.TestCase):
+    def test_latest_value(self):
+        cache = can.LastValueCache()
+        cache(_message(0x100, 1.0, data=b"\x01"))
+        cache(_message(0x100, 1.1, data=b"\x02"))
+        cache(_message(0x200, 1.2))
+
+        entry = cache.get(0x100, is_extended_id=False)
+        self.assertEqual(entry.msg.data, b"\x02")
+        self.assertEqual(entry.msg_count, 2)
+        self.assertAlmostEqual(entry.period, 0.1)
+        self.assertAlmostEqual(entry.rate, 10.0)
+        self.assertLessEqual(entry.first_seen, entry.last_seen)
+
+        self.assertEqual(cache.get(0x200, is_extended_id=False).msg_count, 1)
+        self.assertIsNone(cache.get(0x200, is_extended_id=False).rate)
+        self.assertIsNone(cache.get(0x100, is_extended_id=True))
+        self.assertEqual(len(cache), 2)
+
+    def test_moving_average(self):
+        cache = can.LastValueCache(smoothing=0.5)
+        cache.on_messages_received(
+            [_message(0x1, timestamp) for timestamp in (0.0, 1.0, 3.0)]
+        )
+        # 1.0 + 0.5 * (2.0 - 1.0)
+        self.assertAlmostEqual(cache.get(0x1, is_extended_id=False).period, 1.5)
+
+    def test_channels(self):
+        cache = can.LastValueCache()
+        cache(_message(0x1, 0.0, channel="can0"))
+        cache(_message(0x1, 0.0, channel="can1"))
+        self.assertEqual(
+            sorted(cache.snapshot()), [("can0", 0x1, False), ("can1", 0x1, False)]
+        )
+        self.assertIsNotNone(cache.get(0x1, is_extended_id=False, channel="can1"))
+
+    def test_snapshot_is_a_copy(self):
+        cache = can.LastValueCache()
+        cache(_message(0x1, 0.0))
+        snapshot = cache.snapshot()
+        cache(_message(0x1, 1.0))
+        cache(_message(0x2, 1.0))
+        self.assertEqual(len(snapshot), 1)
+        self.assertEqual(snapshot[(None, 0x1, False)].msg_count, 1)
+
+    def test_ttl(self):
+        cache = can.LastValueCache(ttl=10.0)
+        with patch("can.last_value_cache.time", return_value=100.0):
+            cache(_message(0x1, 0.0))
+        with patch("can.last_value_cache.time", return_value=105.0):
+            cache(_message(0x2, 5.0))
+        with patch("can.last_value_cache.time", return_value=112.0):
+            self.assertEqual(list(cache.snapshot()), [(None, 0x2, False)])
+            # expired entries are kept until they are evicted
+            self.assertEqual(len(cache), 2)
+            self.assertEqual(cache.evict(), 1)
+        self.assertIsNone(cache.get(0x1, is_extended_id=False))
+
+        # eviction also happens while receiving
+        with patch("can.last_value_cache.time", return_value=130.0):
+            cache(_message(0x3, 30.0))
+        self.assertEqual(len(cache), 1)
+
+    def test_clear(self):
+        cache = can.LastValueCache()
+        cache(_message(0x1, 0.0))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            can.LastValueCache(ttl=0)
+        with self.assertRaises(ValueError):
+            can.LastValueCache(smoothing=0)
+        with self.assertRaises(ValueError):
+            can.LastValueCache(smoothing=1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+
+"""
+This module tests :class:`can.MessageBatch`.
+"""
+
+import unittest
+
+from can import Message, MessageBatch
+
+from .message_helper import ComparingMessagesTestCase
+
+EXAMPLE_MESSAGES = [
+    Message(timestamp=1.5, arbitration_id=0x123, is_extended_id=False, data=b"\x01"),
+    Message(
+        timestamp=2.0,
+        arbitration_id=0x1ABCDEF0,
+        data=range(64),
+        is_fd=True,
+        bitrate_switch=True,
+        error_state_indicator=True,
+        channel="vcan0",
+    ),
+    Message(timestamp=2.5, arbitration_id=0x7FF, is_remote_frame=True, dlc=8),
+    Message(timestamp=3.0, is_error_frame=True, is_rx=False, channel=[1, 2]),
+    Message(timestamp=3.5, arbitration_id=0x42, data=b"", channel="vcan0"),
+]
+
+
+class TestMessageBatch(unittest.TestCase, ComparingMessagesTestCase):
+    def __init__(self, *args, **kwargs):
+        unittest.TestCase.__init__(self, *args, **kwargs)
+        ComparingMessagesTestCase.__init__(self)
+
+    def test_round_trip(self):
+        batch = MessageBatch(EXAMPLE_MESSAGES)
+        self.assertEqual(len(batch), len(EXAMPLE_MESSAGES))
+        self.assertMessagesEqual(EXAMPLE_MESSAGES, list(batch))
+
+    def test_indexing(self):
+        batch = MessageBatch.from_messages(EXAMPLE_MESSAGES)
+        self.assertMessageEqual(EXAMPLE_MESSAGES[1], batch[1])
+        self.assertMessageEqual(EXAMPLE_MESSAGES[-1], batch[-1])
+        self.assertMessagesEqual(EXAMPLE_MESSAGES[1:4], list(batch[1:4]))
+        self.assertIsInstance(batch[1:4], MessageBatch)
+        with self.assertRaises(IndexError):
+            batch[len(EXAMPLE_MESSAGES)]
+
+    def test_columns(self):
+        batch = MessageBatch(EXAMPLE_MESSAGES)
+        self.assertEqual(list(batch.timestamps), [1.5, 2.0, 2.5, 3.0, 3.5])
+        self.assertEqual(batch.arbitration_ids[1], 0x1ABCDEF0)
+        self.assertEqual(list(batch.dlcs), [1, 64, 8, 0, 0])
+        self.assertEqual(list(batch.data_lengths), [1, 64, 0, 0, 0])
+        self.assertEqual(batch.channels, [None, "vcan0", [1, 2]])
+        self.assertEqual(list(batch.channel_indices), [0, 1, 0, 2, 1])
+        self.assertEqual(bytes(batch.get_data(1)), bytes(range(64)))
+        self.assertEqual(len(batch.data), 64 * len(EXAMPLE_MESSAGES))
+        self.assertLess(batch.nbytes, 100 * len(EXAMPLE_MESSAGES))
+
+    def test_messages_are_independent(self):
+        batch = MessageBatch(EXAMPLE_MESSAGES[:1])
+        msg = batch[0]
+        msg.data[0] = 0xFF
+        self.assertEqual(batch[0].data, bytearray(b"\x01"))
+
+    def test_clear(self):
+        batch = MessageBatch(EXAMPLE_MESSAGES)
+        batch.clear()
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.channels, [])
+        self.assertEqual(batch.nbytes, 0)
+
+    def test_data_too_long(self):
+        with self.assertRaises(ValueError):
+            MessageBatch([Message(data=bytes(65))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,7 +12,7 @@ import hypothesis.strategies as st
 import pytest
 from hypothesis import HealthCheck, given, settings
 
-from can import Message
+from can import Message, MessagePool
 
 from .config import IS_GITHUB_ACTIONS, IS_PYPY, IS_WINDOWS
 from .message_helper import ComparingMessagesTestCase
@@ -106,6 +106,172 @@ class TestMessageClass(unittest.TestCase):
                 self.assertTrue(message.equals(other, timestamp_delta=0))
 
 
+class TestMessageFromBuffer(unittest.TestCase):
+    def test_references_buffer(self):
+        buffer = bytearray(range(16))
+        message = Message.from_buffer(buffer, 4, 3, arbitration_id=0x123)
+        self.assertEqual(message.arbitration_id, 0x123)
+        self.assertEqual(message.dlc, 3)
+        self.assertEqual(message.data, bytearray([4, 5, 6]))
+        self.assertEqual(bytes(message), b"\x04\x05\x06")
+
+        buffer[4] = 0xFF
+        self.assertEqual(message.data[0], 0xFF)
+        with self.assertRaises(TypeError):
+            message.data[0] = 0
+
+    def test_rest_of_buffer(self):
+        message = Message.from_buffer(b"\x00\x01\x02", 1, dlc=8)
+        self.assertEqual(message.data, b"\x01\x02")
+        self.assertEqual(message.dlc, 8)
+
+    def test_remote_frame(self):
+        message = Message.from_buffer(b"\x00\x01", is_remote_frame=True, dlc=2)
+        self.assertEqual(len(message.data), 0)
+        self.assertEqual(message.dlc, 2)
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            Message.from_buffer(b"\x00\x01", 1, 2)
+
+    def test_check(self):
+        with self.assertRaises(ValueError):
+            Message.from_buffer(bytes(9), is_extended_id=False, check=True)
+        Message.from_buffer(bytes(8), is_extended_id=False, check=True)
+
+    def test_copies_own_data(self):
+        message = Message.from_buffer(b"\x01\x02\x03", channel="vcan0")
+        str(message)
+        for other in (
+            copy(message),
+            deepcopy(message),
+            pickle.loads(pickle.dumps(message)),
+        ):
+            self.assertIsInstance(other.data, bytearray)
+            self.assertTrue(message.equals(other))
+
+
+class TestMessageCopy(unittest.TestCase):
+    def test_copy_shares_data(self):
+        message = Message(arbitration_id=0x123, data=[1, 2], channel=["a"])
+        other = copy(message)
+        self.assertIs(other.data, message.data)
+        self.assertIs(other.channel, message.channel)
+        self.assertTrue(message.equals(other))
+
+    def test_deepcopy(self):
+        message = Message(
+            arbitration_id=0x123, data=[1, 2], channel=["a"], is_fd=True, dlc=2
+        )
+        other = deepcopy(message)
+        self.assertIsNot(other.data, message.data)
+        self.assertIsNot(other.channel, message.channel)
+        self.assertIsInstance(other, Message)
+        self.assertTrue(message.equals(other))
+
+
+class TestMessagePool(unittest.TestCase):
+    def test_recycle(self):
+        pool = MessagePool(max_size=1)
+        first = pool.acquire(arbitration_id=0x123, data=b"\x01\x02", channel=0)
+        self.assertEqual(pool.stats, {"hits": 0, "misses": 1, "size": 0})
+        buffer = first.data
+        pool.release(first)
+        pool.release(Message())  # exceeds max_size
+        self.assertEqual(len(pool), 1)
+
+        second = pool.acquire(arbitration_id=0x1, is_extended_id=False, data=[3])
+        self.assertIs(second, first)
+        self.assertIs(second.data, buffer)
+        self.assertTrue(
+            second.equals(Message(arbitration_id=0x1, is_extended_id=False, data=[3]))
+        )
+        self.assertEqual(pool.stats, {"hits": 1, "misses": 1, "size": 0})
+
+    def test_acquire_like_constructor(self):
+        pool = MessagePool()
+        pool.release(Message(data=[1, 2, 3], is_fd=True, channel="x"))
+        for kwargs in (
+            {"is_remote_frame": True, "dlc": 4, "data": [1]},
+            {"data": 3},
+            {},
+        ):
+            expected = Message(**kwargs)
+            msg = pool.acquire(**kwargs)
+            self.assertTrue(msg.equals(expected), kwargs)
+            pool.release(msg)
+
+    def test_does_not_reuse_callers_buffer(self):
+        pool = MessagePool()
+        buffer = bytearray(b"\x01\x02\x03")
+        msg = pool.acquire(data=buffer)
+        self.assertIsNot(msg.data, buffer)
+        pool.release(msg)
+        pool.acquire(data=b"\xff")
+        self.assertEqual(buffer, bytearray(b"\x01\x02\x03"))
+
+    def test_release_view(self):
+        pool = MessagePool()
+        pool.release(Message.from_buffer(b"\x01\x02"))
+        self.assertEqual(pool.acquire(data=[5]).data, bytearray([5]))
+
+
+class TestMessageRecords(unittest.TestCase):
+    MESSAGES = [
+        Message(
+            timestamp=1.5,
+            arbitration_id=0x123,
+            is_extended_id=False,
+            data=[1, 2, 3],
+            is_rx=False,
+        ),
+        Message(
+            arbitration_id=0x1FFFFFFF,
+            data=range(48),
+            is_fd=True,
+            bitrate_switch=True,
+            error_state_indicator=True,
+        ),
+        Message(arbitration_id=0x7FF, is_remote_frame=True, dlc=5),
+        Message(is_error_frame=True, data=bytes(8)),
+        Message(data=bytes(8), dlc=15),
+    ]
+
+    def test_round_trip(self):
+        for message in self.MESSAGES:
+            record = message.to_bytes()
+            self.assertEqual(len(record), 24 if len(message.data) <= 8 else 80)
+            self.assertTrue(Message.from_bytes(record).equals(message), message)
+
+    def test_many(self):
+        packed = Message.pack_many(self.MESSAGES)
+        unpacked = Message.unpack_many(packed)
+        self.assertEqual(len(unpacked), len(self.MESSAGES))
+        for expected, actual in zip(self.MESSAGES, unpacked):
+            self.assertTrue(actual.equals(expected))
+            self.assertIsNone(actual.channel)
+        self.assertEqual(Message.unpack_many(b""), [])
+
+        with self.assertRaises(ValueError):
+            Message.unpack_many(packed[:-1])
+        # shorter than the header of a record
+        with self.assertRaises(ValueError):
+            Message.unpack_many(packed + packed[:5])
+        with self.assertRaises(ValueError):
+            Message.from_bytes(packed[:5])
+
+    def test_from_buffer(self):
+        message = Message.from_buffer(b"\x01\x02\x03", arbitration_id=0x123)
+        self.assertIsInstance(message.data, memoryview)
+        self.assertTrue(Message.from_bytes(message.to_bytes()).equals(message))
+        fd_message = Message.from_buffer(bytes(range(12)), is_fd=True)
+        self.assertTrue(Message.from_bytes(fd_message.to_bytes()).equals(fd_message))
+
+    def test_too_long(self):
+        with self.assertRaises(ValueError):
+            Message(data=bytes(65)).to_bytes()
+
+
 class MessageSerialization(unittest.TestCase, ComparingMessagesTestCase):
     def __init__(self, *args, **kwargs):
         unittest.TestCase.__init__(self, *args, **kwargs)
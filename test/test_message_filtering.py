@@ -4,9 +4,11 @@
 This module tests :meth:`can.BusABC._matches_filters`.
 """
 
+import random
 import unittest
 
 from can import Bus, Message
+from can.filters import CompiledFilters
 
 from .data.example_data import TEST_ALL_MESSAGES
 
@@ -46,6 +48,99 @@ class TestMessageFiltering(unittest.TestCase):
         self.assertFalse(self.bus._matches_filters(EXAMPLE_MSG))
         self.assertTrue(self.bus._matches_filters(HIGHEST_MSG))
 
+    def test_compiled_filters(self):
+        self.bus.set_filters(MATCH_EXAMPLE)
+        self.assertIsInstance(self.bus.compiled_filters, CompiledFilters)
+        self.assertEqual(self.bus.compiled_filters.filters, MATCH_EXAMPLE)
+        self.bus.set_filters()
+        self.assertTrue(self.bus.compiled_filters.match_all)
+
+
+def _matches_reference(filters, msg):
+    """The straightforward implementation the compiled filters must agree with."""
+    if not filters:
+        return True
+    for _filter in filters:
+        if "extended" in _filter and _filter["extended"] != msg.is_extended_id:
+            continue
+        if (_filter["can_id"] ^ msg.arbitration_id) & _filter["can_mask"] == 0:
+            return True
+    return False
+
+
+class TestCompiledFilters(unittest.TestCase):
+    def test_extended_key(self):
+        compiled = CompiledFilters(
+            [{"can_id": 0x123, "can_mask": 0x7FF, "extended": False}]
+        )
+        self.assertTrue(compiled.matches_id(0x123, False))
+        self.assertFalse(compiled.matches_id(0x123, True))
+
+        compiled = CompiledFilters([{"can_id": 0x123, "can_mask": 0x7FF}])
+        self.assertTrue(compiled.matches_id(0x123, False))
+        self.assertTrue(compiled.matches_id(0x123, True))
+
+    def test_zero_mask(self):
+        compiled = CompiledFilters(
+            [
+                {"can_id": 0x100, "can_mask": 0x7FF, "extended": False},
+                {"can_id": 0x0, "can_mask": 0x0, "extended": True},
+            ]
+        )
+        self.assertFalse(compiled.match_all)
+        self.assertTrue(compiled.matches_id(0x1ABCDEF, True))
+        self.assertTrue(compiled.matches_id(0x100, False))
+        self.assertFalse(compiled.matches_id(0x101, False))
+
+    def test_filter(self):
+        compiled = CompiledFilters(MATCH_EXAMPLE)
+        self.assertEqual(
+            compiled.filter([HIGHEST_MSG, EXAMPLE_MSG, HIGHEST_MSG]), [EXAMPLE_MSG]
+        )
+        self.assertEqual(CompiledFilters().filter(TEST_ALL_MESSAGES), TEST_ALL_MESSAGES)
+
+    def test_equivalent_to_reference(self):
+        rng = random.Random(0)
+        masks = [0x7FF, 0x700, 0x1FFFFFFF, 0x1FFFFF00, 0x0F0, 0]
+        for _ in range(50):
+            filters = []
+            for _ in range(rng.randint(1, 20)):
+                can_filter = {
+                    "can_id": rng.getrandbits(32),
+                    "can_mask": rng.choice(masks[:-1] if rng.random() < 0.9 else masks),
+                }
+                if rng.random() < 0.5:
+                    can_filter["extended"] = rng.random() < 0.5
+                filters.append(can_filter)
+            compiled = CompiledFilters(filters)
+
+            messages = [
+                Message(
+                    arbitration_id=rng.getrandbits(29 if extended else 11),
+                    is_extended_id=extended,
+                )
+                for extended in (rng.random() < 0.5 for _ in range(50))
+            ]
+            # also try the identifiers the filters are looking for
+            messages += [
+                Message(
+                    arbitration_id=f["can_id"] & f["can_mask"] & 0x7FF,
+                    is_extended_id=False,
+                )
+                for f in filters
+            ]
+            messages += [
+                Message(
+                    arbitration_id=f["can_id"] & f["can_mask"] & 0x1FFFFFFF,
+                    is_extended_id=True,
+                )
+                for f in filters
+            ]
+            for msg in messages:
+                self.assertEqual(
+                    compiled.matches(msg), _matches_reference(filters, msg), msg
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+
+"""
+This module tests :class:`can.MessageRouter`.
+"""
+
+import asyncio
+import unittest
+
+import can
+
+
+class MessageRouterTest(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+    def handler(self, name):
+        def handle(msg):
+            self.calls.append((name, msg.arbitration_id))
+
+        return handle
+
+    def test_exact_and_mask_routes(self):
+        router = can.MessageRouter(default=self.handler("default"))
+        router.add_route(0x123, self.handler("exact"))
+        router.add_route(0x400, self.handler("range"), can_mask=0x700)
+        router.add_route(0x123, self.handler("second"))
+
+        for arbitration_id in (0x123, 0x456, 0x7FF):
+            router(can.Message(arbitration_id=arbitration_id, is_extended_id=False))
+
+        self.assertEqual(
+            self.calls,
+            [
+                ("exact", 0x123),
+                ("second", 0x123),
+                ("range", 0x456),
+                ("default", 0x7FF),
+            ],
+        )
+
+    def test_handlers_keep_registration_order(self):
+        exact, masked = self.handler("exact"), self.handler("masked")
+        router = can.MessageRouter()
+        router.add_route(0x100, masked, can_mask=0x700)
+        router.add_route(0x123, exact)
+        self.assertEqual(router.handlers(0x123, False), (masked, exact))
+        self.assertEqual(router.handlers(0x200, False), ())
+
+    def test_extended(self):
+        router = can.MessageRouter()
+        router.add_route(0x123, self.handler("standard"), extended=False)
+        router.add_route(0x123, self.handler("extended"), extended=True)
+        router.add_route(0x123, self.handler("both"))
+
+        router(can.Message(arbitration_id=0x123, is_extended_id=False))
+        router(can.Message(arbitration_id=0x123, is_extended_id=True))
+        self.assertEqual(
+            [name for name, _ in self.calls],
+            ["standard", "both", "extended", "both"],
+        )
+
+    def test_remove_route(self):
+        handler = self.handler("exact")
+        router = can.MessageRouter(default=self.handler("default"))
+        router.add_route(0x123, handler)
+        router(can.Message(arbitration_id=0x123))
+        router.remove_route(0x123, handler)
+        router(can.Message(arbitration_id=0x123))
+        self.assertEqual(self.calls, [("exact", 0x123), ("default", 0x123)])
+
+        with self.assertRaises(ValueError):
+            router.remove_route(0x123, handler)
+
+    def test_change_default(self):
+        router = can.MessageRouter()
+        router(can.Message(arbitration_id=1))
+        router.default = self.handler("default")
+        router(can.Message(arbitration_id=1))
+        self.assertEqual(self.calls, [("default", 1)])
+
+    def test_cache_size(self):
+        router = can.MessageRouter(default=self.handler("default"))
+        for arbitration_id in range(router.CACHE_SIZE + 10):
+            router(can.Message(arbitration_id=arbitration_id))
+        self.assertEqual(len(self.calls), router.CACHE_SIZE + 10)
+        self.assertLessEqual(len(router._cache), router.CACHE_SIZE)
+
+    def test_listeners_are_stopped(self):
+        reader = can.BufferedReader()
+        router = can.MessageRouter()
+        router.add_route(0x1, reader)
+        router.add_route(0x2, reader)
+        router.on_messages_received([can.Message(arbitration_id=i) for i in range(3)])
+        router.stop()
+        self.assertTrue(reader.is_stopped)
+        self.assertEqual(reader.get_message(0).arbitration_id, 1)
+        self.assertEqual(reader.get_message(0).arbitration_id, 2)
+        self.assertIsNone(reader.get_message(0))
+
+    def test_on_error(self):
+        errors = []
+
+        class ErrorListener(can.Listener):
+            def on_message_received(self, msg):
+                pass
+
+            def on_error(self, exc):
+                errors.append(exc)
+
+        router = can.MessageRouter()
+        with self.assertRaises(NotImplementedError):
+            router.on_error(ValueError())
+        router.add_route(0x1, ErrorListener())
+        router.on_error(ValueError())
+        self.assertEqual(len(errors), 1)
+
+    def test_threaded_notifier(self):
+        reader = can.BufferedReader()
+        router = can.MessageRouter()
+        router.add_route(0x10, reader)
+        with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+            with can.Notifier(bus, [router], 0.1):
+                for arbitration_id in (0x10, 0x20, 0x10):
+                    bus.send(can.Message(arbitration_id=arbitration_id))
+                self.assertIsNotNone(reader.get_message(1))
+                self.assertIsNotNone(reader.get_message(1))
+        self.assertIsNone(reader.get_message(0))
+
+    def test_asyncio_notifier(self):
+        received = []
+
+        async def on_message(msg):
+            received.append(msg.arbitration_id)
+
+        async def run_it():
+            router = can.MessageRouter()
+            router.add_route(0x10, on_message)
+            with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+                notifier = can.Notifier(
+                    bus, [router], 0.1, loop=asyncio.get_running_loop()
+                )
+                bus.send(can.Message(arbitration_id=0x20))
+                bus.send(can.Message(arbitration_id=0x10))
+                for _ in range(50):
+                    if received:
+                        break
+                    await asyncio.sleep(0.01)
+                notifier.stop()
+
+        asyncio.run(run_it())
+        self.assertEqual(received, [0x10])
+
+    def test_coroutine_with_threaded_notifier(self):
+        received = []
+
+        async def on_message(msg):
+            received.append(msg.arbitration_id)
+
+        async def run_it():
+            router = can.MessageRouter(loop=asyncio.get_running_loop())
+            router.add_route(0x10, on_message)
+            with can.Bus("test", interface="virtual", receive_own_messages=True) as bus:
+                with can.Notifier(bus, [router], 0.1):
+                    bus.send(can.Message(arbitration_id=0x10))
+                    for _ in range(50):
+                        if received:
+                            break
+                        await asyncio.sleep(0.01)
+
+        asyncio.run(run_it())
+        self.assertEqual(received, [0x10])
+
+    def test_coroutine_without_loop(self):
+        async def on_message(msg):
+            pass
+
+        router = can.MessageRouter()
+        router.add_route(0x10, on_message)
+        with self.assertLogs("can.router", "WARNING"):
+            router.on_message_received(can.Message(arbitration_id=0x10))
+
+
+if __name__ == "__main__":
+    unittest.main()
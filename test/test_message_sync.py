@@ -8,10 +8,12 @@ import gc
 import time
 import unittest
 from copy import copy
+from unittest.mock import MagicMock
 
 import pytest
 
 from can import Message, MessageSync
+from can.broadcastmanager import PreciseSleeper
 
 from .config import IS_CI, IS_GITHUB_ACTIONS, IS_LINUX, IS_OSX, IS_TRAVIS
 from .data.example_data import TEST_MESSAGES_BASE
@@ -114,5 +116,17 @@ def test_gap(timestamp_1, timestamp_2):
     assert messages == collected
 
 
+def test_sleeper():
+    sleeper = MagicMock(spec=PreciseSleeper)
+    messages = [Message(arbitration_id=0x1), Message(arbitration_id=0x2)]
+    assert (
+        list(MessageSync(messages, timestamps=False, gap=0.1, sleeper=sleeper))
+        == messages
+    )
+    assert sleeper.sleep.call_count == 2
+    # only an explicitly passed sleeper busy-waits
+    assert MessageSync(messages).sleeper.spin_budget == 0
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+"""
+This module tests :mod:`can.modifiers`.
+"""
+
+import time
+import unittest
+
+import can
+from can.modifiers import (
+    CRC8_AUTOSAR,
+    CRC8_SAE_J1850,
+    Counter,
+    Crc8,
+    Ramp,
+    ValueSequence,
+    crc8,
+)
+
+
+def _values(modifier, count, size=8):
+    apply = modifier.compile()
+    values = []
+    for index in range(count):
+        data = bytearray(size)
+        apply(data, index)
+        values.append(bytes(data))
+    return values
+
+
+class ModifierTest(unittest.TestCase):
+    def test_crc8(self):
+        # the check values of the CRC catalogue
+        self.assertEqual(crc8(b"123456789", CRC8_SAE_J1850), 0x4B)
+        self.assertEqual(crc8(b"123456789", CRC8_AUTOSAR), 0xDF)
+
+    def test_crc8_modifier(self):
+        data = bytearray(b"\x00\x01\x02\x03")
+        Crc8(byte=0, data_id=b"\x10").compile()(data, 0)
+        self.assertEqual(data[0], crc8(b"\x10\x01\x02\x03"))
+
+        data = bytearray(b"\x01\x02\x03\x00")
+        Crc8(byte=3, profile=CRC8_AUTOSAR).compile()(data, 0)
+        self.assertEqual(data[3], crc8(b"\x01\x02\x03", CRC8_AUTOSAR))
+
+    def test_counter(self):
+        counter = Counter(start_bit=4, length=4, start=14)
+        self.assertEqual(counter.cycle_length, 16)
+        self.assertEqual(
+            [data[0] for data in _values(counter, 4, size=1)], [0xE0, 0xF0, 0x00, 0x10]
+        )
+
+        self.assertEqual(Counter(start_bit=0, length=4, step=4).cycle_length, 4)
+        self.assertEqual(Counter(start_bit=0, length=4, modulus=15).cycle_length, 15)
+        with self.assertRaises(ValueError):
+            Counter(start_bit=0, length=4, modulus=17)
+        with self.assertRaises(ValueError):
+            Counter(start_bit=0, length=4, start=16)
+
+    def test_field_across_bytes(self):
+        values = _values(Counter(start_bit=4, length=8, start=0xAB), 1, size=2)
+        self.assertEqual(values, [b"\xb0\x0a"])
+
+        # the other bits are kept
+        data = bytearray(b"\xff\xff")
+        ValueSequence(start_bit=4, length=8, values=[0]).compile()(data, 0)
+        self.assertEqual(data, b"\x0f\xf0")
+
+    def test_ramp(self):
+        ramp = Ramp(start_bit=0, length=16, start=1000, stop=0, step=-300)
+        self.assertEqual(ramp.cycle_length, 4)
+        self.assertEqual(
+            [int.from_bytes(data, "little") for data in _values(ramp, 5, size=2)],
+            [1000, 700, 400, 100, 1000],
+        )
+        with self.assertRaises(ValueError):
+            Ramp(start_bit=0, length=8, start=0, stop=10, step=-1)
+        with self.assertRaises(ValueError):
+            Ramp(start_bit=0, length=8, start=0, stop=256)
+
+    def test_value_sequence(self):
+        sequence = ValueSequence(start_bit=8, length=8, values=[1, 2, 3])
+        self.assertEqual(sequence.cycle_length, 3)
+        self.assertEqual([data[1] for data in _values(sequence, 4)], [1, 2, 3, 1])
+        with self.assertRaises(ValueError):
+            ValueSequence(start_bit=0, length=8, values=[])
+
+
+class CyclicModifiersTest(unittest.TestCase):
+    def setUp(self):
+        self.modifiers = can.CyclicModifiers(
+            Counter(start_bit=8, length=4), ValueSequence(16, 8, [1, 2, 3]), Crc8(0)
+        )
+
+    def test_call(self):
+        msg = can.Message(arbitration_id=0x123, data=[0] * 8)
+        for index in range(20):
+            self.modifiers(msg)
+            self.assertEqual(msg.data[1], index % 16)
+            self.assertEqual(msg.data[2], index % 3 + 1)
+            self.assertEqual(msg.data[0], crc8(msg.data[1:]))
+        self.assertEqual(self.modifiers.index, 20)
+
+    def test_render(self):
+        self.assertEqual(self.modifiers.cycle_length, 48)
+        msg = can.Message(arbitration_id=0x123, data=[0] * 8)
+        rendered = self.modifiers.render(msg)
+        self.assertEqual(len(rendered), 48)
+        self.assertEqual(bytes(msg.data), bytes(8))
+
+        # equal to the messages modified before each transmission
+        for expected in rendered * 2:
+            self.modifiers(msg)
+            self.assertEqual(bytes(msg.data), bytes(expected.data))
+
+        # two alternating messages
+        other = can.Message(arbitration_id=0x123, data=[0xFF] * 8)
+        rendered = self.modifiers.render([msg, other])
+        self.assertEqual(len(rendered), 48)
+        self.assertEqual(rendered[1].data[7], 0xFF)
+        self.assertEqual(len(self.modifiers.render(msg, 5)), 5)
+
+    def test_send_periodic(self):
+        with can.ThreadSafeBus(interface="virtual", receive_own_messages=True) as bus:
+            msg = can.Message(arbitration_id=0x123, data=[0] * 8)
+            task = bus.send_periodic(msg, 0.005, modifier_callback=self.modifiers)
+            time.sleep(0.05)
+            task.stop()
+
+            received = bus.recv(1)
+            self.assertEqual(received.data[1], 0)
+            self.assertEqual(received.data[0], crc8(received.data[1:]))
+            self.assertEqual(bus.recv(1).data[1], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -180,6 +180,25 @@ class TestBaseRotatingLogger:
             do_rollover.assert_called()
             writers_on_message_received.assert_called_with(msg)
 
+    def test_on_messages_received(self, tmp_path):
+        with self._get_instance(tmp_path / "file.ASC") as logger_instance:
+            should_rollover = Mock(return_value=True)
+            do_rollover = Mock()
+            writers_on_messages_received = Mock()
+
+            logger_instance.should_rollover = should_rollover
+            logger_instance.do_rollover = do_rollover
+            logger_instance.writer.on_messages_received = writers_on_messages_received
+
+            msgs = [generate_message(0x123), generate_message(0x456)]
+            logger_instance.on_messages_received(msgs)
+
+            # the rollover is only checked once per batch
+            should_rollover.assert_called_once_with(msgs[0])
+            do_rollover.assert_called_once()
+            writers_on_messages_received.assert_called_once_with(msgs)
+            assert logger_instance.rollover_count == 1
+
     def test_issue_1792(self, tmp_path):
         with self._get_instance(tmp_path / "__unused.log") as logger_instance:
             writer = logger_instance._get_new_writer(
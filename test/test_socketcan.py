@@ -4,11 +4,12 @@
 Test functions in `can.interfaces.socketcan.socketcan`.
 """
 import ctypes
+import errno
 import struct
 import sys
 import unittest
 import warnings
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import can
 from can.interfaces.socketcan.constants import (
@@ -20,6 +21,8 @@ from can.interfaces.socketcan.constants import (
 )
 from can.interfaces.socketcan.socketcan import (
     BcmMsgHead,
+    CyclicSendTask,
+    SocketcanBus,
     bcm_header_factory,
     build_bcm_header,
     build_bcm_transmit_header,
@@ -371,6 +374,71 @@ class SocketCANTest(unittest.TestCase):
         bus = can.Bus(interface="socketcan", channel="vcan0", fd=True)
         self.assertEqual(bus.protocol, can.CanProtocol.CAN_FD)
 
+    @unittest.skipUnless(IS_LINUX, "socket.MSG_DONTWAIT is only available on Linux")
+    def test_send_batch_partial(self):
+        bus = SocketcanBus.__new__(SocketcanBus)
+        bus.channel = "vcan0"
+        bus.socket = MagicMock()
+        bus.socket.send.side_effect = [
+            16,
+            16,
+            OSError(errno.ENOBUFS, "No buffer space available"),
+        ]
+        msgs = [can.Message(arbitration_id=i) for i in range(4)]
+        with patch("select.select", return_value=([], [], [])):
+            self.assertEqual(bus.send_batch(msgs, timeout=0.01), 2)
+        self.assertEqual(bus.socket.send.call_count, 3)
+
+    @unittest.skipUnless(IS_LINUX, "socket.MSG_DONTWAIT is only available on Linux")
+    def test_send_batch_first_message_fails(self):
+        bus = SocketcanBus.__new__(SocketcanBus)
+        bus.channel = "vcan0"
+        bus.socket = MagicMock()
+        bus.socket.send.side_effect = OSError(errno.ENETDOWN, "Network is down")
+        with self.assertRaises(can.CanOperationError):
+            bus.send_batch([can.Message(), can.Message()])
+
+    def test_send_periodic_modifiers(self):
+        bus = SocketcanBus.__new__(SocketcanBus)
+        bus.channel = "vcan0"
+        bus._get_bcm_socket = MagicMock()
+        bus._get_next_task_id = MagicMock(return_value=1)
+        msg = can.Message(arbitration_id=0x123, data=[0] * 8)
+        modifiers = can.CyclicModifiers(
+            can.modifiers.Counter(start_bit=8, length=4), can.modifiers.Crc8(byte=0)
+        )
+
+        # like any other callback, the modifiers are applied by a thread
+        with self.assertWarns(UserWarning):
+            task = bus._send_periodic_internal(
+                msg, 0.01, autostart=False, modifier_callback=modifiers
+            )
+        self.assertIsInstance(task, can.broadcastmanager.ThreadBasedCyclicSendTask)
+
+        # the rendered messages are sent by the kernel
+        task = bus._send_periodic_internal(modifiers.render(msg), 0.01, autostart=False)
+        self.assertIsInstance(task, CyclicSendTask)
+        self.assertEqual(len(task.messages), 16)
+        self.assertEqual(task.messages[3].data[1], 3)
+
+    def test_cyclic_send_task_multiple_frames(self):
+        msgs = can.CyclicModifiers(can.modifiers.Counter(start_bit=0)).render(
+            can.Message(arbitration_id=0x123, data=[0] * 8)
+        )
+        with (
+            patch("can.interfaces.socketcan.socketcan.send_bcm") as send_bcm,
+            patch.object(CyclicSendTask, "_check_bcm_task"),
+        ):
+            CyclicSendTask(MagicMock(), 1, msgs, 0.01)
+        data = send_bcm.call_args[0][1]
+        header = BcmMsgHead.from_buffer_copy(data[: ctypes.sizeof(BcmMsgHead)])
+        self.assertEqual(header.opcode, CAN_BCM_TX_SETUP)
+        self.assertEqual(header.nframes, 16)
+        self.assertEqual(len(data), ctypes.sizeof(BcmMsgHead) + 16 * 16)
+
+        with self.assertRaises(ValueError):
+            CyclicSendTask(MagicMock(), 1, msgs * 17, 0.01, autostart=False)
+
     @unittest.skipUnless(IS_LINUX and IS_PYPY, "Only test when run on Linux with PyPy")
     def test_pypy_socketcan_support(self):
         """Wait for PyPy raw CAN socket support